@@ -7,6 +7,7 @@ Note: We use rpyc.classic directly instead of hrpyc because:
 """
 
 import logging
+import os
 import random
 import time
 import threading
@@ -22,20 +23,39 @@ logger = logging.getLogger("houdini_mcp.connection")
 # Type variable for generic retry decorator
 F = TypeVar("F", bound=Callable[..., Any])
 
-# Global connection state
+# Global connection state. _connection/_hou are the active connection that
+# tools use; _pool keeps every live connection keyed by (host, port) so
+# switching targets, or reconnecting to one already open, skips the handshake.
 _connection: Optional[Any] = None
 _hou: Optional[Any] = None
+_active_key: Optional[Tuple[str, int]] = None
+_pool: Dict[Tuple[str, int], Tuple[Any, Any]] = {}
+_pool_lock = threading.Lock()
+
+# Houdini version of the active hou proxy, read once: (hou, version, build)
+_version_info: Optional[Tuple[Any, str, Dict[str, int]]] = None
+
+# Background liveness monitor for pooled connections
+_monitor_thread: Optional[threading.Thread] = None
+_monitor_stop = threading.Event()
 
 # Thread pool for controlled execution with timeouts
 _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
+# Per-thread record of the last successful is_connected(validate=True) RPC
+_validation_state = threading.local()
+
 # Connection configuration
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 DEFAULT_MAX_DELAY = 30.0  # maximum delay cap
+DEFAULT_CONNECT_MAX_DELAY = 5.0  # connect() retries a local server; keep waits short
 DEFAULT_TIMEOUT = 10.0  # seconds
 DEFAULT_SYNC_TIMEOUT = 30.0  # timeout for individual RPC calls (seconds) - reduced from 60
 DEFAULT_OPERATION_TIMEOUT = 45.0  # max time for any single tool operation
+VALIDATION_CACHE_TTL_NS = 100_000_000  # reuse a validate=True result for 100ms
+# Seconds between background pings of pooled connections; 0 disables the monitor
+PING_INTERVAL = float(os.getenv("HOUDINI_MCP_PING_INTERVAL", "30"))
 
 # Retryable exceptions for connection and RPC operations
 RETRYABLE_EXCEPTIONS = (
@@ -61,6 +81,37 @@ class HoudiniOperationError(Exception):
     pass
 
 
+def _compute_backoff_delay(
+    attempt: int,
+    base: float,
+    jitter: bool,
+    rng: Optional[random.Random] = None,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    exponential_base: float = 2.0,
+) -> float:
+    """
+    Compute the delay before retrying after a failed attempt.
+
+    The delay grows as base * exponential_base**attempt, is capped at max_delay,
+    and with jitter enabled gets up to 10% extra random delay on top.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base: Delay after the first failure in seconds
+        jitter: If True, add random jitter to prevent thundering herd
+        rng: Random source for jitter (default: the global random module)
+        max_delay: Maximum delay cap in seconds before jitter
+        exponential_base: Growth factor between attempts
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(base * exponential_base**attempt, max_delay)
+    if jitter:
+        delay += (rng or random).uniform(0, delay * 0.1)
+    return delay
+
+
 def retry_with_backoff(
     max_retries: int = DEFAULT_MAX_RETRIES,
     base_delay: float = DEFAULT_RETRY_DELAY,
@@ -96,7 +147,6 @@ def retry_with_backoff(
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception: Optional[Exception] = None
-            current_delay = base_delay
 
             for attempt in range(max_retries):
                 try:
@@ -105,20 +155,19 @@ def retry_with_backoff(
                     last_exception = e
 
                     if attempt < max_retries - 1:
-                        # Calculate delay with exponential backoff
-                        delay = min(current_delay, max_delay)
-
-                        # Add jitter to prevent thundering herd
-                        if jitter:
-                            # Add up to 10% random jitter
-                            delay += random.uniform(0, delay * 0.1)
+                        delay = _compute_backoff_delay(
+                            attempt,
+                            base_delay,
+                            jitter,
+                            max_delay=max_delay,
+                            exponential_base=exponential_base,
+                        )
 
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
                             f"Retrying in {delay:.2f}s..."
                         )
                         time.sleep(delay)
-                        current_delay *= exponential_base
                     else:
                         logger.error(f"All {max_retries} attempts failed. Last error: {e}")
 
@@ -166,9 +215,141 @@ def _do_connect(
     if obj_node is None:
         logger.warning("Connected but /obj node not accessible - unusual state")
 
+    _activate(host, port, _connection, _hou)
+    _start_health_monitor()
     return _connection, _hou
 
 
+def _activate(host: str, port: int, conn: Any, hou: Any) -> None:
+    """Store a connection in the pool and make it the active one."""
+    global _connection, _hou, _active_key
+
+    with _pool_lock:
+        _pool[(host, port)] = (conn, hou)
+        _connection, _hou, _active_key = conn, hou, (host, port)
+
+
+def _discard_pooled(key: Tuple[str, int]) -> Optional[Any]:
+    """Remove a pool entry, returning its connection (not closed here)."""
+    with _pool_lock:
+        entry = _pool.pop(key, None)
+    return entry[0] if entry is not None else None
+
+
+def _drop_active() -> None:
+    """Forget the active connection and its pool entry after it was found dead."""
+    global _connection, _hou, _active_key
+
+    if _active_key is not None:
+        _discard_pooled(_active_key)
+    _connection = None
+    _hou = None
+    _active_key = None
+
+
+def _evict(key: Tuple[str, int], conn: Any) -> None:
+    """Drop a dead pooled connection unless it has already been replaced."""
+    global _connection, _hou, _active_key
+
+    with _pool_lock:
+        entry = _pool.get(key)
+        if entry is not None and entry[0] is conn:
+            del _pool[key]
+        if _connection is conn:
+            _connection, _hou, _active_key = None, None, None
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _check_pool_health() -> None:
+    """
+    Ping every pooled connection once and evict the ones that are dead.
+
+    A ping that times out means Houdini is busy (e.g. cooking), not gone, so
+    the connection is kept; only connection-level failures evict it.
+    """
+    with _pool_lock:
+        entries = list(_pool.items())
+
+    for key, (conn, hou) in entries:
+        try:
+            if getattr(conn, "closed", False) is True:
+                raise EOFError("connection closed")
+            hou.applicationVersion()
+        except TimeoutError:
+            logger.debug(f"Health ping to {key[0]}:{key[1]} timed out; Houdini busy")
+        except Exception as e:
+            logger.info(f"Pooled connection to {key[0]}:{key[1]} is dead, evicting: {e}")
+            _evict(key, conn)
+
+
+def _health_monitor_loop(interval: float) -> None:
+    while not _monitor_stop.wait(interval):
+        try:
+            _check_pool_health()
+        except Exception as e:
+            logger.debug(f"Health monitor iteration failed: {e}")
+
+
+def _start_health_monitor() -> None:
+    """Start the background ping thread once, unless PING_INTERVAL is 0."""
+    global _monitor_thread
+
+    if PING_INTERVAL <= 0:
+        return
+    with _pool_lock:
+        if _monitor_thread is not None and _monitor_thread.is_alive():
+            return
+        _monitor_stop.clear()
+        _monitor_thread = threading.Thread(
+            target=_health_monitor_loop,
+            args=(PING_INTERVAL,),
+            name="houdini-mcp-health",
+            daemon=True,
+        )
+        _monitor_thread.start()
+
+
+def _stop_health_monitor() -> None:
+    """Stop the background ping thread if it is running."""
+    global _monitor_thread
+
+    _monitor_stop.set()
+    thread = _monitor_thread
+    _monitor_thread = None
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout=1.0)
+
+
+def _reuse_pooled(host: str, port: int) -> Optional[Tuple[Any, Any]]:
+    """
+    Return a pooled connection for (host, port) if it is still alive.
+
+    A pooled entry is checked with one applicationVersion() call, which is
+    far cheaper than a new socket + rpyc handshake. Dead entries are dropped.
+    """
+    key = (host, port)
+    with _pool_lock:
+        entry = _pool.get(key)
+    if entry is None:
+        return None
+
+    conn, hou = entry
+    try:
+        if getattr(conn, "closed", False) is True:
+            raise EOFError("pooled connection is closed")
+        hou.applicationVersion()
+    except Exception as e:
+        logger.debug(f"Dropping dead pooled connection to {host}:{port}: {e}")
+        _discard_pooled(key)
+        return None
+
+    _activate(host, port, conn, hou)
+    return conn, hou
+
+
 def connect(
     host: str = "localhost",
     port: int = 18811,
@@ -176,12 +357,15 @@ def connect(
     retry_delay: float = DEFAULT_RETRY_DELAY,
     sync_timeout: float = DEFAULT_SYNC_TIMEOUT,
     jitter: bool = True,
+    max_delay: float = DEFAULT_CONNECT_MAX_DELAY,
+    max_total_wait: Optional[float] = None,
 ) -> Tuple[Any, Any]:
     """
     Connect to Houdini RPC server using rpyc with retry logic.
 
     Uses exponential backoff with optional jitter to prevent thundering herd
-    problems when multiple clients reconnect simultaneously.
+    problems when multiple clients reconnect simultaneously. A live pooled
+    connection to the same host and port is reused instead of reconnecting.
 
     Args:
         host: Houdini server hostname (default: localhost)
@@ -190,6 +374,9 @@ def connect(
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         sync_timeout: Timeout for synchronous RPC calls in seconds (default: 30)
         jitter: If True, add random jitter to delays (default: True)
+        max_delay: Cap on a single retry delay in seconds (default: 5.0)
+        max_total_wait: Overall retry budget in seconds; retrying stops early
+                        rather than sleeping past it (default: no budget)
 
     Returns:
         Tuple of (connection, hou module)
@@ -197,10 +384,16 @@ def connect(
     Raises:
         HoudiniConnectionError: If connection fails after all retries
     """
+    pooled = _reuse_pooled(host, port)
+    if pooled is not None:
+        return pooled
+
     last_error: Optional[Exception] = None
-    current_delay = retry_delay
+    deadline = time.monotonic() + max_total_wait if max_total_wait is not None else None
+    attempts_made = 0
 
     for attempt in range(max_retries):
+        attempts_made = attempt + 1
         try:
             return _do_connect(host, port, sync_timeout)
 
@@ -209,16 +402,12 @@ def connect(
             logger.warning(f"Connection attempt {attempt + 1}/{max_retries} failed: {e}")
 
             if attempt < max_retries - 1:
-                # Calculate delay with cap
-                delay = min(current_delay, DEFAULT_MAX_DELAY)
-
-                # Add jitter to prevent thundering herd
-                if jitter:
-                    delay += random.uniform(0, delay * 0.1)
-
+                delay = _compute_backoff_delay(attempt, retry_delay, jitter, max_delay=max_delay)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    logger.warning(f"Retry budget of {max_total_wait}s exhausted, giving up")
+                    break
                 logger.info(f"Retrying in {delay:.2f} seconds...")
                 time.sleep(delay)
-                current_delay *= 2  # Exponential backoff
 
         except Exception as e:
             # Non-retryable exception - fail immediately
@@ -227,7 +416,7 @@ def connect(
             ) from e
 
     raise HoudiniConnectionError(
-        f"Failed to connect to Houdini at {host}:{port} after {max_retries} attempts. "
+        f"Failed to connect to Houdini at {host}:{port} after {attempts_made} attempts. "
         f"Make sure Houdini is running with RPC server enabled "
         f"(run 'import hrpyc; hrpyc.start_server()' in Houdini's Python shell). "
         f"Last error: {last_error}"
@@ -261,22 +450,53 @@ def get_connection() -> Optional[Any]:
     return _connection
 
 
-def disconnect() -> None:
-    """Disconnect from Houdini gracefully."""
-    global _connection, _hou
+def disconnect(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """
+    Disconnect from Houdini gracefully.
+
+    Args:
+        host: Close only the pooled connection to this host (with port).
+        port: Close only the pooled connection on this port (with host).
+              When both are None, every pooled connection is closed and the
+              background health monitor is stopped.
 
-    if _connection is not None:
+    Raises:
+        ValueError: If only one of host and port is given
+    """
+    global _connection, _hou, _active_key
+
+    if (host is None) != (port is None):
+        raise ValueError("disconnect() needs both host and port, or neither")
+
+    if host is not None and port is not None:
+        key = (host, port)
+        to_close = [_discard_pooled(key)]
+        closing_active = _active_key == key
+    else:
+        _stop_health_monitor()
+        with _pool_lock:
+            to_close = [conn for conn, _ in _pool.values()]
+            _pool.clear()
+        closing_active = True
+
+    if closing_active:
+        if _connection is not None and all(_connection is not c for c in to_close):
+            to_close.append(_connection)
+        _connection = None
+        _hou = None
+        _active_key = None
+
+    for conn in to_close:
+        if conn is None:
+            continue
         try:
-            _connection.close()
+            conn.close()
             logger.info("Disconnected from Houdini")
         except Exception as e:
             logger.warning(f"Error disconnecting: {e}")
-        finally:
-            _connection = None
-            _hou = None
 
 
-def is_connected(validate: bool = False) -> bool:
+def is_connected(validate: bool = False, force: bool = False) -> bool:
     """
     Check if connected to Houdini.
 
@@ -284,15 +504,18 @@ def is_connected(validate: bool = False) -> bool:
     This is fast (no RPC call). Set validate=True to perform an RPC call
     to verify Houdini is actually responsive (slower but more thorough).
 
+    A successful validation is remembered per thread for
+    VALIDATION_CACHE_TTL_NS, so hot loops calling is_connected(validate=True)
+    make at most one RPC per interval.
+
     Args:
         validate: If True, perform RPC call to verify connection is alive.
                   If False (default), only check socket state for speed.
+        force: If True, skip the cached validation result and always do the RPC.
 
     Returns:
         True if connected, False otherwise.
     """
-    global _connection, _hou
-
     if _connection is None or _hou is None:
         return False
 
@@ -304,20 +527,29 @@ def is_connected(validate: bool = False) -> bool:
             # Handle both bool and MagicMock cases
             if closed_val is True:
                 logger.debug("Connection socket is closed")
-                _connection = None
-                _hou = None
+                _drop_active()
                 return False
 
-        # If validation requested, do an RPC call
+        # If validation requested, do an RPC call unless this thread
+        # validated the same connection very recently
         if validate:
-            _hou.applicationVersion()
+            now = time.monotonic_ns()
+            recent = (
+                not force
+                and getattr(_validation_state, "hou", None) is _hou
+                and now - getattr(_validation_state, "last_check_ns", 0) < VALIDATION_CACHE_TTL_NS
+            )
+            if not recent:
+                _hou.applicationVersion()
+                _validation_state.hou = _hou
+                _validation_state.last_check_ns = now
 
         return True
     except Exception as e:
         logger.debug(f"Connection check failed: {e}")
+        _validation_state.hou = None
         # Connection is dead, clean up
-        _connection = None
-        _hou = None
+        _drop_active()
         return False
 
 
@@ -334,12 +566,36 @@ def ensure_connected(host: str = "localhost", port: int = 18811) -> Any:
     Raises:
         HoudiniConnectionError: If unable to establish connection
     """
-    if not is_connected():
+    if is_connected() and _active_key in (None, (host, port)):
+        return _hou
+    if _active_key not in (None, (host, port)):
+        logger.info(f"Switching active Houdini connection to {host}:{port}")
+    else:
         logger.info("Connection lost or not established, reconnecting...")
-        connect(host, port)
+    connect(host, port)
     return _hou
 
 
+def _houdini_version(hou: Any) -> Tuple[str, Dict[str, int]]:
+    """
+    Return the version string and build dict for a hou proxy, memoized.
+
+    A running Houdini never changes version, so the two RPCs are made once
+    per connection rather than on every get_connection_info call.
+    """
+    global _version_info
+
+    if _version_info is None or _version_info[0] is not hou:
+        version_tuple = hou.applicationVersion()
+        build = {
+            "major": version_tuple[0],
+            "minor": version_tuple[1],
+            "build": version_tuple[2],
+        }
+        _version_info = (hou, hou.applicationVersionString(), build)
+    return _version_info[1], dict(_version_info[2])
+
+
 def get_connection_info(host: str = "localhost", port: int = 18811) -> Dict[str, Any]:
     """
     Get detailed information about the current connection state.
@@ -359,13 +615,7 @@ def get_connection_info(host: str = "localhost", port: int = 18811) -> Dict[str,
     if is_connected():
         try:
             info["connected"] = True
-            info["houdini_version"] = _hou.applicationVersionString()
-            version_tuple = _hou.applicationVersion()
-            info["houdini_build"] = {
-                "major": version_tuple[0],
-                "minor": version_tuple[1],
-                "build": version_tuple[2],
-            }
+            info["houdini_version"], info["houdini_build"] = _houdini_version(_hou)
             info["hip_file"] = _hou.hipFile.path() or "untitled.hip"
         except Exception as e:
             logger.warning(f"Error getting connection info: {e}")
@@ -540,15 +790,13 @@ def safe_execute(
 
 def _safe_disconnect() -> None:
     """Safely disconnect without raising exceptions."""
-    global _connection, _hou
     try:
         if _connection is not None:
             _connection.close()
     except Exception as e:
         logger.debug(f"Error during safe disconnect: {e}")
     finally:
-        _connection = None
-        _hou = None
+        _drop_active()
 
 
 def execute_with_timeout(
@@ -586,6 +834,30 @@ def execute_with_timeout(
         raise HoudiniOperationTimeout(f"Operation timed out after {timeout} seconds")
 
 
+def call_async(func: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+    """
+    Submit a Houdini operation to the RPC thread pool without waiting for it.
+
+    Independent operations (e.g. creating two unrelated nodes) can be put in
+    flight together so their round trips overlap instead of running back to
+    back. The shared rpyc connection is thread-safe for concurrent requests.
+
+    Args:
+        func: Function to execute (typically a tool such as create_node)
+        *args: Arguments to pass
+        **kwargs: Keyword arguments to pass
+
+    Returns:
+        A Future; call .result() to wait for the value or re-raise the error
+
+    Example:
+        grid_future = call_async(create_node, "grid", geo_path, "grid1")
+        noise_future = call_async(create_node, "attribnoise", geo_path, "noise1")
+        grid, noise = grid_future.result(), noise_future.result()
+    """
+    return _get_executor().submit(func, *args, **kwargs)
+
+
 def quick_health_check(host: str = "localhost", port: int = 18811, timeout: float = 5.0) -> bool:
     """
     Quick health check with strict timeout - use before heavy operations.
@@ -76,11 +76,12 @@ def execute_code(
     max_diff_nodes: int = 1000,
     timeout: int = 30,
     allow_dangerous: bool = False,
+    include_traceback: bool = True,
 ) -> Dict[str, Any]:
     """
     Execute Python code in Houdini with scene change tracking and safety rails.
 
-    The 'hou' module is available in the execution context.
+    The 'hou', 'math' and 'sys' modules are available in the execution context.
     Use this for complex operations that aren't covered by other tools.
 
     SAFETY FEATURES:
@@ -97,6 +98,7 @@ def execute_code(
         max_diff_nodes: Maximum nodes in scene diff added_nodes list (default: 1000)
         timeout: Execution timeout in seconds (default: 30)
         allow_dangerous: If True, allows code with dangerous patterns to execute (default: False)
+        include_traceback: If False, errors include error_type instead of a full traceback (default: True)
 
     Dangerous patterns detected:
         - hou.exit() - closes Houdini
@@ -130,6 +132,56 @@ def execute_code(
         max_diff_nodes=max_diff_nodes,
         timeout=timeout,
         allow_dangerous=allow_dangerous,
+        include_traceback=include_traceback,
+        host=HOUDINI_HOST,
+        port=HOUDINI_PORT,
+    )
+
+
+@mcp.tool()
+def execute_code_batch(
+    codes: List[str],
+    stop_on_error: bool = False,
+    max_stdout_size: int = 100000,
+    max_stderr_size: int = 100000,
+    timeout: int = 30,
+    allow_dangerous: bool = False,
+    include_traceback: bool = True,
+) -> Dict[str, Any]:
+    """
+    Execute several Python snippets in order in a single call.
+
+    Each snippet gets its own stdout/stderr capture and timeout, with the same
+    safety rails as execute_code. All snippets are scanned before any runs, so
+    one dangerous snippet blocks the whole batch unless allow_dangerous=True.
+
+    Args:
+        codes: List of Python snippets to execute in order
+        stop_on_error: If True, skip remaining snippets after the first error (default: False)
+        max_stdout_size: Maximum stdout size per snippet in bytes (default: 100000)
+        max_stderr_size: Maximum stderr size per snippet in bytes (default: 100000)
+        timeout: Execution timeout per snippet in seconds (default: 30)
+        allow_dangerous: If True, allows snippets with dangerous patterns (default: False)
+        include_traceback: If False, errors include error_type instead of a full traceback (default: True)
+
+    Example:
+        execute_code_batch([
+            "geo = hou.node('/obj').createNode('geo', 'batch_geo')",
+            "print(hou.node('/obj/batch_geo').path())",
+        ], stop_on_error=True)
+
+    Returns:
+        Dict with status ("success", "partial" or "error"), count, and results:
+        one execute_code-style result per snippet, each with its index.
+    """
+    return tools.execute_code_batch(
+        codes=codes,
+        stop_on_error=stop_on_error,
+        max_stdout_size=max_stdout_size,
+        max_stderr_size=max_stderr_size,
+        timeout=timeout,
+        allow_dangerous=allow_dangerous,
+        include_traceback=include_traceback,
         host=HOUDINI_HOST,
         port=HOUDINI_PORT,
     )
@@ -161,6 +213,35 @@ def set_parameter(
     return tools.set_parameter(node_path, param_name, value, HOUDINI_HOST, HOUDINI_PORT)
 
 
+@mcp.tool()
+def set_parameters_bulk(
+    node_path: str,
+    parms: Dict[str, Union[float, int, str, bool, List[float], List[int], List[str]]],
+) -> Dict[str, Any]:
+    """
+    Set several parameter values on one node in a single call.
+
+    Prefer this over repeated set_parameter calls when configuring a node.
+
+    Args:
+        node_path: Full path to the node (e.g., "/obj/geo1/sphere1")
+        parms: Mapping of parameter name to value. Values follow the same rules
+               as set_parameter (lists for vector parameters).
+
+    Returns:
+        Dict with:
+        - status: "success", "partial", or "error"
+        - node_path: Path to the node
+        - updated: List of parameters that were set
+        - failed: List of parameters that could not be set, with reasons
+
+    Examples:
+        - set_parameters_bulk("/obj/geo1/sphere1", {"rad": [2.0, 2.0, 2.0], "type": 1})
+        - set_parameters_bulk("/obj/geo1/xform1", {"t": [0.0, 3.0, 0.0], "scale": 2.0})
+    """
+    return tools.set_parameters_bulk(node_path, parms, HOUDINI_HOST, HOUDINI_PORT)
+
+
 @mcp.tool()
 def get_node_info(
     node_path: str,
@@ -169,6 +250,7 @@ def get_node_info(
     include_errors: bool = False,
     force_cook: bool = False,
     compact: bool = False,
+    include_geo_stats: bool = False,
 ) -> Dict[str, Any]:
     """
     Get detailed information about a node.
@@ -181,6 +263,8 @@ def get_node_info(
         include_errors: When True, include cook state and error/warning information (default: False)
         force_cook: When True, force cook the node before checking errors (default: False)
         compact: When True, return minimal info (path, type, counts only) for reduced payload (default: False)
+        include_geo_stats: When True, add point_count, primitive_count and bounding_box to
+                           cook_info; requires include_errors=True (default: False)
 
     Returns:
         Node information including type, children, connections, flags, and parameters.
@@ -198,6 +282,9 @@ def get_node_info(
 
         # Get minimal info for reduced payload
         get_node_info("/obj/geo1/sphere1", compact=True)
+
+        # Cook and read point count in one call
+        get_node_info("/obj/geo1/sphere1", include_errors=True, force_cook=True, include_geo_stats=True)
     """
     return tools.get_node_info(
         node_path=node_path,
@@ -207,6 +294,45 @@ def get_node_info(
         include_errors=include_errors,
         force_cook=force_cook,
         compact=compact,
+        include_geo_stats=include_geo_stats,
+        host=HOUDINI_HOST,
+        port=HOUDINI_PORT,
+    )
+
+
+@mcp.tool()
+def get_node_snapshot(
+    node_path: str,
+    include_params: bool = False,
+    include_geo: bool = True,
+    max_sample_points: int = 0,
+) -> Dict[str, Any]:
+    """
+    Get node info, cook state and geometry stats in a single call.
+
+    Use this for verification after building or editing a network instead of
+    calling get_node_info and get_geo_summary back to back. The node is cooked
+    once and all sections come from that cook.
+
+    Args:
+        node_path: Full path to the node
+        include_params: Whether to include parameter values (default: False)
+        include_geo: Whether to include point/primitive/vertex counts and bounding box (default: True)
+        max_sample_points: Number of leading point positions to include (default: 0)
+
+    Returns:
+        Node path/name/type, input_connections, cook_info (cook_state, errors, warnings),
+        optional parameters, and geometry (None if the node has no geometry).
+
+    Example:
+        get_node_snapshot("/obj/geo1/OUT")
+        get_node_snapshot("/obj/geo1/sphere1", include_params=True)
+    """
+    return tools.get_node_snapshot(
+        node_path,
+        include_params=include_params,
+        include_geo=include_geo,
+        max_sample_points=max_sample_points,
         host=HOUDINI_HOST,
         port=HOUDINI_PORT,
     )
@@ -345,6 +471,7 @@ def list_children(
     max_depth: int = 10,
     max_nodes: int = 1000,
     compact: bool = False,
+    names: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     List child nodes with paths, types, and current input connections.
@@ -360,6 +487,7 @@ def list_children(
         max_depth: Maximum recursion depth to prevent infinite loops (default: 10)
         max_nodes: Maximum number of nodes to return as safety limit (default: 1000)
         compact: When True, return only path/name/type without connection details (default: False)
+        names: Only return children with these names (default: all children)
 
     Returns:
         Dict with children array containing node info including:
@@ -368,13 +496,15 @@ def list_children(
         - type: Node type
         - inputs: Array of input connections with source_node and output_index (omitted if compact=True)
         - outputs: Array of output node paths (omitted if compact=True)
+        Plus by_name, mapping each child name to its index in children.
 
     Example:
         list_children("/obj/geo1", recursive=True, max_depth=3)
         list_children("/obj/geo1", compact=True)  # Minimal payload
+        list_children("/obj/geo1", names=["noise1"])  # Look up specific children
     """
     return tools.list_children(
-        node_path, recursive, max_depth, max_nodes, compact, HOUDINI_HOST, HOUDINI_PORT
+        node_path, recursive, max_depth, max_nodes, compact, names, HOUDINI_HOST, HOUDINI_PORT
     )
 
 
@@ -16,7 +16,7 @@ from .errors import find_error_nodes
 from .layout import layout_children, set_node_color, set_node_position, create_network_box
 from .materials import create_material, assign_material, get_material_info
 from .geometry import get_geo_summary
-from .parameters import set_parameter, get_parameter_schema
+from .parameters import set_parameter, set_parameters_bulk, get_parameter_schema
 from .rendering import (
     render_viewport,
     render_quad_view,
@@ -26,7 +26,7 @@ from .rendering import (
     create_render_node,
 )
 from .wiring import connect_nodes, disconnect_node_input, reorder_inputs, set_node_flags
-from .code import execute_code, get_last_scene_diff
+from .code import execute_code, execute_code_batch, get_last_scene_diff
 from .scene import get_scene_info, save_scene, load_scene, new_scene, serialize_scene
 from .hscript import HscriptBatch, get_batch, fast_list_paths, fast_get_scene_tree
 from .cache import node_type_cache, invalidate_all_caches, get_cache_stats
@@ -42,6 +42,7 @@ from .summarization import (
 from .nodes import (
     create_node,
     get_node_info,
+    get_node_snapshot,
     delete_node,
     list_node_types,
     list_children,
@@ -61,7 +62,9 @@ from ._common import (
     _add_response_metadata,
     _estimate_response_size,
     _detect_dangerous_code,
+    _detect_dangerous_code_batch,
     _truncate_output,
+    _CappedWriter,
     _node_to_dict,
     _get_scene_diff,
     _serialize_scene_state,
@@ -84,6 +87,7 @@ __all__ = [
     "create_node",
     "delete_node",
     "get_node_info",
+    "get_node_snapshot",
     "list_children",
     "find_nodes",
     "list_node_types",
@@ -94,6 +98,7 @@ __all__ = [
     "set_node_flags",
     # Parameters
     "set_parameter",
+    "set_parameters_bulk",
     "get_parameter_schema",
     # Geometry
     "get_geo_summary",
@@ -117,6 +122,7 @@ __all__ = [
     "create_network_box",
     # Code execution
     "execute_code",
+    "execute_code_batch",
     # Help/documentation
     "get_houdini_help",
     # Cache management
@@ -8,8 +8,12 @@ This module contains common utilities used across all tool modules:
 - Node serialization
 """
 
+import ast
+import bisect
+import functools
 import logging
 import re
+from io import TextIOBase
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..connection import (
@@ -41,8 +45,10 @@ __all__ = [
     # Code safety
     "DANGEROUS_PATTERNS",
     "_detect_dangerous_code",
+    "_detect_dangerous_code_batch",
     # Output utilities
     "_truncate_output",
+    "_CappedWriter",
     # Response size utilities
     "RESPONSE_SIZE_WARNING_THRESHOLD",
     "RESPONSE_SIZE_LARGE_THRESHOLD",
@@ -242,22 +248,256 @@ DANGEROUS_PATTERNS: List[Tuple[str, str]] = [
     (r"\bhou\.hipFile\.clear\s*\(", "hou.hipFile.clear() - scene wipe"),
 ]
 
+# Every dangerous construct contains one of these literals. Most code
+# contains none of them, and plain substring checks are far cheaper than
+# parsing or scanning.
+_QUICK_TOKENS: Tuple[str, ...] = (
+    "exit",
+    "os.",
+    "from os",
+    "rmtree",
+    "subprocess",
+    "open",
+    "hipFile",
+)
+
+# All quick tokens in one alternation, for prefiltering many snippets at once
+_QUICK_TOKEN_RE: "re.Pattern[str]" = re.compile("|".join(map(re.escape, _QUICK_TOKENS)))
+
+# Separates snippets when prefiltering a batch; no quick token contains it,
+# so a match can never straddle two snippets
+_BATCH_SEPARATOR = "\0"
+
+_DESCRIPTION_ORDER: Dict[str, int] = {
+    description: i for i, (_, description) in enumerate(DANGEROUS_PATTERNS)
+}
+
+# Dotted names whose use (called, aliased or imported) is reported
+_DANGEROUS_NAMES: Dict[str, str] = {
+    "hou.exit": DANGEROUS_PATTERNS[0][1],
+    "os.remove": DANGEROUS_PATTERNS[1][1],
+    "os.unlink": DANGEROUS_PATTERNS[2][1],
+    "shutil.rmtree": DANGEROUS_PATTERNS[3][1],
+    "os.system": DANGEROUS_PATTERNS[5][1],
+    "hou.hipFile.clear": DANGEROUS_PATTERNS[7][1],
+}
+_SUBPROCESS_DESCRIPTION = DANGEROUS_PATTERNS[4][1]
+_OPEN_WRITE_DESCRIPTION = DANGEROUS_PATTERNS[6][1]
+
+# Regex fallback for code that does not parse. All patterns are fused into one
+# scanner so the code is read a single time. Each alternative sits inside a
+# lookahead so matches are zero-width: a long match (e.g. the open() pattern)
+# never consumes text that another pattern needs to see.
+_DANGEROUS_SCANNER: "re.Pattern[str]" = re.compile(
+    "(?="
+    + "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS))
+    + ")"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_code(code: str) -> Optional[ast.Module]:
+    """
+    Parse a snippet once for both safety scanning and compilation.
+
+    Returns:
+        The module AST, or None if the code has a syntax error.
+    """
+    try:
+        return ast.parse(code)
+    except SyntaxError:
+        return None
+
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    """Return "a.b.c" for a Name/Attribute chain, or None for anything else."""
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+# Modules whose open() takes (file, mode, ...) like the builtin
+_MODULE_OPENERS = frozenset({"builtins", "io", "gzip", "bz2", "lzma", "codecs", "tarfile"})
+# Callables returning objects whose .open() takes the mode first
+_PATH_CLASSES = frozenset({"pathlib.Path", "pathlib.PosixPath", "pathlib.WindowsPath"})
+# What a literal file mode looks like; anything else (e.g. a file name passed
+# to ZipFile.open) is not read as a mode
+_MODE_RE = re.compile(r"[rwxabt+U]{1,4}")
+
+
+def _open_receivers(tree: ast.Module) -> Tuple[Set[str], Set[str]]:
+    """
+    Collect the names a parsed module binds to modules and to pathlib classes.
+
+    Returns:
+        (module names, names of pathlib classes such as Path)
+    """
+    modules: Set[str] = set()
+    path_classes: Set[str] = set(_PATH_CLASSES)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.add(alias.asname or alias.name)
+                if alias.name == "pathlib" and alias.asname:
+                    path_classes.update(
+                        alias.asname + name[len("pathlib") :] for name in _PATH_CLASSES
+                    )
+        elif isinstance(node, ast.ImportFrom) and node.module == "pathlib":
+            for alias in node.names:
+                if f"pathlib.{alias.name}" in _PATH_CLASSES:
+                    path_classes.add(alias.asname or alias.name)
+    return modules, path_classes
+
+
+def _open_mode(call: ast.Call, modules: Set[str], path_classes: Set[str]) -> Optional[str]:
+    """
+    Return the literal mode string of an open()/.open() call, if any.
+
+    Module functions (open(), gzip.open(), codecs.open(), ...) take the mode
+    second and Path(...).open() takes it first. For other receivers (e.g.
+    ZipFile.open(name, mode)) the first two arguments are checked, but only
+    values that look like a file mode count. No mode found means a read.
+    """
+    for keyword in call.keywords:
+        if keyword.arg == "mode":
+            candidates: List[ast.AST] = [keyword.value]
+            break
+    else:
+        func = call.func
+        if not isinstance(func, ast.Attribute):
+            positions: Tuple[int, ...] = (1,)
+        elif isinstance(func.value, ast.Call) and _dotted_name(func.value.func) in path_classes:
+            positions = (0,)
+        else:
+            receiver = _dotted_name(func.value)
+            if receiver is not None and (receiver in _MODULE_OPENERS or receiver in modules):
+                positions = (1,)
+            else:
+                positions = (0, 1)
+        candidates = [call.args[position] for position in positions if position < len(call.args)]
+    for mode_node in candidates:
+        if (
+            isinstance(mode_node, ast.Constant)
+            and isinstance(mode_node.value, str)
+            and _MODE_RE.fullmatch(mode_node.value)
+        ):
+            return mode_node.value
+    return None
+
+
+def _regex_scan(text: str) -> Set[str]:
+    """Collect descriptions of every DANGEROUS_PATTERNS regex found in text."""
+    return {
+        DANGEROUS_PATTERNS[int(match.lastgroup[1:])][1]
+        for match in _DANGEROUS_SCANNER.finditer(text)
+    }
+
+
+def _scan_tree(tree: ast.Module) -> Set[str]:
+    """Collect descriptions of dangerous constructs used in a parsed module."""
+    found: Set[str] = set()
+    receivers: Optional[Tuple[Set[str], Set[str]]] = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            # String literals can still reach exec()/eval()/hscript, so they
+            # are scanned as text (conservatively) rather than ignored
+            if any(token in node.value for token in _QUICK_TOKENS):
+                found |= _regex_scan(node.value)
+        elif isinstance(node, (ast.Attribute, ast.Name)):
+            name = _dotted_name(node)
+            if name is None:
+                continue
+            if name in _DANGEROUS_NAMES:
+                found.add(_DANGEROUS_NAMES[name])
+            elif name.split(".", 1)[0] == "subprocess":
+                found.add(_SUBPROCESS_DESCRIPTION)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".", 1)[0] == "subprocess":
+                    found.add(_SUBPROCESS_DESCRIPTION)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            if node.module.split(".", 1)[0] == "subprocess":
+                found.add(_SUBPROCESS_DESCRIPTION)
+            for alias in node.names:
+                qualified = f"{node.module}.{alias.name}"
+                if qualified in _DANGEROUS_NAMES:
+                    found.add(_DANGEROUS_NAMES[qualified])
+        if isinstance(node, ast.Call):
+            func = node.func
+            is_open = (isinstance(func, ast.Name) and func.id == "open") or (
+                isinstance(func, ast.Attribute) and func.attr == "open"
+            )
+            if is_open:
+                if receivers is None:
+                    receivers = _open_receivers(tree)
+                mode = _open_mode(node, *receivers)
+                if mode is not None and any(flag in mode for flag in "wax+"):
+                    found.add(_OPEN_WRITE_DESCRIPTION)
+    return found
+
 
 def _detect_dangerous_code(code: str) -> List[str]:
     """
     Scan code for potentially dangerous patterns.
 
+    The code is parsed and its names, imports and open() calls inspected, so
+    mentions inside comments are not reported. String literals are still
+    scanned as text since they may be executed. Code that does not parse
+    falls back to a regex scan of the raw text.
+
     Args:
         code: Python code to scan
 
     Returns:
         List of detected dangerous pattern descriptions
     """
-    detected: List[str] = []
-    for pattern, description in DANGEROUS_PATTERNS:
-        if re.search(pattern, code):
-            detected.append(description)
-    return detected
+    if not any(token in code for token in _QUICK_TOKENS):
+        return []
+
+    tree = _parse_code(code)
+    found = _scan_tree(tree) if tree is not None else _regex_scan(code)
+    # Report in DANGEROUS_PATTERNS order regardless of where matches occur
+    return sorted(found, key=_DESCRIPTION_ORDER.__getitem__)
+
+
+def _detect_dangerous_code_batch(codes: List[str]) -> List[List[str]]:
+    """
+    Scan several code snippets for dangerous patterns.
+
+    The quick-token prefilter runs once over all snippets joined together;
+    only snippets containing a hit get the full per-snippet scan.
+
+    Args:
+        codes: Python code snippets to scan
+
+    Returns:
+        One list of detected pattern descriptions per snippet, in order
+    """
+    starts: List[int] = []
+    offset = 0
+    for code in codes:
+        starts.append(offset)
+        offset += len(code) + len(_BATCH_SEPARATOR)
+
+    results: List[List[str]] = [[] for _ in codes]
+    joined = _BATCH_SEPARATOR.join(codes)
+    pos = 0
+    while True:
+        match = _QUICK_TOKEN_RE.search(joined, pos)
+        if match is None:
+            break
+        index = bisect.bisect_right(starts, match.start()) - 1
+        results[index] = _detect_dangerous_code(codes[index])
+        # Each snippet needs scanning at most once; resume at the next one
+        if index + 1 >= len(codes):
+            break
+        pos = starts[index + 1]
+    return results
 
 
 def _truncate_output(output: str, max_size: int) -> Tuple[str, bool]:
@@ -277,6 +517,43 @@ def _truncate_output(output: str, max_size: int) -> Tuple[str, bool]:
     return output, False
 
 
+class _CappedWriter(TextIOBase):
+    """
+    Text stream that keeps at most max_size characters of what is written.
+
+    Used to capture stdout/stderr so a chatty print loop cannot grow the
+    buffer beyond the size that would be returned anyway. Writes are kept as
+    a list of chunks and joined once in getvalue(), avoiding the repeated
+    buffer growth of StringIO. Writes past the cap are dropped (but reported
+    as written) and set truncated.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.truncated = False
+        self._chunks: List[str] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        remaining = self.max_size - self._size
+        if len(s) > remaining:
+            self.truncated = True
+            if remaining > 0:
+                self._chunks.append(s[:remaining])
+                self._size = self.max_size
+            return len(s)
+        self._chunks.append(s)
+        self._size += len(s)
+        return len(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+
 # Response size thresholds (in bytes)
 RESPONSE_SIZE_WARNING_THRESHOLD = 100 * 1024  # 100KB - warn above this
 RESPONSE_SIZE_LARGE_THRESHOLD = 500 * 1024  # 500KB - considered large
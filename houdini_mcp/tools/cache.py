@@ -22,6 +22,7 @@ Usage:
     invalidate_all_caches()
 """
 
+import copy
 import logging
 import threading
 import time
@@ -420,6 +421,269 @@ class ParameterSchemaCache(BaseCache):
         return None
 
 
+class NodeSchemaCache(BaseCache):
+    """
+    Cache for get_parameter_schema template metadata, keyed per node.
+
+    Entries hold names, types, defaults, ranges and menus but no current
+    values; callers re-evaluate those on every request. Templates can still
+    differ between nodes of the same type (spare parameters), so entries are
+    tied to a node path and invalidated when that node is modified
+    (set_parameter, create_node, delete_node) or when arbitrary code runs in
+    Houdini. A full-schema entry also answers single-parameter lookups on the
+    same node without refetching templates.
+
+    Nodes can also be changed from the Houdini UI, so each path remembers the
+    identity (type name, session id) of the node its entries came from; a
+    lookup with a different identity (node deleted and recreated) drops them.
+    Spare parameters added in place keep the identity, which the finite TTL
+    covers.
+
+    Entries are bound to the hou module they were fetched from; switching
+    to a different connection drops them.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        """
+        Initialize node schema cache.
+
+        Args:
+            ttl: Time-to-live in seconds. Default 60; 0 = never expire
+                 (rely on explicit invalidation).
+        """
+        super().__init__("node_schemas", ttl)
+        self._hou: Any = None
+        # node_path -> identity of the node the path's entries were fetched from
+        self._identities: Dict[str, Tuple[Any, ...]] = {}
+        # Key: (node_path, parm_name or "*", max_parms) -> cached result
+        self._entries: Dict[Tuple[str, str, int], CacheEntry] = {}
+
+    def _bind(self, hou: Any) -> None:
+        """Drop all entries if they were fetched through a different hou module."""
+        if hou is not self._hou:
+            self._entries.clear()
+            self._identities.clear()
+            self._hou = hou
+
+    def _drop_node(self, node_path: str) -> bool:
+        """Drop entries for a node and everything below it. Caller holds the lock."""
+        prefix = node_path.rstrip("/") + "/"
+        stale = [key for key in self._entries if key[0] == node_path or key[0].startswith(prefix)]
+        for key in stale:
+            del self._entries[key]
+        for path in [p for p in self._identities if p == node_path or p.startswith(prefix)]:
+            del self._identities[path]
+        self._stats.entry_count = len(self._entries)
+        return bool(stale)
+
+    def get(
+        self,
+        hou: Any,
+        node_path: str,
+        parm_name: Optional[str],
+        max_parms: int,
+        identity: Tuple[Any, ...],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached schema result.
+
+        Single-parameter requests are answered from a cached full schema of
+        the same node when the parameter is present in it.
+
+        Args:
+            hou: The hou module (from ensure_connected)
+            node_path: Node path the schema was requested for
+            parm_name: Specific parameter name, or None for the full schema
+            max_parms: max_parms used for the request
+            identity: Identity of the node currently at node_path
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        key = (node_path, parm_name or "*", max_parms)
+
+        with self._lock:
+            self._bind(hou)
+            known = self._identities.get(node_path)
+            if known is not None and known != identity:
+                # A different node now lives at this path
+                if self._drop_node(node_path):
+                    self._stats.invalidations += 1
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_expired():
+                self._record_hit()
+                return copy.deepcopy(entry.value)
+
+            if parm_name is not None:
+                for (path, name, _max_parms), full in self._entries.items():
+                    if path != node_path or name != "*" or full.is_expired():
+                        continue
+                    for param in full.value.get("parameters", []):
+                        if param.get("name") == parm_name:
+                            self._record_hit()
+                            return {
+                                "status": "success",
+                                "node_path": node_path,
+                                "parameters": [copy.deepcopy(param)],
+                                "count": 1,
+                            }
+
+            self._record_miss()
+            return None
+
+    def put(
+        self,
+        hou: Any,
+        node_path: str,
+        parm_name: Optional[str],
+        max_parms: int,
+        result: Dict[str, Any],
+        identity: Tuple[Any, ...],
+    ) -> None:
+        """
+        Store a schema result.
+
+        Args:
+            hou: The hou module the result was fetched from
+            node_path: Node path the schema was requested for
+            parm_name: Specific parameter name, or None for the full schema
+            max_parms: max_parms used for the request
+            result: The successful get_parameter_schema result
+            identity: Identity of the node the result was fetched from
+        """
+        key = (node_path, parm_name or "*", max_parms)
+
+        with self._lock:
+            self._bind(hou)
+            if self._identities.get(node_path, identity) != identity:
+                self._drop_node(node_path)
+            self._identities[node_path] = identity
+            self._entries[key] = CacheEntry(
+                value=copy.deepcopy(result), timestamp=time.time(), ttl=self.default_ttl
+            )
+            self._valid = True
+            self._stats.entry_count = len(self._entries)
+
+    def invalidate_node(self, node_path: str) -> None:
+        """
+        Drop cached entries for a node and everything below it.
+
+        Args:
+            node_path: Path of the node that was modified
+        """
+        with self._lock:
+            if self._drop_node(node_path):
+                self._stats.invalidations += 1
+
+    def invalidate(self) -> None:
+        """Invalidate the cache and drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._identities.clear()
+            self._stats.entry_count = 0
+            super().invalidate()
+
+
+class GeoSummaryCache(BaseCache):
+    """
+    Cache for get_geo_summary results, keyed per node and cook.
+
+    Each entry records the node's cook count when it was stored. A SOP's
+    geometry only changes when the node recooks, so a lookup with the same
+    cook count returns the stored summary. Any recook makes the old entry
+    unreachable. Callers must not use the cache for nodes that need to cook.
+
+    Entries are bound to the hou module they were fetched from; switching
+    to a different connection drops them.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 256):
+        """
+        Initialize geometry summary cache.
+
+        Args:
+            ttl: Time-to-live in seconds. Default 0 = never expire
+                 (rely on cook counts and explicit invalidation).
+            max_entries: Maximum number of summaries kept; the oldest entry
+                 is dropped first.
+        """
+        super().__init__("geo_summaries", ttl)
+        self.max_entries = max_entries
+        self._hou: Any = None
+        # Key: (node_path, options) -> (cook_count, cached result)
+        self._entries: Dict[Tuple[str, Tuple[Any, ...]], Tuple[int, CacheEntry]] = {}
+
+    def _bind(self, hou: Any) -> None:
+        """Drop all entries if they were fetched through a different hou module."""
+        if hou is not self._hou:
+            self._entries.clear()
+            self._hou = hou
+
+    def get(
+        self, hou: Any, node_path: str, cook_count: int, options: Tuple[Any, ...]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached summary for a node at a given cook count.
+
+        Args:
+            hou: The hou module (from ensure_connected)
+            node_path: Node path the summary was requested for
+            cook_count: The node's current cookCount()
+            options: Hashable tuple of the request options
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            self._bind(hou)
+            stored = self._entries.get((node_path, options))
+            if stored is not None and stored[0] == cook_count and not stored[1].is_expired():
+                self._record_hit()
+                return copy.deepcopy(stored[1].value)
+            self._record_miss()
+            return None
+
+    def put(
+        self,
+        hou: Any,
+        node_path: str,
+        cook_count: int,
+        options: Tuple[Any, ...],
+        result: Dict[str, Any],
+    ) -> None:
+        """
+        Store a summary for a node at a given cook count.
+
+        Args:
+            hou: The hou module the result was fetched from
+            node_path: Node path the summary was requested for
+            cook_count: The node's cookCount() after the summary was taken
+            options: Hashable tuple of the request options
+            result: The successful get_geo_summary result
+        """
+        key = (node_path, options)
+
+        with self._lock:
+            self._bind(hou)
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            entry = CacheEntry(
+                value=copy.deepcopy(result), timestamp=time.time(), ttl=self.default_ttl
+            )
+            self._entries[key] = (cook_count, entry)
+            self._valid = True
+            self._stats.entry_count = len(self._entries)
+
+    def invalidate(self) -> None:
+        """Invalidate the cache and drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entry_count = 0
+            super().invalidate()
+
+
 # =============================================================================
 # Global Cache Instances
 # =============================================================================
@@ -430,6 +694,12 @@ node_type_cache = NodeTypeCache()
 # Global parameter schema cache
 parameter_schema_cache = ParameterSchemaCache()
 
+# Global per-node schema cache (get_parameter_schema results)
+node_schema_cache = NodeSchemaCache()
+
+# Global per-node geometry summary cache (get_geo_summary results)
+geo_summary_cache = GeoSummaryCache()
+
 
 def invalidate_all_caches() -> None:
     """
@@ -443,6 +713,8 @@ def invalidate_all_caches() -> None:
     """
     node_type_cache.invalidate()
     parameter_schema_cache.invalidate()
+    node_schema_cache.invalidate()
+    geo_summary_cache.invalidate()
     logger.info("All caches invalidated")
 
 
@@ -471,4 +743,20 @@ def get_cache_stats() -> Dict[str, Any]:
             "invalidations": parameter_schema_cache.stats.invalidations,
             "entry_count": parameter_schema_cache.stats.entry_count,
         },
+        "node_schemas": {
+            "valid": node_schema_cache.is_valid(),
+            "hits": node_schema_cache.stats.hits,
+            "misses": node_schema_cache.stats.misses,
+            "hit_rate": f"{node_schema_cache.stats.hit_rate():.1%}",
+            "invalidations": node_schema_cache.stats.invalidations,
+            "entry_count": node_schema_cache.stats.entry_count,
+        },
+        "geo_summaries": {
+            "valid": geo_summary_cache.is_valid(),
+            "hits": geo_summary_cache.stats.hits,
+            "misses": geo_summary_cache.stats.misses,
+            "hit_rate": f"{geo_summary_cache.stats.hit_rate():.1%}",
+            "invalidations": geo_summary_cache.stats.invalidations,
+            "entry_count": geo_summary_cache.stats.entry_count,
+        },
     }
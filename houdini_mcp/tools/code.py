@@ -4,21 +4,27 @@ This module provides tools for executing Python code in Houdini
 with safety rails, timeout handling, and scene diff tracking.
 """
 
+import functools
 import logging
+import math
+import sys
 import threading
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
-from io import StringIO
-from typing import Any, Dict, List, Optional
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
 
 from ._common import (
     ensure_connected,
     handle_connection_errors,
     _detect_dangerous_code,
-    _truncate_output,
+    _detect_dangerous_code_batch,
+    _parse_code,
+    _CappedWriter,
     _serialize_scene_state,
     _get_scene_diff,
 )
+from .cache import node_schema_cache
 
 logger = logging.getLogger("houdini_mcp.tools.code")
 
@@ -26,6 +32,137 @@ logger = logging.getLogger("houdini_mcp.tools.code")
 _before_scene: List[Dict[str, Any]] = []
 _after_scene: List[Dict[str, Any]] = []
 
+# Globals template for the current hou proxy. Identity is compared with `is`
+# because hashing an rpyc netref would itself be a remote call.
+_namespace_template: Optional[Tuple[Any, Dict[str, Any]]] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_code(code: str) -> CodeType:
+    """Compile a snippet once; agents frequently resend identical code."""
+    # Reuse the AST already built by the safety scan when there is one
+    tree = _parse_code(code)
+    return compile(tree if tree is not None else code, "<string>", "exec")
+
+
+def _make_namespace(hou: Any) -> Dict[str, Any]:
+    """
+    Return fresh exec globals for a snippet, copied from a cached template.
+
+    hou, math and sys are pre-bound so short snippets can use them without
+    an import statement.
+    """
+    global _namespace_template
+
+    if _namespace_template is None or _namespace_template[0] is not hou:
+        _namespace_template = (
+            hou,
+            {"hou": hou, "math": math, "sys": sys, "__builtins__": __builtins__},
+        )
+    return _namespace_template[1].copy()
+
+
+def _run_code(
+    hou: Any,
+    code: str,
+    max_stdout_size: int,
+    max_stderr_size: int,
+    timeout: float,
+    include_traceback: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run one snippet with captured, size-capped output and a timeout.
+
+    Args:
+        hou: Remote hou module exposed to the snippet
+        code: Python source to execute
+        max_stdout_size: Maximum stdout size kept
+        max_stderr_size: Maximum stderr size kept
+        timeout: Seconds to wait before reporting a timeout
+        include_traceback: If False, report only the exception type on errors
+            instead of formatting the full traceback
+
+    Returns:
+        Dict with status, stdout and stderr, plus truncation flags, traceback
+        or error_type (on exceptions) or timeout details.
+    """
+    # Capture stdout and stderr, storing at most the size we will return
+    stdout_capture = _CappedWriter(max_stdout_size)
+    stderr_capture = _CappedWriter(max_stderr_size)
+
+    # Storage for execution result from thread
+    exec_exception: List[Optional[Exception]] = [None]
+
+    def run_code() -> None:
+        """Execute code in a separate thread for timeout support."""
+        try:
+            # Execute in a namespace with hou available
+            exec_globals = _make_namespace(hou)
+
+            code_obj = _compile_code(code)
+            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+                exec(code_obj, exec_globals)
+
+        except Exception as e:
+            # Formatted later, and only if the caller wants the traceback
+            exec_exception[0] = e
+
+    exec_thread = threading.Thread(target=run_code)
+    exec_thread.start()
+    exec_thread.join(timeout=timeout)
+
+    if exec_thread.is_alive():
+        # Timeout occurred - thread is still running
+        # Note: We can't forcefully kill the thread in Python, but we can return
+        # an error to the user. The code may continue running in the background.
+        logger.warning(f"Code execution exceeded timeout of {timeout}s")
+        return {
+            "status": "error",
+            "message": f"Execution timeout: code did not complete within {timeout} seconds",
+            "stdout": stdout_capture.getvalue(),
+            "stderr": stderr_capture.getvalue(),
+            "timeout": timeout,
+            "warning": "The code may still be running in Houdini. Consider restarting if needed.",
+        }
+
+    # Check if there was an exception during execution
+    exc = exec_exception[0]
+    if exc is not None:
+        error_result: Dict[str, Any] = {
+            "status": "error",
+            "message": str(exc),
+            "stdout": stdout_capture.getvalue(),
+            "stderr": stderr_capture.getvalue(),
+        }
+        if include_traceback:
+            error_result["traceback"] = "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            )
+        else:
+            error_result["error_type"] = type(exc).__name__
+        if stdout_capture.truncated:
+            error_result["stdout_truncated"] = True
+        if stderr_capture.truncated:
+            error_result["stderr_truncated"] = True
+        return error_result
+
+    # Collect outputs (already capped during capture)
+    result: Dict[str, Any] = {
+        "status": "success",
+        "stdout": stdout_capture.getvalue(),
+        "stderr": stderr_capture.getvalue(),
+    }
+
+    # Add truncation flags if applicable
+    if stdout_capture.truncated:
+        result["stdout_truncated"] = True
+        result["stdout_warning"] = f"stdout truncated to {max_stdout_size} bytes"
+    if stderr_capture.truncated:
+        result["stderr_truncated"] = True
+        result["stderr_warning"] = f"stderr truncated to {max_stderr_size} bytes"
+
+    return result
+
 
 @handle_connection_errors("execute_code")
 def execute_code(
@@ -36,6 +173,7 @@ def execute_code(
     max_diff_nodes: int = 1000,
     timeout: int = 30,
     allow_dangerous: bool = False,
+    include_traceback: bool = True,
     host: str = "localhost",
     port: int = 18811,
 ) -> Dict[str, Any]:
@@ -43,13 +181,14 @@ def execute_code(
     Execute Python code in Houdini with optional scene diff tracking and safety rails.
 
     Args:
-        code: Python code to execute. The 'hou' module is available.
+        code: Python code to execute. The 'hou', 'math' and 'sys' modules are available.
         capture_diff: If True, captures before/after scene state for comparison
         max_stdout_size: Maximum stdout size in bytes (default: 100000 = 100KB)
         max_stderr_size: Maximum stderr size in bytes (default: 100000 = 100KB)
         max_diff_nodes: Maximum number of nodes in scene diff added_nodes (default: 1000)
         timeout: Execution timeout in seconds (default: 30). Note: May be limited by RPyC.
         allow_dangerous: If True, allows execution of code with dangerous patterns (default: False)
+        include_traceback: If False, errors report error_type instead of a formatted traceback
 
     Returns:
         Dict with execution result including stdout/stderr and scene changes.
@@ -86,89 +225,16 @@ def execute_code(
     if capture_diff:
         _before_scene = _serialize_scene_state(hou)
 
-    # Capture stdout and stderr
-    stdout_capture = StringIO()
-    stderr_capture = StringIO()
+    # 2. Execute with timeout, then collect capped outputs
+    result = _run_code(hou, code, max_stdout_size, max_stderr_size, timeout, include_traceback)
 
-    # Storage for execution result from thread
-    exec_result: Dict[str, Any] = {}
-    exec_exception: List[Optional[Exception]] = [None]
-    exec_traceback: List[str] = [""]
+    # Arbitrary code may have changed any node's parameters
+    node_schema_cache.invalidate()
 
-    def run_code() -> None:
-        """Execute code in a separate thread for timeout support."""
-        try:
-            # Execute in a namespace with hou available
-            exec_globals = {"hou": hou, "__builtins__": __builtins__}
-
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                exec(code, exec_globals)
-
-        except Exception as e:
-            exec_exception[0] = e
-            exec_traceback[0] = traceback.format_exc()
-
-    # 2. Execute with timeout using threading
-    exec_thread = threading.Thread(target=run_code)
-    exec_thread.start()
-    exec_thread.join(timeout=timeout)
-
-    if exec_thread.is_alive():
-        # Timeout occurred - thread is still running
-        # Note: We can't forcefully kill the thread in Python, but we can return
-        # an error to the user. The code may continue running in the background.
-        logger.warning(f"Code execution exceeded timeout of {timeout}s")
-        return {
-            "status": "error",
-            "message": f"Execution timeout: code did not complete within {timeout} seconds",
-            "stdout": stdout_capture.getvalue()[:max_stdout_size]
-            if stdout_capture.getvalue()
-            else "",
-            "stderr": stderr_capture.getvalue()[:max_stderr_size]
-            if stderr_capture.getvalue()
-            else "",
-            "timeout": timeout,
-            "warning": "The code may still be running in Houdini. Consider restarting if needed.",
-        }
-
-    # Check if there was an exception during execution
-    if exec_exception[0] is not None:
-        stdout_val = stdout_capture.getvalue()
-        stderr_val = stderr_capture.getvalue()
-        stdout_val, stdout_truncated = _truncate_output(stdout_val, max_stdout_size)
-        stderr_val, stderr_truncated = _truncate_output(stderr_val, max_stderr_size)
-
-        error_result: Dict[str, Any] = {
-            "status": "error",
-            "message": str(exec_exception[0]),
-            "traceback": exec_traceback[0],
-            "stdout": stdout_val,
-            "stderr": stderr_val,
-        }
-        if stdout_truncated:
-            error_result["stdout_truncated"] = True
-        if stderr_truncated:
-            error_result["stderr_truncated"] = True
-        return error_result
-
-    # 3. Process and truncate outputs if needed
-    stdout_val = stdout_capture.getvalue()
-    stderr_val = stderr_capture.getvalue()
+    if result["status"] != "success":
+        return result
 
-    stdout_val, stdout_truncated = _truncate_output(stdout_val, max_stdout_size)
-    stderr_val, stderr_truncated = _truncate_output(stderr_val, max_stderr_size)
-
-    result: Dict[str, Any] = {"status": "success", "stdout": stdout_val, "stderr": stderr_val}
-
-    # Add truncation flags if applicable
-    if stdout_truncated:
-        result["stdout_truncated"] = True
-        result["stdout_warning"] = f"stdout truncated to {max_stdout_size} bytes"
-    if stderr_truncated:
-        result["stderr_truncated"] = True
-        result["stderr_warning"] = f"stderr truncated to {max_stderr_size} bytes"
-
-    # 4. Capture scene state after execution and compute diff with size limit
+    # 3. Capture scene state after execution and compute diff with size limit
     if capture_diff:
         _after_scene = _serialize_scene_state(hou)
         scene_changes = _get_scene_diff(_before_scene, _after_scene)
@@ -195,6 +261,99 @@ def execute_code(
     return result
 
 
+@handle_connection_errors("execute_code_batch")
+def execute_code_batch(
+    codes: List[str],
+    stop_on_error: bool = False,
+    max_stdout_size: int = 100000,
+    max_stderr_size: int = 100000,
+    timeout: int = 30,
+    allow_dangerous: bool = False,
+    include_traceback: bool = True,
+    host: str = "localhost",
+    port: int = 18811,
+) -> Dict[str, Any]:
+    """
+    Execute several Python snippets in order in a single tool call.
+
+    Every snippet is safety-scanned before any of them runs. They then share
+    one connection, each with its own stdout/stderr capture and timeout.
+
+    Args:
+        codes: Python snippets to execute in order. The 'hou' module is available.
+        stop_on_error: If True, skip the remaining snippets after the first error
+        max_stdout_size: Maximum stdout size per snippet (default: 100000)
+        max_stderr_size: Maximum stderr size per snippet (default: 100000)
+        timeout: Execution timeout per snippet in seconds (default: 30)
+        allow_dangerous: If True, allows snippets with dangerous patterns (default: False)
+        include_traceback: If False, errors report error_type instead of a formatted traceback
+
+    Returns:
+        Dict with status ("success", "partial" or "error") and results, a list
+        with one execute_code-style result per snippet (index included).
+        Skipped snippets have status "skipped".
+    """
+    if not codes:
+        return {"status": "success", "results": [], "count": 0}
+
+    # 1. Scan every snippet BEFORE running any of them
+    dangerous: List[Dict[str, Any]] = [
+        {"index": index, "dangerous_patterns": patterns}
+        for index, patterns in enumerate(_detect_dangerous_code_batch(codes))
+        if patterns
+    ]
+    if dangerous and not allow_dangerous:
+        return {
+            "status": "error",
+            "message": "Dangerous operations detected in code",
+            "dangerous_snippets": dangerous,
+            "hint": "Set allow_dangerous=True to proceed with execution",
+        }
+
+    # Snippets that are all empty need no connection at all
+    if not any(code and code.strip() for code in codes):
+        results = [
+            {"index": index, "status": "success", "stdout": "", "stderr": ""}
+            for index in range(len(codes))
+        ]
+        return {"status": "success", "results": results, "count": len(results)}
+
+    hou = ensure_connected(host, port)
+
+    # 2. Run snippets in order on the shared connection
+    results: List[Dict[str, Any]] = []
+    failed = False
+    for index, code in enumerate(codes):
+        if failed and stop_on_error:
+            results.append({"index": index, "status": "skipped"})
+            continue
+        if not code or not code.strip():
+            results.append({"index": index, "status": "success", "stdout": "", "stderr": ""})
+            continue
+        item = _run_code(
+            hou, code, max_stdout_size, max_stderr_size, timeout, include_traceback
+        )
+        item["index"] = index
+        results.append(item)
+        failed = failed or item["status"] != "success"
+
+    # Arbitrary code may have changed any node's parameters
+    node_schema_cache.invalidate()
+
+    succeeded = sum(1 for item in results if item["status"] == "success")
+    if not failed:
+        status = "success"
+    elif succeeded == 0:
+        status = "error"
+    else:
+        status = "partial"
+
+    response: Dict[str, Any] = {"status": status, "results": results, "count": len(results)}
+    if dangerous:
+        response["dangerous_snippets_executed"] = dangerous
+    return response
+
+
 def get_last_scene_diff() -> Dict[str, Any]:
     """
     Get the scene diff from the last execute_code call.
@@ -6,15 +6,50 @@ including point/primitive counts, attributes, groups, and sampling.
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ._common import (
+    ensure_connected,
     handle_connection_errors,
     _add_response_metadata,
 )
+from .cache import geo_summary_cache
 
 logger = logging.getLogger("houdini_mcp.tools.geometry")
 
+# orjson parses the float-heavy geometry payloads noticeably faster; it is
+# optional (pip install houdini-mcp[speedups]). Its JSONDecodeError subclasses
+# json.JSONDecodeError, so error handling is the same either way.
+try:
+    import orjson
+
+    def _json_loads(text: str) -> Any:
+        """Parse with orjson, falling back to json for NaN/Infinity tokens."""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # json.dumps on the Houdini side writes non-finite floats (e.g. a
+            # degenerate bounding box) as NaN/Infinity, which orjson rejects
+            return json.loads(text)
+
+except ImportError:
+    _json_loads = json.loads
+
+
+def _clean_cook_count(node: Any) -> Optional[int]:
+    """
+    Return the node's cook count if its geometry is up to date, else None.
+
+    A node that needs to cook will be cooked by the summary, so its cached
+    summary (if any) cannot be trusted.
+    """
+    try:
+        if node.needsToCook():
+            return None
+        return int(node.cookCount())
+    except Exception:
+        return None
+
 
 @handle_connection_errors("get_geometry_summary")
 def get_geo_summary(
@@ -62,6 +97,9 @@ def get_geo_summary(
         - Empty geometry: Returns zeros, not error
         - Massive geometry (>1M points): Caps sampling with warning
         - No bounding box: Returns None for bbox fields
+
+    Results are cached per node and cook count, so asking again about a node
+    that has not recooked costs a few RPCs instead of a full analysis.
     """
     # Import execute_code here to avoid circular imports
     from .code import execute_code
@@ -73,6 +111,17 @@ def get_geo_summary(
         logger.warning(f"max_sample_points capped at 10000 (was {max_sample_points})")
         max_sample_points = 10000
 
+    # A node that has not recooked since the last summary has the same geometry
+    hou = ensure_connected(host, port)
+    node = hou.node(node_path)
+    options = (max_sample_points, include_attributes, include_groups)
+    if node is not None:
+        cook_count = _clean_cook_count(node)
+        if cook_count is not None:
+            cached = geo_summary_cache.get(hou, node_path, cook_count, options)
+            if cached is not None:
+                return cached
+
     # Build Houdini-side code that does all the heavy lifting locally
     # This avoids slow RPC iteration over geometry elements
     geo_analysis_code = f"""
@@ -237,11 +286,17 @@ print(json.dumps(result))
         return {"status": "error", "message": "No output from geometry analysis"}
 
     try:
-        result = json.loads(stdout)
-        return _add_response_metadata(result)
+        result = _add_response_metadata(_json_loads(stdout))
     except json.JSONDecodeError as e:
         return {
             "status": "error",
             "message": f"Failed to parse geometry data: {e}",
             "raw_output": stdout[:500],
         }
+
+    if node is not None and result.get("status") == "success":
+        # Keyed by the cook count after the analysis, which may have cooked it
+        cook_count = _clean_cook_count(node)
+        if cook_count is not None:
+            geo_summary_cache.put(hou, node_path, cook_count, options, result)
+    return result
@@ -3,6 +3,7 @@
 This module provides tools for managing Houdini nodes:
 - create_node: Create a new node
 - get_node_info: Get detailed node information
+- get_node_snapshot: Get node info, cook state and geometry stats in one call
 - delete_node: Delete a node
 - list_node_types: List available node types (with caching)
 - list_children: List child nodes with connection info
@@ -10,6 +11,7 @@ This module provides tools for managing Houdini nodes:
 """
 
 import logging
+import time
 import traceback
 from typing import Any, Dict, List, Optional
 
@@ -23,10 +25,18 @@ from ._common import (
     handle_connection_errors,
     logger as common_logger,
 )
-from .cache import node_type_cache
+from .cache import node_type_cache, node_schema_cache
 
 logger = logging.getLogger("houdini_mcp.tools.nodes")
 
+# hou.cookState names -> cook_state values reported in cook_info
+_COOK_STATE_MAP = {
+    "Cooked": "cooked",
+    "CookFailed": "error",
+    "Dirty": "dirty",
+    "Uncooked": "uncooked",
+}
+
 
 @handle_connection_errors("create_node")
 def create_node(
@@ -58,6 +68,8 @@ def create_node(
     else:
         node = parent.createNode(node_type)
 
+    node_schema_cache.invalidate_node(node.path())
+
     return {
         "status": "success",
         "node_path": node.path(),
@@ -75,6 +87,7 @@ def get_node_info(
     include_errors: bool = False,
     force_cook: bool = False,
     compact: bool = False,
+    include_geo_stats: bool = False,
     host: str = "localhost",
     port: int = 18811,
 ) -> Dict[str, Any]:
@@ -90,10 +103,13 @@ def get_node_info(
         include_errors: When True, include cook state and error/warning information
         force_cook: When True, force cook the node before checking errors (requires include_errors=True)
         compact: When True, return minimal info (path, type, counts only)
+        include_geo_stats: When True, add point_count, primitive_count and bounding_box
+                           to cook_info (requires include_errors=True)
 
     Returns:
         Dict with node information. When include_errors=True, also includes cook_info
-        with cook_state, errors, warnings, and last_cook_time.
+        with cook_state, errors, warnings, and last_cook_time. Geometry stats are None
+        for nodes without geometry.
     """
     hou = ensure_connected(host, port)
 
@@ -177,95 +193,249 @@ def get_node_info(
 
     # Add cook info if requested
     if include_errors:
-        try:
-            # Force cook if requested
-            if force_cook:
-                node.cook(force=True)
+        cook_info = _collect_cook_info(node, force_cook)
+        if include_geo_stats:
+            # Read from the same cook so callers can skip get_geo_summary
+            geo_stats = _geometry_stats(node) or {}
+            cook_info["point_count"] = geo_stats.get("point_count")
+            cook_info["primitive_count"] = geo_stats.get("primitive_count")
+            cook_info["bounding_box"] = geo_stats.get("bounding_box")
+        info["cook_info"] = cook_info
+
+    return info
+
+
+@handle_connection_errors("get_node_snapshot")
+def get_node_snapshot(
+    node_path: str,
+    include_params: bool = False,
+    include_geo: bool = True,
+    max_sample_points: int = 0,
+    max_params: int = 50,
+    host: str = "localhost",
+    port: int = 18811,
+) -> Dict[str, Any]:
+    """
+    Get node info, cook state and geometry stats in a single call.
+
+    Intended for verification steps that would otherwise call get_node_info
+    followed by get_geo_summary. The node is cooked once and every section is
+    read from that cook.
+
+    Args:
+        node_path: Path to the node
+        include_params: Whether to include parameter values (default: False)
+        include_geo: Whether to include geometry counts and bounding box (default: True)
+        max_sample_points: Number of leading point positions to include
+                           (default: 0, max: 10000)
+        max_params: Maximum number of parameters to return
+
+    Returns:
+        Dict with path/name/type, input_connections, cook_info, and optionally
+        parameters and geometry ({point_count, primitive_count, vertex_count,
+        bounding_box, sample_points}). geometry is None for nodes without geometry.
+    """
+    hou = ensure_connected(host, port)
+
+    node = hou.node(node_path)
+    if node is None:
+        return {"status": "error", "message": f"Node not found: {node_path}"}
+
+    node_type = node.type()
+    input_connections: List[Dict[str, Any]] = [
+        {"input_index": idx, "source_node": input_node.path()}
+        for idx, input_node in enumerate(node.inputs())
+        if input_node is not None
+    ]
 
-            # Determine cook state using available methods
-            # Houdini 20.5+ doesn't have cookState(), use needsToCook() instead
+    snapshot: Dict[str, Any] = {
+        "status": "success",
+        "path": node.path(),
+        "name": node.name(),
+        "type": node_type.name(),
+        "input_connections": input_connections,
+        "is_displayed": node.isDisplayFlagSet() if hasattr(node, "isDisplayFlagSet") else None,
+        "cook_info": _collect_cook_info(node, force_cook=True),
+    }
+
+    if include_params:
+        params: Dict[str, Any] = {}
+        for i, parm in enumerate(node.parms()):
+            if i >= max_params:
+                params["_truncated"] = True
+                break
             try:
-                if hasattr(node, "cookState"):
-                    cook_state_obj = node.cookState()
-                    cook_state_name = (
-                        cook_state_obj.name()
-                        if hasattr(cook_state_obj, "name")
-                        else str(cook_state_obj)
-                    )
-                    cook_state_map = {
-                        "Cooked": "cooked",
-                        "CookFailed": "error",
-                        "Dirty": "dirty",
-                        "Uncooked": "uncooked",
-                    }
-                    cook_state = cook_state_map.get(cook_state_name, cook_state_name.lower())
-                elif hasattr(node, "needsToCook"):
-                    # Fallback for Houdini versions without cookState()
-                    needs_cook = node.needsToCook()
-                    cook_state = "dirty" if needs_cook else "cooked"
-                else:
-                    cook_state = "unknown"
+                params[parm.name()] = _json_safe_hou_value(hou, parm.eval())
             except Exception:
+                params[parm.name()] = "<unable to evaluate>"
+        snapshot["parameters"] = params
+
+    if include_geo:
+        geometry = _geometry_stats(node)
+        if geometry is not None and max_sample_points > 0 and geometry["point_count"]:
+            geometry["sample_points"] = _sample_point_positions(
+                node.geometry(), geometry["point_count"], max_sample_points
+            )
+        snapshot["geometry"] = geometry
+
+    return _add_response_metadata(snapshot)
+
+
+def _sample_point_positions(geo: Any, point_count: int, max_samples: int) -> List[Dict[str, Any]]:
+    """
+    Read the positions of the first points of a geometry.
+
+    Args:
+        geo: Houdini geometry object
+        point_count: Number of points in geo
+        max_samples: Number of points wanted (capped at 10000)
+
+    Returns:
+        List of {"index", "P"} dicts
+    """
+    if max_samples > 10000:
+        logger.warning(f"max_sample_points capped at 10000 (was {max_samples})")
+        max_samples = 10000
+    sample_count = min(max_samples, point_count)
+
+    if point_count > 1000000:
+        # Pulling every position across would dwarf one call per sampled point
+        return [{"index": i, "P": list(geo.point(i).position())} for i in range(sample_count)]
+
+    # One round trip for all positions instead of one per point
+    flat = geo.pointFloatAttribValues("P")
+    return [{"index": i, "P": list(flat[i * 3 : i * 3 + 3])} for i in range(sample_count)]
+
+
+def _collect_cook_info(node: Any, force_cook: bool = False) -> Dict[str, Any]:
+    """
+    Collect cook state, errors and warnings for a node.
+
+    Args:
+        node: Houdini node object
+        force_cook: When True, force cook the node before reading its state
+
+    Returns:
+        Dict with cook_state, errors, warnings and (when cooked here) last_cook_time.
+        Failures are reported inside the dict rather than raised.
+    """
+    try:
+        # Force cook if requested
+        if force_cook:
+            node.cook(force=True)
+
+        # Determine cook state using available methods
+        # Houdini 20.5+ doesn't have cookState(), use needsToCook() instead
+        try:
+            if hasattr(node, "cookState"):
+                cook_state_obj = node.cookState()
+                cook_state_name = (
+                    cook_state_obj.name() if hasattr(cook_state_obj, "name") else str(cook_state_obj)
+                )
+                cook_state = _COOK_STATE_MAP.get(cook_state_name, cook_state_name.lower())
+            elif hasattr(node, "needsToCook"):
+                # Fallback for Houdini versions without cookState()
+                needs_cook = node.needsToCook()
+                cook_state = "dirty" if needs_cook else "cooked"
+            else:
                 cook_state = "unknown"
+        except Exception:
+            cook_state = "unknown"
 
-            # Get errors and warnings
-            errors_list: List[Dict[str, str]] = []
-            warnings_list: List[Dict[str, str]] = []
+        # Get errors and warnings. node.path() is an RPC, so it is fetched
+        # once, and only when there is something to report.
+        errors_list: List[Dict[str, str]] = []
+        warnings_list: List[Dict[str, str]] = []
+        node_path: Optional[str] = None
 
-            # Get errors
-            try:
-                node_errors = node.errors()
-                for error_msg in node_errors:
-                    errors_list.append(
-                        {"severity": "error", "message": error_msg, "node_path": node.path()}
-                    )
-            except Exception:
-                pass
+        # Get errors
+        try:
+            node_errors = node.errors()
+            if node_errors:
+                node_path = node.path()
+                errors_list = [
+                    {"severity": "error", "message": error_msg, "node_path": node_path}
+                    for error_msg in node_errors
+                ]
+        except Exception:
+            pass
 
-            # Get warnings
-            try:
-                node_warnings = node.warnings()
-                for warning_msg in node_warnings:
-                    warnings_list.append(
-                        {
-                            "severity": "warning",
-                            "message": warning_msg,
-                            "node_path": node.path(),
-                        }
-                    )
-            except Exception:
-                pass
+        # Get warnings
+        try:
+            node_warnings = node.warnings()
+            if node_warnings:
+                if node_path is None:
+                    node_path = node.path()
+                warnings_list = [
+                    {"severity": "warning", "message": warning_msg, "node_path": node_path}
+                    for warning_msg in node_warnings
+                ]
+        except Exception:
+            pass
 
-            # Build cook info dict
-            cook_info: Dict[str, Any] = {
-                "cook_state": cook_state,
-                "errors": errors_list,
-                "warnings": warnings_list,
-            }
+        # Build cook info dict
+        cook_info: Dict[str, Any] = {
+            "cook_state": cook_state,
+            "errors": errors_list,
+            "warnings": warnings_list,
+        }
 
-            # Try to get last cook time (may not be available on all node types)
-            try:
-                # Houdini doesn't have a direct lastCookTime, but we can check if cooked
-                # For now, we'll skip this or use current time if just cooked
-                if force_cook:
-                    import time
+        # Houdini doesn't have a direct lastCookTime; use current time if just cooked
+        if force_cook:
+            cook_info["last_cook_time"] = time.time()
 
-                    cook_info["last_cook_time"] = time.time()
-            except Exception:
-                pass
+        return cook_info
+
+    except Exception as e:
+        # If we can't get cook info, add error but don't fail the whole request
+        logger.warning(f"Error getting cook info: {e}")
+        return {
+            "cook_state": "unknown",
+            "errors": [{"severity": "error", "message": f"Failed to get cook info: {str(e)}"}],
+            "warnings": [],
+        }
 
-            info["cook_info"] = cook_info
 
-        except Exception as e:
-            # If we can't get cook info, add error but don't fail the whole request
-            logger.warning(f"Error getting cook info: {e}")
-            info["cook_info"] = {
-                "cook_state": "unknown",
-                "errors": [{"severity": "error", "message": f"Failed to get cook info: {str(e)}"}],
-                "warnings": [],
-            }
+def _geometry_stats(node: Any) -> Optional[Dict[str, Any]]:
+    """
+    Read point/primitive/vertex counts and bounding box from a node's geometry.
 
-    return info
+    Uses geometry intrinsics so counts cost one call each regardless of size.
+
+    Args:
+        node: Houdini node object (normally a SOP)
+
+    Returns:
+        Dict with point_count, primitive_count, vertex_count and bounding_box
+        (each None if unavailable), or None if the node has no geometry.
+    """
+    try:
+        geo = node.geometry()
+    except Exception:
+        geo = None
+    if geo is None:
+        return None
+
+    stats: Dict[str, Any] = {}
+    try:
+        stats["point_count"] = geo.intrinsicValue("pointcount")
+        stats["primitive_count"] = geo.intrinsicValue("primitivecount")
+        stats["vertex_count"] = geo.intrinsicValue("vertexcount")
+    except Exception:
+        stats["point_count"] = stats["primitive_count"] = stats["vertex_count"] = None
+
+    try:
+        bbox = geo.boundingBox()
+        stats["bounding_box"] = {
+            "min": list(bbox.minvec()),
+            "max": list(bbox.maxvec()),
+            "size": list(bbox.sizevec()),
+            "center": list(bbox.center()),
+        }
+    except Exception:
+        stats["bounding_box"] = None
+
+    return stats
 
 
 @handle_connection_errors("delete_node")
@@ -287,6 +457,7 @@ def delete_node(node_path: str, host: str = "localhost", port: int = 18811) -> D
 
     node_name = node.name()
     node.destroy()
+    node_schema_cache.invalidate_node(node_path)
 
     return {
         "status": "success",
@@ -400,6 +571,7 @@ def list_children(
     max_depth: int = 10,
     max_nodes: int = 1000,
     compact: bool = False,
+    names: Optional[List[str]] = None,
     host: str = "localhost",
     port: int = 18811,
 ) -> Dict[str, Any]:
@@ -415,10 +587,14 @@ def list_children(
         max_depth: Maximum recursion depth (prevents infinite loops)
         max_nodes: Maximum number of nodes to return (safety limit)
         compact: If True, return only path/name/type without connection details
+        names: Optional list of child names; when given, only matching children
+            are returned (smaller payload when looking up specific nodes)
 
     Returns:
         Dict with child nodes including their connection information.
         When compact=True, inputs/outputs are omitted for reduced payload size.
+        by_name maps each child name to its index in children (first match
+        wins when recursive listing yields duplicate names).
     """
     hou = ensure_connected(host, port)
 
@@ -428,6 +604,7 @@ def list_children(
 
     children_list: List[Dict[str, Any]] = []
     nodes_collected = 0
+    wanted = set(names) if names is not None else None
 
     def collect_children(node: Any, depth: int = 0) -> None:
         nonlocal nodes_collected
@@ -445,11 +622,18 @@ def list_children(
                 if nodes_collected >= max_nodes:
                     break
 
+                child_name = child.name()
+                if wanted is not None and child_name not in wanted:
+                    # Skip building connection info, but keep descending
+                    if recursive:
+                        collect_children(child, depth + 1)
+                    continue
+
                 # Compact mode: only path, name, type
                 if compact:
                     child_info: Dict[str, Any] = {
                         "path": child.path(),
-                        "name": child.name(),
+                        "name": child_name,
                         "type": child.type().name(),
                     }
                 else:
@@ -486,7 +670,7 @@ def list_children(
 
                     child_info = {
                         "path": child.path(),
-                        "name": child.name(),
+                        "name": child_name,
                         "type": child.type().name(),
                         "inputs": input_connections,
                         "outputs": output_paths,
@@ -505,10 +689,15 @@ def list_children(
 
     collect_children(parent)
 
+    by_name: Dict[str, int] = {}
+    for idx, child_info in enumerate(children_list):
+        by_name.setdefault(child_info["name"], idx)
+
     result: Dict[str, Any] = {
         "status": "success",
         "node_path": node_path,
         "children": children_list,
+        "by_name": by_name,
         "count": len(children_list),
     }
 
@@ -4,6 +4,7 @@ This module provides tools for getting and setting parameters on Houdini nodes,
 including parameter schema introspection.
 """
 
+import contextlib
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -12,6 +13,7 @@ from ._common import (
     handle_connection_errors,
     _add_response_metadata,
 )
+from .cache import node_schema_cache
 
 logger = logging.getLogger("houdini_mcp.tools.parameters")
 
@@ -37,32 +39,114 @@ def set_parameter(
     if node is None:
         return {"status": "error", "message": f"Node not found: {node_path}"}
 
+    error = _set_parm_value(node, node_path, param_name, value)
+    if error is not None:
+        return {"status": "error", "message": error}
+
+    node_schema_cache.invalidate_node(node_path)
+
+    return {
+        "status": "success",
+        "node_path": node_path,
+        "param_name": param_name,
+        "value": value,
+    }
+
+
+@handle_connection_errors("set_parameters_bulk")
+def set_parameters_bulk(
+    node_path: str,
+    parms: Dict[str, Any],
+    host: str = "localhost",
+    port: int = 18811,
+) -> Dict[str, Any]:
+    """
+    Set several parameter values on one node in a single tool call.
+
+    The node is looked up once and all values are applied inside one
+    hou.undos.disabler() block, instead of one set_parameter call per value.
+
+    Args:
+        node_path: Path to the node (e.g., "/obj/geo1/sphere1")
+        parms: Mapping of parameter name to value. Tuple parameters take a
+               list/tuple value, as with set_parameter.
+
+    Returns:
+        Dict with:
+        - status: "success" if every value was set, "error" if none was,
+          "partial" otherwise
+        - node_path: Path to the node
+        - updated: List of {name, value} that were set
+        - failed: List of {name, reason} that could not be set
+
+    Example:
+        set_parameters_bulk("/obj/geo1/sphere1", {"rad": [2.0, 2.0, 2.0], "type": 1})
+    """
+    hou = ensure_connected(host, port)
+
+    node = hou.node(node_path)
+    if node is None:
+        return {"status": "error", "message": f"Node not found: {node_path}"}
+
+    updated: List[Dict[str, Any]] = []
+    failed: List[Dict[str, Any]] = []
+
+    undos = getattr(hou, "undos", None)
+    with undos.disabler() if undos is not None else contextlib.nullcontext():
+        for param_name, value in parms.items():
+            try:
+                error = _set_parm_value(node, node_path, param_name, value)
+            except Exception as e:
+                error = str(e)
+            if error is None:
+                updated.append({"name": param_name, "value": value})
+            else:
+                failed.append({"name": param_name, "reason": error})
+
+    if updated:
+        node_schema_cache.invalidate_node(node_path)
+
+    if not failed:
+        status = "success"
+    elif not updated:
+        status = "error"
+    else:
+        status = "partial"
+
+    return {
+        "status": status,
+        "node_path": node_path,
+        "updated": updated,
+        "failed": failed,
+    }
+
+
+def _set_parm_value(node: Any, node_path: str, param_name: str, value: Any) -> Optional[str]:
+    """
+    Set a parameter (or parameter tuple) value on a node.
+
+    Args:
+        node: The Houdini node
+        node_path: Path of the node (for error messages)
+        param_name: Name of the parameter or parameter tuple
+        value: Value to set
+
+    Returns:
+        None on success, otherwise an error message
+    """
     parm = node.parm(param_name)
     if parm is None:
         # Try parmTuple for vector parameters
         parm_tuple = node.parmTuple(param_name)
         if parm_tuple is None:
-            return {
-                "status": "error",
-                "message": f"Parameter not found: {param_name} on {node_path}",
-            }
+            return f"Parameter not found: {param_name} on {node_path}"
         # Set tuple value
-        if isinstance(value, (list, tuple)):
-            parm_tuple.set(value)
-        else:
-            return {
-                "status": "error",
-                "message": f"Parameter {param_name} is a tuple, provide a list/tuple value",
-            }
+        if not isinstance(value, (list, tuple)):
+            return f"Parameter {param_name} is a tuple, provide a list/tuple value"
+        parm_tuple.set(value)
     else:
         parm.set(value)
-
-    return {
-        "status": "success",
-        "node_path": node_path,
-        "param_name": param_name,
-        "value": value,
-    }
+    return None
 
 
 @handle_connection_errors("get_parameter_schema")
@@ -87,7 +171,11 @@ def get_parameter_schema(
         max_parms: Maximum number of parameters to return when parm_name is None (default: 100)
 
     Returns:
-        Dict with parameter schema information.
+        Dict with parameter schema information. Template metadata is cached
+        per node (see cache.NodeSchemaCache) for up to a minute, until the node
+        is modified through set_parameter/create_node/delete_node, execute_code
+        runs, or a different node appears at the path; current_value is
+        evaluated fresh on every call.
 
     Example return for single parameter:
         {
@@ -140,8 +228,23 @@ def get_parameter_schema(
 
     node = hou.node(node_path)
     if node is None:
+        node_schema_cache.invalidate_node(node_path)
         return {"status": "error", "message": f"Node not found: {node_path}"}
 
+    # A node deleted and recreated (e.g. in the UI) under the same path gets a
+    # new session id, so entries fetched from the old node are not reused
+    identity = (node.type().name(), node.sessionId())
+    cached = node_schema_cache.get(hou, node_path, parm_name, max_parms, identity)
+
+    if cached is not None:
+        # Only template metadata is cached; values can change behind our back
+        # (UI edits, other tools, time-dependent expressions), so always re-eval.
+        for param in cached["parameters"]:
+            param["current_value"] = _eval_current_value(
+                hou, node, param["name"], "tuple_size" in param, _json_safe_hou_value
+            )
+        return _add_response_metadata(cached)
+
     parameters: List[Dict[str, Any]] = []
 
     # Get parameter templates - either specific one or all
@@ -213,11 +316,54 @@ def get_parameter_schema(
         "parameters": parameters,
         "count": len(parameters),
     }
+    node_schema_cache.put(
+        hou,
+        node_path,
+        parm_name,
+        max_parms,
+        {
+            **result,
+            "parameters": [
+                {k: v for k, v in param.items() if k != "current_value"} for param in parameters
+            ],
+        },
+        identity,
+    )
 
     # Add response size metadata for large responses
     return _add_response_metadata(result)
 
 
+def _eval_current_value(
+    hou: Any, node: Any, param_name: str, is_tuple: bool, json_safe_fn: Any
+) -> Any:
+    """
+    Evaluate the current value of a parameter, or None if it can't be read.
+
+    Args:
+        hou: The hou module
+        node: The Houdini node
+        param_name: Parameter (or parameter tuple) name
+        is_tuple: Whether to evaluate the whole parameter tuple
+        json_safe_fn: Function to convert values to JSON-safe types
+
+    Returns:
+        JSON-safe current value, or None
+    """
+    try:
+        if is_tuple:
+            parm_tuple = node.parmTuple(param_name)
+            if parm_tuple is not None:
+                return json_safe_fn(hou, list(parm_tuple.eval()))
+        else:
+            parm = node.parm(param_name)
+            if parm is not None:
+                return json_safe_fn(hou, parm.eval())
+    except Exception as e:
+        logger.debug(f"Could not get current value for {param_name}: {e}")
+    return None
+
+
 def _extract_parameter_info(
     hou: Any, node: Any, parm_template: Any, json_safe_fn: Any
 ) -> Optional[Dict[str, Any]]:
@@ -268,22 +414,9 @@ def _extract_parameter_info(
     is_tuple = num_components > 1
 
     # Get current value
-    try:
-        if is_tuple:
-            parm_tuple = node.parmTuple(param_name)
-            if parm_tuple is not None:
-                param_info["current_value"] = json_safe_fn(hou, list(parm_tuple.eval()))
-            else:
-                param_info["current_value"] = None
-        else:
-            parm = node.parm(param_name)
-            if parm is not None:
-                param_info["current_value"] = json_safe_fn(hou, parm.eval())
-            else:
-                param_info["current_value"] = None
-    except Exception as e:
-        logger.debug(f"Could not get current value for {param_name}: {e}")
-        param_info["current_value"] = None
+    param_info["current_value"] = _eval_current_value(
+        hou, node, param_name, is_tuple, json_safe_fn
+    )
 
     # Map Houdini parameter type to friendly string
     type_str = _map_parm_type_to_string(hou, parm_type, is_tuple)
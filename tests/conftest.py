@@ -1,13 +1,35 @@
 """Pytest configuration and fixtures for Houdini MCP tests."""
 
+import itertools
+import socket
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock, patch
-from typing import Any, Dict, List, Optional, Generator
+from typing import Any, Dict, List, Optional, Generator, Sequence, Tuple
+
+
+class MockEnumValue:
+    """Mock hou enum value (e.g. hou.cookState.Cooked); only name() is needed."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+    def __repr__(self) -> str:
+        return f"MockEnumValue({self._name!r})"
 
 
 class MockHouNode:
     """Mock Houdini node object."""
 
+    # Like hou.Node.sessionId(): unique per node object within a session
+    _session_ids = itertools.count(1)
+
     def __init__(
         self,
         path: str = "/obj/geo1",
@@ -19,12 +41,16 @@ class MockHouNode:
     ):
         self._path = path
         self._name = name
+        self._session_id = next(MockHouNode._session_ids)
         self._node_type = node_type
         self._type_description = type_description
         self._children: List["MockHouNode"] = children if children is not None else []
         self._params: Dict[str, Any] = (
             params if params is not None else {"tx": 0.0, "ty": 0.0, "tz": 0.0}
         )
+        self._parm_templates: Dict[str, Any] = {}
+        self._parm_objects: Dict[str, "MockParm"] = {}
+        self._parm_tuple_objects: Dict[str, "MockParmTuple"] = {}
         self._inputs: List[Any] = []
         self._outputs: List[Any] = []
         self._display_flag = True
@@ -36,6 +62,7 @@ class MockHouNode:
         self._errors: List[str] = []
         self._warnings: List[str] = []
         self._last_cook_time: Optional[float] = None
+        self._cook_count = 0
         # Geometry
         self._geometry: Optional["MockGeometry"] = None
         # Parent node (set during createNode)
@@ -54,6 +81,9 @@ class MockHouNode:
     def name(self) -> str:
         return self._name
 
+    def sessionId(self) -> int:
+        return self._session_id
+
     def type(self) -> MagicMock:
         mock_type = MagicMock()
         mock_type.name.return_value = self._node_type
@@ -105,7 +135,7 @@ class MockHouNode:
                 connectors.append((idx, -1))
         return connectors
 
-    def parms(self) -> List[MagicMock]:
+    def parms(self) -> List["MockParm"]:
         mock_parms = []
         for name in self._params.keys():
             parm = self.parm(name)
@@ -113,52 +143,29 @@ class MockHouNode:
                 mock_parms.append(parm)
         return mock_parms
 
-    def parm(self, name: str) -> Optional[MagicMock]:
+    def parm(self, name: str) -> Optional["MockParm"]:
         if name not in self._params:
             return None
+        parm = self._parm_objects.get(name)
+        if parm is None:
+            # Stable objects, so repeated lookups return the same parm
+            parm = self._parm_objects[name] = MockParm(self, name)
+        return parm
 
-        # Return stable mock objects so tests can patch attributes.
-        if not hasattr(self, "_parm_objects"):
-            self._parm_objects = {}
-
-        if name in self._parm_objects:
-            # Keep current value in sync.
-            self._parm_objects[name].eval.return_value = self._params[name]
-            return self._parm_objects[name]
-
-        mock_parm = MagicMock()
-        mock_parm.name.return_value = name
-        mock_parm.eval.return_value = self._params[name]
-
-        def _setter(v: Any, n: str = name) -> None:
-            self._params.update({n: v})
-            mock_parm.eval.return_value = v
-
-        mock_parm.set = _setter
-        self._parm_objects[name] = mock_parm
-        return mock_parm
-
-    def parmTuple(self, name: str) -> Optional[MagicMock]:
+    def parmTuple(self, name: str) -> Optional["MockParmTuple"]:
         if name not in self._params or not isinstance(self._params[name], (list, tuple)):
             return None
+        parm_tuple = self._parm_tuple_objects.get(name)
+        if parm_tuple is None:
+            parm_tuple = self._parm_tuple_objects[name] = MockParmTuple(self, name)
+        return parm_tuple
 
-        if not hasattr(self, "_parm_tuple_objects"):
-            self._parm_tuple_objects = {}
-
-        if name in self._parm_tuple_objects:
-            self._parm_tuple_objects[name].eval.return_value = tuple(self._params[name])
-            return self._parm_tuple_objects[name]
-
-        mock_parm = MagicMock()
-        mock_parm.eval.return_value = tuple(self._params[name])
+    def parmTemplates(self) -> List[Any]:
+        return list(self._parm_templates.values())
 
-        def _setter(v: Any, n: str = name) -> None:
-            self._params.update({n: v})
-            mock_parm.eval.return_value = tuple(v) if isinstance(v, (list, tuple)) else v
-
-        mock_parm.set = _setter
-        self._parm_tuple_objects[name] = mock_parm
-        return mock_parm
+    def setParmTemplates(self, templates: Sequence[Any]) -> None:
+        """Helper to set parm templates; parm(name).parmTemplate() returns the match."""
+        self._parm_templates = {template.name(): template for template in templates}
 
     def createNode(self, node_type: str, name: Optional[str] = None) -> "MockHouNode":
         new_name = name if name else f"{node_type}1"
@@ -231,11 +238,9 @@ class MockHouNode:
             if self not in source_node._outputs:
                 source_node._outputs.append(self)
 
-    def cookState(self) -> MagicMock:
+    def cookState(self) -> MockEnumValue:
         """Return cook state enum."""
-        mock_state = MagicMock()
-        mock_state.name.return_value = self._cook_state
-        return mock_state
+        return MockEnumValue(self._cook_state)
 
     def errors(self) -> List[str]:
         """Return list of error messages."""
@@ -250,12 +255,21 @@ class MockHouNode:
         import time
 
         self._last_cook_time = time.time()
+        self._cook_count += 1
         # If there are errors, state becomes CookFailed
         if self._errors:
             self._cook_state = "CookFailed"
         else:
             self._cook_state = "Cooked"
 
+    def cookCount(self) -> int:
+        """Return how many times the node has cooked."""
+        return self._cook_count
+
+    def needsToCook(self) -> bool:
+        """Return True if the node is dirty or has never cooked."""
+        return self._cook_state in ("Dirty", "Uncooked")
+
     def isCook(self) -> bool:
         """Check if node is currently cooking."""
         return False  # For mock, assume never actively cooking
@@ -330,6 +344,40 @@ class MockHouNode:
         self.setInput(0, node)
 
 
+class MockParm:
+    """Mock hou.Parm reading and writing its node's params."""
+
+    __slots__ = ("_node", "_name")
+
+    def __init__(self, node: MockHouNode, name: str):
+        self._node = node
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+    def eval(self) -> Any:
+        return self._node._params[self._name]
+
+    def set(self, value: Any) -> None:
+        self._node._params[self._name] = value
+
+    def parmTemplate(self) -> Any:
+        return self._node._parm_templates.get(self._name)
+
+
+class MockParmTuple(MockParm):
+    """Mock hou.ParmTuple; eval() returns a tuple."""
+
+    __slots__ = ()
+
+    def eval(self) -> tuple:
+        return tuple(self._node._params[self._name])
+
+    def set(self, value: Any) -> None:
+        self._node._params[self._name] = tuple(value) if isinstance(value, (list, tuple)) else value
+
+
 class MockRpycConnection:
     """Mock rpyc connection object."""
 
@@ -342,6 +390,99 @@ class MockRpycConnection:
         self._closed = True
 
 
+class MockParmTemplate:
+    """Mock hou.ParmTemplate."""
+
+    __slots__ = (
+        "_name",
+        "_label",
+        "_type",
+        "_num_components",
+        "_default_value",
+        "_min_val",
+        "_max_val",
+        "_menu_items",
+        "_menu_labels",
+        "_default_expression",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        parm_type: Any,
+        num_components: int = 1,
+        default_value: Any = None,
+        min_val: Any = None,
+        max_val: Any = None,
+        menu_items: Sequence[str] = (),
+        menu_labels: Sequence[str] = (),
+    ):
+        self._name = name
+        self._label = label
+        self._type = parm_type
+        self._num_components = num_components
+        if default_value is None:
+            default_value = [0.0] * num_components
+        elif not isinstance(default_value, list):
+            default_value = [default_value]
+        self._default_value = default_value
+        self._default_expression = ("",) * num_components
+        self._min_val = min_val
+        self._max_val = max_val
+        # Stored as given; hou returns menu items and labels as tuples
+        self._menu_items = menu_items
+        self._menu_labels = menu_labels
+
+    def name(self) -> str:
+        return self._name
+
+    def label(self) -> str:
+        return self._label
+
+    def type(self) -> Any:
+        return self._type
+
+    def numComponents(self) -> int:
+        return self._num_components
+
+    def defaultValue(self) -> List[Any]:
+        return self._default_value
+
+    def defaultExpression(self) -> Sequence[str]:
+        return self._default_expression
+
+    def minValue(self) -> Any:
+        return self._min_val
+
+    def maxValue(self) -> Any:
+        return self._max_val
+
+    def menuItems(self) -> Sequence[str]:
+        return self._menu_items
+
+    def menuLabels(self) -> Sequence[str]:
+        return self._menu_labels
+
+
+# hou.parmTemplateType enum. The values are plain strings, so one instance
+# is shared by every MockHouModule.
+PARM_TEMPLATE_TYPE = SimpleNamespace(
+    Float="Float",
+    Int="Int",
+    String="String",
+    Toggle="Toggle",
+    Menu="Menu",
+    Button="Button",
+    Ramp="Ramp",
+    Data="Data",
+    Folder="Folder",
+    FolderSet="FolderSet",
+    Separator="Separator",
+    Label="Label",
+)
+
+
 class MockHouModule:
     """Mock hou module for testing."""
 
@@ -374,6 +515,7 @@ class MockHouModule:
         self.cookState.Uncooked.name.return_value = "Uncooked"
 
         # Houdini types
+        self.parmTemplateType = PARM_TEMPLATE_TYPE
         self.Color = MockColor
         self.Vector2 = MockVector2
 
@@ -489,6 +631,26 @@ class MockHouModule:
             del self._nodes[path]
 
 
+@pytest.fixture(autouse=True)
+def _block_network(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail any real outbound socket connection made by a unit test.
+
+    Unit tests must reach Houdini only through the mocks above; a stray
+    connection would otherwise hit a local Houdini on the default port, or
+    slow the suite with refused-connection retries. Integration tests are
+    exempt.
+    """
+    in_integration_dir = request.node.path.parent.name == "integration"
+    if in_integration_dir or request.node.get_closest_marker("integration"):
+        return
+
+    def guarded_connect(self: socket.socket, address: Any) -> None:
+        raise RuntimeError(f"Unit test attempted a real network connection to {address!r}")
+
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    monkeypatch.setattr(socket.socket, "connect_ex", guarded_connect)
+
+
 @pytest.fixture
 def mock_hou() -> MockHouModule:
     """Create a mock hou module."""
@@ -524,10 +686,22 @@ def reset_connection_state() -> Generator[None, None, None]:
     # Reset before
     conn_module._connection = None
     conn_module._hou = None
+    conn_module._active_key = None
+    conn_module._pool.clear()
     yield
     # Reset after
+    conn_module._stop_health_monitor()
     conn_module._connection = None
     conn_module._hou = None
+    conn_module._active_key = None
+    conn_module._pool.clear()
+
+
+@pytest.fixture
+def no_retry_delay() -> Generator[None, None, None]:
+    """Make connect() retry immediately so connection-failure tests don't sleep."""
+    with patch("houdini_mcp.connection._compute_backoff_delay", return_value=0.0):
+        yield
 
 
 @pytest.fixture
@@ -606,6 +780,8 @@ class MockNetworkBox:
 class MockGeoPoint:
     """Mock geometry point."""
 
+    __slots__ = ("_index", "_position", "_attribs")
+
     def __init__(self, index: int, position: tuple, attribs: Optional[Dict[str, Any]] = None):
         self._index = index
         self._position = list(position)
@@ -627,6 +803,8 @@ class MockGeoPoint:
 class MockGeoPrim:
     """Mock geometry primitive."""
 
+    __slots__ = ("_index", "_num_vertices", "_attribs")
+
     def __init__(self, index: int, num_vertices: int = 4, attribs: Optional[Dict[str, Any]] = None):
         self._index = index
         self._num_vertices = num_vertices
@@ -645,6 +823,8 @@ class MockGeoPrim:
 class MockGeoAttrib:
     """Mock geometry attribute."""
 
+    __slots__ = ("_name", "_data_type", "_size")
+
     def __init__(self, name: str, data_type: str, size: int):
         self._name = name
         self._data_type = data_type
@@ -653,11 +833,9 @@ class MockGeoAttrib:
     def name(self) -> str:
         return self._name
 
-    def dataType(self) -> Any:
+    def dataType(self) -> MockEnumValue:
         """Return data type enum."""
-        mock_data_type = MagicMock()
-        mock_data_type.name.return_value = self._data_type
-        return mock_data_type
+        return MockEnumValue(self._data_type)
 
     def size(self) -> int:
         return self._size
@@ -666,6 +844,8 @@ class MockGeoAttrib:
 class MockGeoGroup:
     """Mock geometry group."""
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str):
         self._name = name
 
@@ -676,26 +856,44 @@ class MockGeoGroup:
 class MockBoundingBox:
     """Mock hou.BoundingBox."""
 
+    __slots__ = ("_min", "_max", "_size", "_center")
+
     def __init__(self, min_vec: tuple, max_vec: tuple):
-        self._min = list(min_vec)
-        self._max = list(max_vec)
+        self._min = tuple(min_vec)
+        self._max = tuple(max_vec)
+        # The box is immutable, so derived vectors are computed once
+        self._size = tuple(self._max[i] - self._min[i] for i in range(3))
+        self._center = tuple((self._max[i] + self._min[i]) / 2.0 for i in range(3))
 
     def minvec(self) -> tuple:
-        return tuple(self._min)
+        return self._min
 
     def maxvec(self) -> tuple:
-        return tuple(self._max)
+        return self._max
 
     def sizevec(self) -> tuple:
-        return tuple(self._max[i] - self._min[i] for i in range(3))
+        return self._size
 
     def center(self) -> tuple:
-        return tuple((self._max[i] + self._min[i]) / 2.0 for i in range(3))
+        return self._center
 
 
 class MockGeometry:
     """Mock hou.Geometry object."""
 
+    __slots__ = (
+        "_points",
+        "_prims",
+        "_point_attribs",
+        "_prim_attribs",
+        "_vertex_attribs",
+        "_detail_attribs",
+        "_point_groups",
+        "_prim_groups",
+        "_bbox",
+        "_vertex_count",
+    )
+
     def __init__(self):
         self._points: List[MockGeoPoint] = []
         self._prims: List[MockGeoPrim] = []
@@ -706,6 +904,8 @@ class MockGeometry:
         self._point_groups: List[MockGeoGroup] = []
         self._prim_groups: List[MockGeoGroup] = []
         self._bbox: Optional[MockBoundingBox] = None
+        # Running total kept by addPrim/addPrims so vertexcount is O(1)
+        self._vertex_count = 0
 
     def points(self) -> List[MockGeoPoint]:
         """Return list of points."""
@@ -744,6 +944,28 @@ class MockGeometry:
     def boundingBox(self) -> Optional[MockBoundingBox]:
         return self._bbox
 
+    def intrinsicValue(self, name: str) -> Any:
+        """Return a geometry intrinsic (counts only)."""
+        if name == "pointcount":
+            return len(self._points)
+        if name == "primitivecount":
+            return len(self._prims)
+        if name == "vertexcount":
+            return self._vertex_count
+        raise KeyError(name)
+
+    def pointFloatAttribValues(self, name: str) -> tuple:
+        """Return a point attribute for every point, flattened (P only)."""
+        if name != "P":
+            raise KeyError(name)
+        return tuple(value for pt in self._points for value in pt.position())
+
+    def point(self, index: int) -> Optional[MockGeoPoint]:
+        """Return point by index, or None if out of range."""
+        if 0 <= index < len(self._points):
+            return self._points[index]
+        return None
+
     def addPoint(self, position: tuple, attribs: Optional[Dict[str, Any]] = None) -> MockGeoPoint:
         """Helper to add a point."""
         pt = MockGeoPoint(len(self._points), position, attribs)
@@ -756,8 +978,24 @@ class MockGeometry:
         """Helper to add a primitive."""
         prim = MockGeoPrim(len(self._prims), num_vertices, attribs)
         self._prims.append(prim)
+        self._vertex_count += num_vertices
         return prim
 
+    def addPoints(self, positions: List[tuple]) -> List[MockGeoPoint]:
+        """Helper to add many points in one call."""
+        start = len(self._points)
+        points = [MockGeoPoint(start + i, pos) for i, pos in enumerate(positions)]
+        self._points.extend(points)
+        return points
+
+    def addPrims(self, vertex_counts: List[int]) -> List[MockGeoPrim]:
+        """Helper to add many primitives in one call, one per vertex count."""
+        start = len(self._prims)
+        prims = [MockGeoPrim(start + i, count) for i, count in enumerate(vertex_counts)]
+        self._prims.extend(prims)
+        self._vertex_count += sum(vertex_counts)
+        return prims
+
     def addPointAttrib(self, name: str, data_type: str, size: int) -> MockGeoAttrib:
         """Helper to add point attribute."""
         attrib = MockGeoAttrib(name, data_type, size)
@@ -797,3 +1035,63 @@ class MockGeometry:
     def setBoundingBox(self, min_vec: tuple, max_vec: tuple) -> None:
         """Helper to set bounding box."""
         self._bbox = MockBoundingBox(min_vec, max_vec)
+
+
+def make_geo_node(
+    conn: MockHouModule,
+    path: str,
+    *,
+    node_type: str = "geo",
+    points: Sequence[tuple] = (),
+    prims: Sequence[int] = (),
+    bbox: Optional[Tuple[tuple, tuple]] = None,
+    point_attribs: Sequence[Tuple[str, str, int]] = (),
+    prim_attribs: Sequence[Tuple[str, str, int]] = (),
+    point_groups: Sequence[str] = (),
+    prim_groups: Sequence[str] = (),
+    cook: str = "Cooked",
+    errors: Sequence[str] = (),
+    warnings: Sequence[str] = (),
+) -> Tuple[MockHouNode, MockGeometry]:
+    """
+    Build a node with geometry and register it with the mock hou module.
+
+    Args:
+        conn: The mock hou module (the mock_connection fixture)
+        path: Full node path; the name is its last component
+        node_type: Node type name
+        points: Point positions
+        prims: Vertex count of each primitive
+        bbox: (min, max) bounding box corners, or None for no bounding box
+        point_attribs: (name, data_type, size) for each point attribute
+        prim_attribs: (name, data_type, size) for each primitive attribute
+        point_groups: Point group names
+        prim_groups: Primitive group names
+        cook: Initial cook state name
+        errors: Cook error messages
+        warnings: Cook warning messages
+
+    Returns:
+        The node and its geometry
+    """
+    geo = MockGeometry()
+    geo.addPoints(points)
+    geo.addPrims(prims)
+    if bbox is not None:
+        geo.setBoundingBox(*bbox)
+    for attrib in point_attribs:
+        geo.addPointAttrib(*attrib)
+    for attrib in prim_attribs:
+        geo.addPrimAttrib(*attrib)
+    for name in point_groups:
+        geo.addPointGroup(name)
+    for name in prim_groups:
+        geo.addPrimGroup(name)
+
+    node = MockHouNode(path=path, name=path.rsplit("/", 1)[-1], node_type=node_type)
+    node.setGeometry(geo)
+    node._cook_state = cook
+    node._errors = list(errors)
+    node._warnings = list(warnings)
+    conn.add_node(node)
+    return node, geo
@@ -6,6 +6,10 @@ These tests verify that the example workflows function correctly:
 2. Augment existing scene (insert mountain between grid → noise)
 3. Parameter workflow (discover → set → verify)
 4. Error handling (detect → fix → verify)
+
+The module clears the live Houdini scene once in setup_module and again in
+teardown_module, so tests can create nodes under /obj without per-test
+isolation. Do not point it at a session with unsaved work.
 """
 
 import os
@@ -18,11 +22,14 @@ from houdini_mcp.tools import (
     connect_nodes,
     disconnect_node_input,
     set_parameter,
+    set_parameters_bulk,
     get_node_info,
+    get_node_snapshot,
     get_parameter_schema,
     get_geo_summary,
     list_children,
     set_node_flags,
+    new_scene,
 )
 
 
@@ -50,10 +57,15 @@ def setup_module() -> None:
     host, port = _houdini_target()
     connection.disconnect()
     connection.connect(host, port)
+    # One hipFile.clear() resets all scene state for the whole module
+    assert new_scene(host, port)["status"] == "success"
 
 
 def teardown_module() -> None:
-    connection.disconnect()
+    try:
+        new_scene(*_houdini_target())
+    finally:
+        connection.disconnect()
 
 
 class TestBuildFromScratch:
@@ -73,7 +85,7 @@ class TestBuildFromScratch:
         sphere_path = sphere["node_path"]
         
         # Set sphere radius
-        set_result = set_parameter(sphere_path, "rad", [2.0, 2.0, 2.0])
+        set_result = set_parameters_bulk(sphere_path, {"rad": [2.0, 2.0, 2.0]})
         assert set_result["status"] == "success"
         
         # Create xform
@@ -82,7 +94,7 @@ class TestBuildFromScratch:
         xform_path = xform["node_path"]
         
         # Set translation
-        set_result = set_parameter(xform_path, "t", [0.0, 3.0, 0.0])
+        set_result = set_parameters_bulk(xform_path, {"t": [0.0, 3.0, 0.0]})
         assert set_result["status"] == "success"
         
         # Create color
@@ -91,7 +103,7 @@ class TestBuildFromScratch:
         color_path = color["node_path"]
         
         # Set color to red
-        set_result = set_parameter(color_path, "color", [1.0, 0.0, 0.0])
+        set_result = set_parameters_bulk(color_path, {"color": [1.0, 0.0, 0.0]})
         assert set_result["status"] == "success"
         
         # Create OUT null
@@ -113,10 +125,11 @@ class TestBuildFromScratch:
         flags = set_node_flags(out_path, display=True, render=True)
         assert flags["status"] == "success"
         
-        # Verify with get_geo_summary
-        summary = get_geo_summary(out_path, max_sample_points=10)
-        assert summary["status"] == "success"
-        assert summary["cook_state"] == "cooked"
+        # Verify with a single snapshot (cook state + geometry)
+        snapshot = get_node_snapshot(out_path)
+        assert snapshot["status"] == "success"
+        assert snapshot["cook_info"]["cook_state"] == "cooked"
+        summary = snapshot["geometry"]
         assert summary["point_count"] > 0
         
         # Verify bounding box reflects translation (Y center ≈ 3.0)
@@ -135,22 +148,23 @@ class TestAugmentExistingScene:
         geo_result = create_node("geo", "/obj", "test_augment")
         geo_path = geo_result["node_path"]
         
-        grid = create_node("grid", geo_path, "grid1")
+        # grid and noise are independent - overlap their round trips
+        grid_future = connection.call_async(create_node, "grid", geo_path, "grid1")
+        noise_future = connection.call_async(create_node, "attribnoise", geo_path, "noise1")
+        grid = grid_future.result()
+        noise = noise_future.result()
         grid_path = grid["node_path"]
-        noise = create_node("attribnoise", geo_path, "noise1")
-
         noise_path = noise["node_path"]
         
         # Wire grid → noise
         connect_nodes(grid_path, noise_path)
         
-        # Verify initial connection using list_children
-        children = list_children(geo_path)
+        # Verify initial connection, fetching only the noise node
+        children = list_children(geo_path, names=["noise1"])
         assert children["status"] == "success"
-        assert children["count"] == 2
+        assert children["count"] == 1
         
-        # Find noise node in children
-        noise_child = next(c for c in children["children"] if c["name"] == "noise1")
+        noise_child = children["children"][0]
         assert len(noise_child["inputs"]) == 1
         assert noise_child["inputs"][0]["source_node"] == grid_path
         
@@ -158,16 +172,18 @@ class TestAugmentExistingScene:
         geo_before = get_geo_summary(noise_path, max_sample_points=0)
         assert geo_before["status"] == "success"
         
-        # Create mountain node
-        mountain = create_node("mountain", geo_path, "mountain1")
+        # Create mountain node and disconnect noise from grid (independent, overlapped)
+        mountain_future = connection.call_async(create_node, "mountain", geo_path, "mountain1")
+        disconnect_future = connection.call_async(disconnect_node_input, noise_path, 0)
+        mountain = mountain_future.result()
+        disconnect_result = disconnect_future.result()
         mountain_path = mountain["node_path"]
         
         # Set mountain height
         set_parameter(mountain_path, "height", 2.0)
         
         # Insert mountain: grid → mountain → noise
-        # 1. Disconnect noise from grid
-        disconnect_result = disconnect_node_input(noise_path, 0)
+        # 1. Noise was disconnected from grid above
         assert disconnect_result["status"] == "success"
         assert disconnect_result["was_connected"] == True
         
@@ -177,15 +193,12 @@ class TestAugmentExistingScene:
         # 3. Connect mountain → noise
         connect_nodes(mountain_path, noise_path)
         
-        # Verify new connections with get_node_info
-        noise_info = get_node_info(noise_path, include_input_details=True)
+        # Verify new connections and geometry AFTER mountain in one snapshot
+        noise_info = get_node_snapshot(noise_path)
         assert noise_info["status"] == "success"
         assert len(noise_info["input_connections"]) == 1
         assert noise_info["input_connections"][0]["source_node"] == mountain_path
-        
-        # Get geometry AFTER mountain
-        geo_after = get_geo_summary(noise_path, max_sample_points=0)
-        assert geo_after["status"] == "success"
+        geo_after = noise_info["geometry"]
         
         # Verify geometry changed (mountain should affect bounding box)
         if geo_before.get("bounding_box") and geo_after.get("bounding_box"):
@@ -232,8 +245,8 @@ class TestParameterWorkflow:
         set_result = set_parameter(sphere_path, "rad", new_radius)
         assert set_result["status"] == "success"
         
-        # Verify parameter was set
-        node_info = get_node_info(sphere_path, include_params=True)
+        # Verify parameter was set and geometry reflects it in one snapshot
+        node_info = get_node_snapshot(sphere_path, include_params=True)
         assert node_info["status"] == "success"
         
         # Check individual components
@@ -241,9 +254,7 @@ class TestParameterWorkflow:
         assert abs(node_info["parameters"]["rady"] - 3.0) < 0.001
         assert abs(node_info["parameters"]["radz"] - 3.0) < 0.001
         
-        # Verify geometry reflects parameter change
-        geo_summary = get_geo_summary(sphere_path, max_sample_points=0)
-        assert geo_summary["status"] == "success"
+        geo_summary = node_info["geometry"]
         
         # Sphere diameter should be ~6.0 (radius 3.0)
         if geo_summary.get("bounding_box"):
@@ -276,108 +287,136 @@ class TestParameterWorkflow:
         assert set_result["status"] == "success"
 
 
+# Error scenarios for Example 4 (detect → fix → verify).
+#
+# Each scenario is a (name, setup, check) row. setup receives the shared geo
+# container path and returns a context dict; check receives that context and
+# performs the detect/fix/verify assertions. Node names are prefixed with the
+# scenario name so every row can share one container.
+
+
+def setup_missing_input(geo_path: str) -> dict:
+    # Create noise without input
+    noise = create_node("attribnoise", geo_path, "missing_input_noise1")
+    return {"geo_path": geo_path, "noise_path": noise["node_path"]}
+
+
+def check_missing_input(ctx: dict) -> None:
+    """Detect when a node has no input (where one is expected)."""
+    noise_path = ctx["noise_path"]
+
+    # Check cook state and point count from the same cook
+    noise_info = get_node_info(
+        noise_path, include_errors=True, force_cook=True, include_geo_stats=True
+    )
+    assert noise_info["status"] == "success"
+    assert "cook_info" in noise_info
+
+    # Noise without input won't error, but has no geometry
+    assert noise_info["cook_info"]["point_count"] == 0
+
+    # Fix: Add grid input
+    grid = create_node("grid", ctx["geo_path"], "missing_input_grid1")
+    connect_nodes(grid["node_path"], noise_path)
+
+    # Verify fix
+    snapshot = get_node_snapshot(noise_path)
+    assert snapshot["status"] == "success"
+    assert snapshot["geometry"]["point_count"] > 0, "Should have points after connecting input"
+
+
+def setup_bad_parm_type(geo_path: str) -> dict:
+    sphere = create_node("sphere", geo_path, "bad_parm_type_sphere1")
+    return {"sphere_path": sphere["node_path"]}
+
+
+def check_bad_parm_type(ctx: dict) -> None:
+    """Test that invalid parameter types are rejected."""
+    sphere_path = ctx["sphere_path"]
+
+    # Try to set vector parameter with scalar (should fail)
+    bad_result = set_parameter(sphere_path, "rad", 5.0)
+    assert bad_result["status"] == "error"
+    assert "tuple" in bad_result["message"].lower()
+
+    # Use schema to find correct type
+    schema = get_parameter_schema(sphere_path, parm_name="rad")
+    assert schema["status"] == "success"
+
+    param = schema["parameters"][0]
+    assert param["type"] == "vector"
+
+    # Set with correct type
+    good_result = set_parameter(sphere_path, "rad", [5.0, 5.0, 5.0])
+    assert good_result["status"] == "success"
+
+
+def setup_incompatible_connection(geo_path: str) -> dict:
+    # Create SOP node
+    grid = create_node("grid", geo_path, "incompatible_grid1")
+    # Create OBJ node
+    cam = create_node("cam", "/obj", "test_cam1")
+    return {"grid_path": grid["node_path"], "cam_path": cam["node_path"]}
+
+
+def check_incompatible_connection(ctx: dict) -> None:
+    """Test that incompatible node types can't be connected."""
+    # Try to connect SOP to OBJ (should fail)
+    bad_conn = connect_nodes(ctx["grid_path"], ctx["cam_path"])
+    assert bad_conn["status"] == "error"
+    assert "incompatible" in bad_conn["message"].lower() or "category" in bad_conn["message"].lower()
+
+
+def setup_safe_access(geo_path: str) -> dict:
+    box = create_node("box", geo_path, "safe_access_box1")
+    return {"box_path": box["node_path"]}
+
+
+def check_safe_access(ctx: dict) -> None:
+    """Test the safe pattern: check cook state before accessing geometry."""
+    box_path = ctx["box_path"]
+
+    # Step 1: Check cook state, collecting geometry stats in the same call
+    node_info = get_node_info(
+        box_path, include_errors=True, force_cook=True, include_geo_stats=True
+    )
+    assert node_info["status"] == "success"
+    assert "cook_info" in node_info
+
+    cook_state = node_info["cook_info"]["cook_state"]
+
+    # Step 2: Only trust geometry if cooked
+    if cook_state == "cooked":
+        assert node_info["cook_info"]["point_count"] > 0
+    else:
+        pytest.skip(f"Node not cooked (state: {cook_state}), can't test geometry access")
+
+
+ERROR_CASES = [
+    ("MISSING_INPUT", setup_missing_input, check_missing_input),
+    ("BAD_PARM_TYPE", setup_bad_parm_type, check_bad_parm_type),
+    ("INCOMPATIBLE_CONNECTION", setup_incompatible_connection, check_incompatible_connection),
+    ("SAFE_ACCESS", setup_safe_access, check_safe_access),
+]
+
+
 class TestErrorHandling:
     """Test Example 4: Error detection, diagnosis, and fixing."""
-    
-    def test_detect_missing_input_error(self):
-        """Detect when a node has no input (where one is expected)."""
-        
+
+    @pytest.fixture(scope="class")
+    def geo_container(self) -> str:
+        """One geo container shared by every error scenario."""
         geo_result = create_node("geo", "/obj", "test_errors")
-        geo_path = geo_result["node_path"]
-        
-        # Create noise without input
-        noise = create_node("attribnoise", geo_path, "noise1")
-        noise_path = noise["node_path"]
-        
-        # Check cook state
-        noise_info = get_node_info(noise_path, include_errors=True, force_cook=True)
-        assert noise_info["status"] == "success"
-        assert "cook_info" in noise_info
-        
-        # Noise without input won't error, but has no geometry
-        geo = get_geo_summary(noise_path, max_sample_points=0)
-        if geo.get("status") == "success":
-            # Should have 0 points (no input)
-            assert geo["point_count"] == 0
-        
-        # Fix: Add grid input
-        grid = create_node("grid", geo_path, "grid1")
-        grid_path = grid["node_path"]
-        
-        connect_nodes(grid_path, noise_path)
-        
-        # Verify fix
-        geo_after = get_geo_summary(noise_path, max_sample_points=0)
-        assert geo_after["status"] == "success"
-        assert geo_after["point_count"] > 0, "Should have points after connecting input"
-    
-    def test_invalid_parameter_type_error(self):
-        """Test that invalid parameter types are rejected."""
-        
-        geo_result = create_node("geo", "/obj", "test_param_errors")
-        geo_path = geo_result["node_path"]
-        
-        sphere = create_node("sphere", geo_path, "sphere1")
-        sphere_path = sphere["node_path"]
-        
-        # Try to set vector parameter with scalar (should fail)
-        bad_result = set_parameter(sphere_path, "rad", 5.0)
-        assert bad_result["status"] == "error"
-        assert "tuple" in bad_result["message"].lower()
-        
-        # Use schema to find correct type
-        schema = get_parameter_schema(sphere_path, parm_name="rad")
-        assert schema["status"] == "success"
-        
-        param = schema["parameters"][0]
-        assert param["type"] == "vector"
-        
-        # Set with correct type
-        good_result = set_parameter(sphere_path, "rad", [5.0, 5.0, 5.0])
-        assert good_result["status"] == "success"
-    
-    def test_incompatible_node_connection_error(self):
-        """Test that incompatible node types can't be connected."""
-        
-        # Create SOP node
-        geo_result = create_node("geo", "/obj", "test_incompatible")
-        geo_path = geo_result["node_path"]
-        
-        grid = create_node("grid", geo_path, "grid1")
-        grid_path = grid["node_path"]
-        
-        # Create OBJ node
-        cam = create_node("cam", "/obj", "cam1")
-        cam_path = cam["node_path"]
-        
-        # Try to connect SOP to OBJ (should fail)
-        bad_conn = connect_nodes(grid_path, cam_path)
-        assert bad_conn["status"] == "error"
-        assert "incompatible" in bad_conn["message"].lower() or "category" in bad_conn["message"].lower()
-    
-    def test_safe_geometry_access_pattern(self):
-        """Test the safe pattern: check cook state before accessing geometry."""
-        
-        geo_result = create_node("geo", "/obj", "test_safe_access")
-        geo_path = geo_result["node_path"]
-        
-        box = create_node("box", geo_path, "box1")
-        box_path = box["node_path"]
-        
-        # Step 1: Check cook state first
-        node_info = get_node_info(box_path, include_errors=True, force_cook=True)
-        assert node_info["status"] == "success"
-        assert "cook_info" in node_info
-        
-        cook_state = node_info["cook_info"]["cook_state"]
-        
-        # Step 2: Only access geometry if cooked
-        if cook_state == "cooked":
-            geo = get_geo_summary(box_path, max_sample_points=0)
-            assert geo["status"] == "success"
-            assert geo["point_count"] > 0
-        else:
-            pytest.skip(f"Node not cooked (state: {cook_state}), can't test geometry access")
+        assert geo_result["status"] == "success"
+        return geo_result["node_path"]
+
+    @pytest.mark.parametrize(
+        "name,setup,check", ERROR_CASES, ids=[case[0] for case in ERROR_CASES]
+    )
+    def test_error_scenario(self, geo_container, name, setup, check):
+        """Run one detect → fix → verify scenario in the shared container."""
+        ctx = setup(geo_container)
+        check(ctx)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""Lightweight typed stand-ins for connection-level test doubles.
+
+These replace ``MagicMock`` where a test only needs a fixed behaviour
+(an RPC that fails, a close() that raises) and never inspects call history
+through the mock API.
+"""
+
+from typing import Any, Optional, Tuple
+
+
+class LiveHou:
+    """Remote hou module that answers version queries and counts RPCs."""
+
+    def __init__(self) -> None:
+        self.version_calls = 0
+
+    def applicationVersion(self) -> Tuple[int, int, int]:
+        self.version_calls += 1
+        return (20, 5, 123)
+
+    def applicationVersionString(self) -> str:
+        return "20.5.123"
+
+
+class DeadHou:
+    """Remote hou module whose every RPC fails as if the connection dropped."""
+
+    def __init__(self, error: Exception = ConnectionError("Dead")) -> None:
+        self._error = error
+
+    def applicationVersion(self) -> Tuple[int, int, int]:
+        raise self._error
+
+    def applicationVersionString(self) -> str:
+        raise self._error
+
+
+class StubConnection:
+    """rpyc connection with an explicit ``closed`` flag that counts close() calls."""
+
+    def __init__(self, closed: bool = False) -> None:
+        self.closed = closed
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+        self.closed = True
+
+
+class DeadConnection(StubConnection):
+    """rpyc connection whose close() fails."""
+
+    def close(self) -> None:
+        self.close_calls += 1
+        raise EOFError("Close failed")
+
+
+class FlakyConnect:
+    """Stand-in for rpyc.classic.connect that fails a set number of times.
+
+    Raises ``error`` on the first ``fail_first_n`` calls (every call when
+    ``fail_first_n`` is None), then returns ``returns``. ``calls`` counts
+    every invocation.
+    """
+
+    def __init__(
+        self,
+        returns: Any = None,
+        error: Exception = ConnectionError("Connection refused"),
+        fail_first_n: Optional[int] = None,
+    ) -> None:
+        self.returns = returns
+        self.error = error
+        self.fail_first_n = fail_first_n
+        self.calls = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        if self.fail_first_n is None or self.calls <= self.fail_first_n:
+            raise self.error
+        return self.returns
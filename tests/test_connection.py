@@ -1,7 +1,10 @@
 """Tests for the Houdini connection manager."""
 
+import random
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from houdini_mcp.connection import (
     HoudiniConnectionError,
@@ -14,7 +17,11 @@ from houdini_mcp.connection import (
     ping,
     get_hou,
     get_connection,
+    _compute_backoff_delay,
+    call_async,
 )
+from tests.conftest import MockHouModule, MockRpycConnection
+from tests.stubs import DeadConnection, DeadHou, FlakyConnect, LiveHou, StubConnection
 
 
 class TestConnect:
@@ -37,96 +44,86 @@ class TestConnect:
 
     def test_connect_with_retry_success_on_second_attempt(self, reset_connection_state, mock_hou):
         """Test connection retry logic succeeds on second attempt."""
-        from tests.conftest import MockRpycConnection
-
-        mock_conn = MockRpycConnection(mock_hou)
-
-        call_count = [0]
-
-        def mock_connect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise ConnectionError("Connection refused")
-            return mock_conn
+        fake_connect = FlakyConnect(returns=MockRpycConnection(mock_hou), fail_first_n=1)
 
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-            mock_rpyc.classic.connect = mock_connect
+            mock_rpyc.classic.connect = fake_connect
             connection, hou = connect("localhost", 18811, max_retries=3, retry_delay=0.01)
 
-        assert call_count[0] == 2  # Failed once, succeeded on retry
+        assert fake_connect.calls == 2  # Failed once, succeeded on retry
         assert hou is not None
 
     def test_connect_all_retries_fail(self, reset_connection_state):
         """Test connection failure after all retries exhausted."""
+        fake_connect = FlakyConnect()
+
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-            mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
+            mock_rpyc.classic.connect = fake_connect
 
             with pytest.raises(HoudiniConnectionError) as exc_info:
                 connect("localhost", 18811, max_retries=2, retry_delay=0.01)
 
+        assert fake_connect.calls == 2
         assert "Failed to connect" in str(exc_info.value)
         assert "after 2 attempts" in str(exc_info.value)
 
     def test_connect_exponential_backoff(self, reset_connection_state, mock_hou):
         """Test that retry delay doubles each attempt (exponential backoff)."""
-        from tests.conftest import MockRpycConnection
-        import time
+        fake_connect = FlakyConnect(returns=MockRpycConnection(mock_hou), fail_first_n=2)
+
+        # Record the requested delays instead of sleeping, so the test does
+        # not depend on wall-clock timing
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc, patch(
+            "houdini_mcp.connection.time.sleep"
+        ) as mock_sleep:
+            mock_rpyc.classic.connect = fake_connect
+            connect("localhost", 18811, max_retries=3, retry_delay=0.05, jitter=False)
 
-        mock_conn = MockRpycConnection(mock_hou)
-        call_times = []
+        assert fake_connect.calls == 3
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.05, 0.1])
 
-        def mock_connect(*args, **kwargs):
-            call_times.append(time.time())
-            if len(call_times) < 3:
-                raise ConnectionError("Connection refused")
-            return mock_conn
+    def test_connect_caps_retry_delay(self, reset_connection_state):
+        """Test individual retry delays never exceed max_delay."""
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc, patch(
+            "houdini_mcp.connection.time.sleep"
+        ) as mock_sleep:
+            mock_rpyc.classic.connect = FlakyConnect()
 
-        with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-            mock_rpyc.classic.connect = mock_connect
-            connect("localhost", 18811, max_retries=3, retry_delay=0.05, jitter=False)
+            with pytest.raises(HoudiniConnectionError):
+                connect("localhost", 18811, max_retries=5, retry_delay=1.0, max_delay=2.5)
 
-        assert len(call_times) == 3
-        # Second delay should be ~2x the first
-        delay1 = call_times[1] - call_times[0]
-        delay2 = call_times[2] - call_times[1]
-        assert delay2 > delay1 * 1.5  # Allow some tolerance
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 4
+        assert max(delays) <= 2.5 * 1.1
 
-    def test_connect_with_jitter(self, reset_connection_state, mock_hou):
-        """Test that jitter adds randomness to retry delays."""
-        from tests.conftest import MockRpycConnection
-        import time
+    def test_connect_stops_at_total_wait_budget(self, reset_connection_state):
+        """Test retrying stops instead of sleeping past max_total_wait."""
+        fake_connect = FlakyConnect()
 
-        mock_conn = MockRpycConnection(mock_hou)
-        delays = []
-
-        def mock_connect(*args, **kwargs):
-            delays.append(time.time())
-            if len(delays) < 3:
-                raise ConnectionError("Connection refused")
-            return mock_conn
-
-        # Run multiple times to check jitter introduces variance
-        all_delay_diffs = []
-        for _ in range(3):
-            delays.clear()
-            with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-                mock_rpyc.classic.connect = mock_connect
-                connect("localhost", 18811, max_retries=3, retry_delay=0.1, jitter=True)
-
-            if len(delays) >= 2:
-                all_delay_diffs.append(delays[1] - delays[0])
-
-        # With jitter, delays should vary slightly between runs
-        # Check that we got some variance (not all identical)
-        if len(all_delay_diffs) >= 2:
-            # Just verify the mechanism works - delays should be > base_delay
-            assert all(d >= 0.09 for d in all_delay_diffs)  # Allow small timing variance
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc, patch(
+            "houdini_mcp.connection.time.sleep"
+        ) as mock_sleep:
+            mock_rpyc.classic.connect = fake_connect
+
+            with pytest.raises(HoudiniConnectionError) as exc_info:
+                connect(
+                    "localhost",
+                    18811,
+                    max_retries=10,
+                    retry_delay=1.0,
+                    jitter=False,
+                    max_total_wait=0.5,
+                )
+
+        # The first 1s delay already exceeds the 0.5s budget
+        assert fake_connect.calls == 1
+        mock_sleep.assert_not_called()
+        assert "after 1 attempts" in str(exc_info.value)
 
     def test_connect_custom_host_port(self, mock_rpyc_with_reset):
         """Test connect with custom host and port."""
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-            from tests.conftest import MockRpycConnection, MockHouModule
-
             mock_hou = MockHouModule()
             mock_conn = MockRpycConnection(mock_hou)
             mock_rpyc.classic.connect.return_value = mock_conn
@@ -136,6 +133,56 @@ class TestConnect:
             mock_rpyc.classic.connect.assert_called_with("192.168.1.100", 19999)
 
 
+class TestNetworkGuard:
+    """Tests for the conftest guard against real connections in unit tests."""
+
+    def test_real_socket_connect_is_blocked(self):
+        """Test an unmocked connection attempt fails instead of reaching the network."""
+        import socket
+
+        with pytest.raises(RuntimeError, match="real network connection"):
+            socket.create_connection(("localhost", 18811), timeout=0.1)
+
+
+class TestComputeBackoffDelay:
+    """Tests for the retry delay schedule used by connect()."""
+
+    def test_delay_doubles_without_jitter(self):
+        """Test that delays grow exponentially from the base delay."""
+        delays = [_compute_backoff_delay(i, 0.1, False) for i in range(4)]
+
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.8])
+
+    def test_delay_is_capped(self):
+        """Test that delays never exceed max_delay before jitter."""
+        delay = _compute_backoff_delay(10, 1.0, False, max_delay=5.0)
+
+        assert delay == 5.0
+
+    def test_jitter_bounds(self):
+        """Test that jitter adds at most 10% on top of the base schedule."""
+        rng = random.Random(42)
+
+        for attempt in range(5):
+            base = 0.1 * 2**attempt
+            delay = _compute_backoff_delay(attempt, 0.1, True, rng)
+            assert base <= delay <= base * 1.1
+
+    def test_jitter_is_deterministic_with_seeded_rng(self):
+        """Test that the same seed yields the same schedule."""
+        first = [_compute_backoff_delay(i, 0.1, True, random.Random(42)) for i in range(3)]
+        second = [_compute_backoff_delay(i, 0.1, True, random.Random(42)) for i in range(3)]
+
+        assert first == second
+
+    def test_jitter_schedule_is_monotonic(self):
+        """Test that jittered delays still grow attempt over attempt."""
+        rng = random.Random(42)
+        delays = [_compute_backoff_delay(i, 0.1, True, rng) for i in range(3)]
+
+        assert delays[0] < delays[1] < delays[2]
+
+
 class TestIsConnected:
     """Tests for the is_connected function."""
 
@@ -154,10 +201,8 @@ class TestIsConnected:
         import houdini_mcp.connection as conn_module
 
         # Set up a connection that will fail validation
-        mock_hou = MagicMock()
-        mock_hou.applicationVersion.side_effect = ConnectionError("Dead")
-        conn_module._connection = MagicMock()
-        conn_module._hou = mock_hou
+        conn_module._connection = StubConnection()
+        conn_module._hou = DeadHou()
 
         # Use validate=True to trigger RPC validation
         result = is_connected(validate=True)
@@ -170,10 +215,8 @@ class TestIsConnected:
         """Test is_connected cleans up global state on failure."""
         import houdini_mcp.connection as conn_module
 
-        mock_hou = MagicMock()
-        mock_hou.applicationVersion.side_effect = Exception("Connection lost")
-        conn_module._connection = MagicMock()
-        conn_module._hou = mock_hou
+        conn_module._connection = StubConnection()
+        conn_module._hou = DeadHou(Exception("Connection lost"))
 
         # Use validate=True to trigger RPC validation
         is_connected(validate=True)
@@ -185,17 +228,57 @@ class TestIsConnected:
         """Test that is_connected() without validate does no RPC call."""
         import houdini_mcp.connection as conn_module
 
-        mock_hou = MagicMock()
-        conn_module._connection = MagicMock()
-        conn_module._connection.closed = False  # Explicitly set to False
-        conn_module._hou = mock_hou
+        live_hou = LiveHou()
+        conn_module._connection = StubConnection(closed=False)
+        conn_module._hou = live_hou
 
         # Default is_connected() should not call applicationVersion
         result = is_connected()
 
         assert result is True
         # Verify no RPC call was made
-        mock_hou.applicationVersion.assert_not_called()
+        assert live_hou.version_calls == 0
+
+    def test_is_connected_validate_reuses_recent_result(self, reset_connection_state):
+        """Test back-to-back validations on one thread make a single RPC."""
+        import houdini_mcp.connection as conn_module
+
+        live_hou = LiveHou()
+        conn_module._connection = StubConnection(closed=False)
+        conn_module._hou = live_hou
+
+        assert is_connected(validate=True) is True
+        assert is_connected(validate=True) is True
+
+        assert live_hou.version_calls == 1
+
+    def test_is_connected_validate_force_bypasses_cache(self, reset_connection_state):
+        """Test force=True always performs the validation RPC."""
+        import houdini_mcp.connection as conn_module
+
+        live_hou = LiveHou()
+        conn_module._connection = StubConnection(closed=False)
+        conn_module._hou = live_hou
+
+        is_connected(validate=True)
+        is_connected(validate=True, force=True)
+
+        assert live_hou.version_calls == 2
+
+    def test_is_connected_validate_cache_is_per_thread(self, reset_connection_state):
+        """Test a validation on one thread is not reused by another."""
+        import houdini_mcp.connection as conn_module
+
+        live_hou = LiveHou()
+        conn_module._connection = StubConnection(closed=False)
+        conn_module._hou = live_hou
+
+        is_connected(validate=True)
+        worker = threading.Thread(target=is_connected, kwargs={"validate": True})
+        worker.start()
+        worker.join()
+
+        assert live_hou.version_calls == 2
 
 
 class TestDisconnect:
@@ -214,10 +297,8 @@ class TestDisconnect:
         """Test disconnect handles close errors gracefully."""
         import houdini_mcp.connection as conn_module
 
-        mock_conn = MagicMock()
-        mock_conn.close.side_effect = Exception("Close failed")
-        conn_module._connection = mock_conn
-        conn_module._hou = MagicMock()
+        conn_module._connection = DeadConnection()
+        conn_module._hou = LiveHou()
 
         # Should not raise
         disconnect()
@@ -239,13 +320,13 @@ class TestDisconnect:
         """Test disconnect calls close on connection."""
         import houdini_mcp.connection as conn_module
 
-        mock_conn = MagicMock()
-        conn_module._connection = mock_conn
-        conn_module._hou = MagicMock()
+        stub_conn = StubConnection()
+        conn_module._connection = stub_conn
+        conn_module._hou = LiveHou()
 
         disconnect()
 
-        mock_conn.close.assert_called_once()
+        assert stub_conn.close_calls == 1
 
 
 class TestEnsureConnected:
@@ -265,8 +346,6 @@ class TestEnsureConnected:
     def test_ensure_connected_uses_provided_host_port(self, reset_connection_state):
         """Test ensure_connected uses provided host and port."""
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
-            from tests.conftest import MockRpycConnection, MockHouModule
-
             mock_hou = MockHouModule()
             mock_conn = MockRpycConnection(mock_hou)
             mock_rpyc.classic.connect.return_value = mock_conn
@@ -276,6 +355,169 @@ class TestEnsureConnected:
             mock_rpyc.classic.connect.assert_called_with("custom-host", 12345)
 
 
+class TestConnectionPool:
+    """Tests for reuse of pooled connections keyed by (host, port)."""
+
+    def test_connect_reuses_live_pooled_connection(self, reset_connection_state):
+        """Test a second connect to the same target skips the handshake."""
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
+            mock_rpyc.classic.connect.return_value = MockRpycConnection(MockHouModule())
+
+            first = connect("localhost", 18811)
+            second = connect("localhost", 18811)
+
+        assert mock_rpyc.classic.connect.call_count == 1
+        assert second == first
+
+    def test_connect_drops_dead_pooled_connection(self, reset_connection_state):
+        """Test a closed pooled connection is replaced by a fresh one."""
+        import houdini_mcp.connection as conn_module
+
+        conn_module._pool[("localhost", 18811)] = (StubConnection(closed=True), LiveHou())
+
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
+            fresh = MockRpycConnection(MockHouModule())
+            mock_rpyc.classic.connect.return_value = fresh
+
+            conn, _ = connect("localhost", 18811)
+
+        assert conn is fresh
+        assert conn_module._pool[("localhost", 18811)][0] is fresh
+
+    def test_ensure_connected_switches_between_targets(self, reset_connection_state):
+        """Test ensure_connected activates the pooled connection for each target."""
+        import houdini_mcp.connection as conn_module
+
+        hou_a, hou_b = LiveHou(), LiveHou()
+        conn_module._pool[("host-a", 1)] = (StubConnection(), hou_a)
+        conn_module._pool[("host-b", 2)] = (StubConnection(), hou_b)
+
+        with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
+            assert ensure_connected("host-a", 1) is hou_a
+            assert ensure_connected("host-b", 2) is hou_b
+            assert ensure_connected("host-a", 1) is hou_a
+
+        mock_rpyc.classic.connect.assert_not_called()
+
+    def test_disconnect_single_target(self, reset_connection_state):
+        """Test disconnect(host, port) closes only that pooled connection."""
+        import houdini_mcp.connection as conn_module
+
+        conn_a, conn_b = StubConnection(), StubConnection()
+        conn_module._pool[("host-a", 1)] = (conn_a, LiveHou())
+        conn_module._pool[("host-b", 2)] = (conn_b, LiveHou())
+
+        disconnect("host-a", 1)
+
+        assert conn_a.close_calls == 1
+        assert conn_b.close_calls == 0
+        assert list(conn_module._pool) == [("host-b", 2)]
+
+    @pytest.mark.parametrize("target", [{"host": "host-a"}, {"port": 1}])
+    def test_disconnect_rejects_partial_target(self, reset_connection_state, target):
+        """Test disconnect() with only host or only port closes nothing."""
+        import houdini_mcp.connection as conn_module
+
+        conn_a = StubConnection()
+        conn_module._pool[("host-a", 1)] = (conn_a, LiveHou())
+
+        with pytest.raises(ValueError):
+            disconnect(**target)
+
+        assert conn_a.close_calls == 0
+        assert list(conn_module._pool) == [("host-a", 1)]
+
+    def test_disconnect_all_closes_every_pooled_connection(self, reset_connection_state):
+        """Test disconnect() with no target closes the whole pool."""
+        import houdini_mcp.connection as conn_module
+
+        conn_a, conn_b = StubConnection(), StubConnection()
+        conn_module._pool[("host-a", 1)] = (conn_a, LiveHou())
+        conn_module._pool[("host-b", 2)] = (conn_b, LiveHou())
+
+        disconnect()
+
+        assert conn_a.close_calls == 1
+        assert conn_b.close_calls == 1
+        assert conn_module._pool == {}
+
+
+class TestHealthMonitor:
+    """Tests for the background ping of pooled connections."""
+
+    def test_check_pool_health_evicts_dead_connections(self, reset_connection_state):
+        """Test a pooled connection whose ping fails is closed and removed."""
+        import houdini_mcp.connection as conn_module
+
+        live_conn, dead_conn = StubConnection(), StubConnection()
+        conn_module._pool[("live", 1)] = (live_conn, LiveHou())
+        conn_module._pool[("dead", 2)] = (dead_conn, DeadHou())
+
+        conn_module._check_pool_health()
+
+        assert list(conn_module._pool) == [("live", 1)]
+        assert dead_conn.close_calls == 1
+        assert live_conn.close_calls == 0
+
+    def test_check_pool_health_keeps_busy_connections(self, reset_connection_state):
+        """Test a ping timeout (Houdini busy cooking) does not evict."""
+        import houdini_mcp.connection as conn_module
+
+        conn_module._pool[("busy", 1)] = (StubConnection(), DeadHou(TimeoutError("busy")))
+
+        conn_module._check_pool_health()
+
+        assert ("busy", 1) in conn_module._pool
+
+    def test_check_pool_health_clears_dead_active_connection(self, reset_connection_state):
+        """Test evicting the active connection resets the module globals."""
+        import houdini_mcp.connection as conn_module
+
+        conn = StubConnection()
+        hou = DeadHou()
+        conn_module._pool[("localhost", 18811)] = (conn, hou)
+        conn_module._connection, conn_module._hou = conn, hou
+        conn_module._active_key = ("localhost", 18811)
+
+        conn_module._check_pool_health()
+
+        assert conn_module._connection is None
+        assert conn_module._hou is None
+        assert is_connected() is False
+
+    def test_monitor_disabled_when_interval_zero(self, reset_connection_state):
+        """Test PING_INTERVAL=0 keeps connect() from starting the thread."""
+        import houdini_mcp.connection as conn_module
+
+        with patch.object(conn_module, "PING_INTERVAL", 0), patch(
+            "houdini_mcp.connection.rpyc"
+        ) as mock_rpyc:
+            mock_rpyc.classic.connect.return_value = MockRpycConnection(MockHouModule())
+            connect("localhost", 18811)
+
+        assert conn_module._monitor_thread is None
+
+    def test_monitor_started_once_and_stopped_by_disconnect(self, reset_connection_state):
+        """Test connect() starts a single monitor thread and disconnect() stops it."""
+        import houdini_mcp.connection as conn_module
+
+        with patch.object(conn_module, "PING_INTERVAL", 60.0), patch(
+            "houdini_mcp.connection.rpyc"
+        ) as mock_rpyc:
+            mock_rpyc.classic.connect.return_value = MockRpycConnection(MockHouModule())
+            connect("host-a", 1)
+            thread = conn_module._monitor_thread
+            connect("host-b", 2)
+
+            assert thread is not None and thread.is_alive()
+            assert conn_module._monitor_thread is thread
+
+        disconnect()
+
+        assert conn_module._monitor_thread is None
+        assert not thread.is_alive()
+
+
 class TestGetHou:
     """Tests for the get_hou function."""
 
@@ -318,6 +560,25 @@ class TestGetConnectionInfo:
         assert info["houdini_build"]["build"] == 123
         assert info["hip_file"] == "/path/to/test.hip"
 
+    def test_get_connection_info_reads_version_once(self, reset_connection_state):
+        """Test the Houdini version is fetched once per connection."""
+        import houdini_mcp.connection as conn_module
+
+        live_hou = LiveHou()
+        live_hou.hipFile = MockHouModule().hipFile
+        conn_module._connection = StubConnection()
+        conn_module._hou = live_hou
+
+        first = get_connection_info("localhost", 18811)
+        second = get_connection_info("localhost", 18811)
+
+        assert first["houdini_build"] == second["houdini_build"] == {
+            "major": 20,
+            "minor": 5,
+            "build": 123,
+        }
+        assert live_hou.version_calls == 1
+
     def test_get_connection_info_disconnected(self, reset_connection_state):
         """Test get_connection_info when disconnected."""
         info = get_connection_info("localhost", 18811)
@@ -331,10 +592,8 @@ class TestGetConnectionInfo:
         """Test get_connection_info handles errors gracefully."""
         import houdini_mcp.connection as conn_module
 
-        mock_hou = MagicMock()
-        mock_hou.applicationVersionString.side_effect = Exception("Error")
-        conn_module._connection = MagicMock()
-        conn_module._hou = mock_hou
+        conn_module._connection = StubConnection()
+        conn_module._hou = DeadHou(Exception("Error"))
 
         # Patch is_connected to return True
         with patch("houdini_mcp.connection.is_connected", return_value=True):
@@ -348,8 +607,6 @@ class TestPing:
 
     def test_ping_success(self, mock_hou):
         """Test ping returns True when Houdini is reachable."""
-        from tests.conftest import MockRpycConnection
-
         mock_conn = MockRpycConnection(mock_hou)
 
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
@@ -369,8 +626,6 @@ class TestPing:
 
     def test_ping_closes_connection(self, mock_hou):
         """Test ping closes connection after checking."""
-        from tests.conftest import MockRpycConnection
-
         mock_conn = MockRpycConnection(mock_hou)
 
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
@@ -380,6 +635,27 @@ class TestPing:
         assert mock_conn._closed is True
 
 
+class TestCallAsync:
+    """Tests for the call_async function."""
+
+    def test_call_async_returns_result(self):
+        """Test call_async runs the function and exposes its result."""
+        future = call_async(lambda a, b=0: a + b, 1, b=2)
+
+        assert future.result(timeout=5) == 3
+
+    def test_call_async_propagates_errors(self):
+        """Test errors raised by the function surface from result()."""
+
+        def fail():
+            raise ValueError("boom")
+
+        future = call_async(fail)
+
+        with pytest.raises(ValueError, match="boom"):
+            future.result(timeout=5)
+
+
 class TestHoudiniConnectionError:
     """Tests for the HoudiniConnectionError exception."""
 
@@ -79,6 +79,165 @@ subprocess.call(['rm', '-rf', '/'])
         result = _detect_dangerous_code(code)
         assert len(result) >= 3
 
+    @pytest.mark.parametrize(
+        "code,expected",
+        [
+            ("os.unlink(path)", "os.unlink() - file deletion"),
+            ("shutil.rmtree(tmp)", "shutil.rmtree() - directory deletion"),
+            ("os.system('ls')", "os.system() - shell execution"),
+            ("f = open(p, 'a')", "open() with write mode - file writing"),
+        ],
+    )
+    def test_detect_remaining_patterns(self, code, expected):
+        """Test patterns not covered above still pass the quick-token prefilter."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code(code) == [expected]
+
+    def test_overlapping_patterns_all_detected(self):
+        """Test a pattern inside another pattern's match is still reported."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        # The open() write-mode match spans the subprocess reference
+        code = "log = open(log_dir + subprocess.name, 'w')"
+        result = _detect_dangerous_code(code)
+        assert result == [
+            "subprocess - shell execution",
+            "open() with write mode - file writing",
+        ]
+
+    def test_comments_not_detected(self):
+        """Test mentions in comments are not flagged."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        code = """
+# never call hou.exit() or os.remove() here
+node = hou.node('/obj')
+"""
+        assert _detect_dangerous_code(code) == []
+
+    def test_string_passed_to_exec_detected(self):
+        """Test code hidden in a string literal is still flagged."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code("exec('hou.exit()')") == ["hou.exit() - will close Houdini"]
+
+    def test_detect_imported_and_aliased_calls(self):
+        """Test dangerous functions are caught when imported or referenced."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        code = """
+from os import remove
+import subprocess as sp
+wipe = hou.hipFile.clear
+"""
+        assert _detect_dangerous_code(code) == [
+            "os.remove() - file deletion",
+            "subprocess - shell execution",
+            "hou.hipFile.clear() - scene wipe",
+        ]
+
+    def test_open_read_mode_not_detected(self):
+        """Test open() for reading is allowed, including paths starting with w/a."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code("data = open('/tmp/a.txt').read()") == []
+        assert _detect_dangerous_code("p.open(mode='r')") == []
+        assert _detect_dangerous_code("p.open('w')") == ["open() with write mode - file writing"]
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import gzip\ndata = gzip.open('data.gz').read()",
+            "import codecs\nf = codecs.open('x.txt', 'r')",
+            "import gzip as gz\nf = gz.open('w.gz')",
+            "import zipfile\nzf = zipfile.ZipFile('a.zip')\nprint(zf.open('data.txt').read())",
+            "import zipfile\nzipfile.ZipFile('a.zip').open('wax.txt')",
+            "import pathlib as pl\npl.Path('x').open()",
+        ],
+    )
+    def test_module_open_read_not_detected(self, code):
+        """Test file names passed to open() functions and methods are not read as modes."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code(code) == []
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "from pathlib import Path\nPath('x').open('w')",
+            "import gzip\ngzip.open('f', 'wb')",
+            "import codecs\ncodecs.open('x.txt', mode='a')",
+            "import pathlib as pl\npl.Path('x').open('a')",
+            "import zipfile\nzipfile.ZipFile('a.zip').open('data.txt', 'w')",
+        ],
+    )
+    def test_module_and_path_open_write_detected(self, code):
+        """Test write modes are found in both module open() and Path.open() calls."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code(code) == ["open() with write mode - file writing"]
+
+    def test_unparsable_code_falls_back_to_regex(self):
+        """Test code with a syntax error is still scanned."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        assert _detect_dangerous_code("hou.exit(\nif") == ["hou.exit() - will close Houdini"]
+
+    def test_repeated_pattern_reported_once(self):
+        """Test each pattern description appears at most once."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        code = "os.remove('a')\nos.remove('b')\nos.remove('c')"
+        result = _detect_dangerous_code(code)
+        assert result == ["os.remove() - file deletion"]
+
+
+class TestDetectDangerousCodeBatch:
+    """Tests for scanning several snippets in one pass."""
+
+    def test_batch_matches_per_snippet_detection(self):
+        """Test batch results line up with scanning each snippet alone."""
+        from houdini_mcp.tools import _detect_dangerous_code, _detect_dangerous_code_batch
+
+        codes = [
+            "x = 1",
+            "hou.exit()",
+            "",
+            "# os.remove in a comment only",
+            "import subprocess\nos.remove('/tmp/a')",
+        ]
+
+        assert _detect_dangerous_code_batch(codes) == [
+            _detect_dangerous_code(code) for code in codes
+        ]
+
+    def test_only_snippets_with_token_hits_are_scanned(self):
+        """Test snippets without any quick token skip the full scan."""
+        from houdini_mcp.tools import _detect_dangerous_code_batch
+
+        with patch(
+            "houdini_mcp.tools._common._detect_dangerous_code", return_value=[]
+        ) as mock_detect:
+            _detect_dangerous_code_batch(["a = 1", "hou.exit()", "b = 2", "exit(); exit()"])
+
+        assert [c.args[0] for c in mock_detect.call_args_list] == ["hou.exit()", "exit(); exit()"]
+
+    def test_token_cannot_span_snippets(self):
+        """Test a token split across two snippets is not matched."""
+        from houdini_mcp.tools import _detect_dangerous_code_batch
+
+        with patch("houdini_mcp.tools._common._detect_dangerous_code") as mock_detect:
+            assert _detect_dangerous_code_batch(["x = ex", "it"]) == [[], []]
+
+        mock_detect.assert_not_called()
+
+    def test_empty_batch(self):
+        """Test an empty batch returns an empty list."""
+        from houdini_mcp.tools import _detect_dangerous_code_batch
+
+        assert _detect_dangerous_code_batch([]) == []
+
 
 class TestTruncateOutput:
     """Tests for the _truncate_output helper."""
@@ -120,6 +279,52 @@ class TestTruncateOutput:
         assert was_truncated is False
 
 
+class TestCappedWriter:
+    """Tests for the size-capped capture buffer used by execute_code."""
+
+    def test_under_cap_keeps_everything(self):
+        """Test writes below the cap are stored unchanged."""
+        from houdini_mcp.tools import _CappedWriter
+
+        buf = _CappedWriter(100)
+        buf.write("hello ")
+        buf.write("world")
+        assert buf.getvalue() == "hello world"
+        assert buf.truncated is False
+
+    def test_stops_storing_at_cap(self):
+        """Test many writes never grow the buffer past the cap."""
+        from houdini_mcp.tools import _CappedWriter
+
+        buf = _CappedWriter(10)
+        for _ in range(1000):
+            assert buf.write("abcd") == 4
+        assert buf.getvalue() == "abcdabcdab"
+        assert buf.truncated is True
+
+    def test_exact_cap_not_truncated(self):
+        """Test filling the buffer exactly to the cap is not a truncation."""
+        from houdini_mcp.tools import _CappedWriter
+
+        buf = _CappedWriter(4)
+        buf.write("abcd")
+        assert buf.getvalue() == "abcd"
+        assert buf.truncated is False
+
+    def test_works_as_print_target(self):
+        """Test print() and redirect_stdout accept the writer as a stream."""
+        import contextlib
+
+        from houdini_mcp.tools import _CappedWriter
+
+        buf = _CappedWriter(100)
+        assert buf.writable() is True
+        with contextlib.redirect_stdout(buf):
+            print("a", 1)
+        print("b", file=buf)
+        assert buf.getvalue() == "a 1\nb\n"
+
+
 class TestExecuteCode:
     """Tests for the execute_code function."""
 
@@ -139,6 +344,20 @@ class TestExecuteCode:
         assert result["status"] == "success"
         assert "Empty code" in result["message"]
 
+    def test_execute_empty_code_skips_scan_and_connection(self):
+        """Test empty code returns before detection or connecting."""
+        from houdini_mcp.tools import execute_code
+
+        with (
+            patch("houdini_mcp.tools.code.ensure_connected") as mock_connect,
+            patch("houdini_mcp.tools.code._detect_dangerous_code") as mock_detect,
+        ):
+            result = execute_code(" \n", host="localhost", port=18811)
+
+        assert result["status"] == "success"
+        mock_connect.assert_not_called()
+        mock_detect.assert_not_called()
+
     def test_execute_dangerous_code_blocked(self, mock_connection):
         """Test dangerous code is blocked by default."""
         from houdini_mcp.tools import execute_code
@@ -203,6 +422,20 @@ class TestExecuteCode:
         assert result["status"] == "error"
         assert "NameError" in result["message"] or "undefined_variable" in result["traceback"]
 
+    def test_execute_error_without_traceback(self, mock_connection):
+        """Test include_traceback=False reports the exception type only."""
+        from houdini_mcp.tools import execute_code
+
+        with patch("houdini_mcp.tools.code.traceback.format_exception") as mock_format:
+            result = execute_code(
+                "1 / 0", include_traceback=False, host="localhost", port=18811
+            )
+
+        assert result["status"] == "error"
+        assert result["error_type"] == "ZeroDivisionError"
+        assert "traceback" not in result
+        mock_format.assert_not_called()
+
     def test_execute_captures_stderr(self, mock_connection):
         """Test stderr is captured."""
         from houdini_mcp.tools import execute_code
@@ -243,7 +476,7 @@ class TestExecuteCode:
         assert len(result["stderr"]) <= 100
         assert result.get("stderr_truncated") is True
 
-    def test_execute_connection_error(self, reset_connection_state):
+    def test_execute_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
         from houdini_mcp.tools import execute_code
 
@@ -263,13 +496,45 @@ class TestExecuteCode:
 # This comment mentions hou.exit() but doesn't call it
 x = 1
 """
-        # This should detect the pattern even in comments
+        # Comments are not code, so the scan should not report anything here
         result = execute_code(code, allow_dangerous=True, host="localhost", port=18811)
 
         # If pattern detected, should have warning
         if result.get("dangerous_patterns_executed"):
             assert "safety_warning" in result
 
+    def test_execute_reuses_compiled_code(self, mock_connection):
+        """Test repeated snippets are compiled once and still run each time."""
+        from houdini_mcp.tools.code import _compile_code, execute_code
+
+        _compile_code.cache_clear()
+        code = "print('cached run')"
+
+        first = execute_code(code, host="localhost", port=18811)
+        second = execute_code(code, host="localhost", port=18811)
+
+        assert first["stdout"] == second["stdout"] == "cached run\n"
+        info = _compile_code.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_execute_namespace_prebinds_common_modules(self, mock_connection):
+        """Test math and sys are usable without imports."""
+        from houdini_mcp.tools import execute_code
+
+        result = execute_code(
+            "print(math.floor(2.5), sys.maxsize > 0)", host="localhost", port=18811
+        )
+        assert result["stdout"] == "2 True\n"
+
+    def test_execute_namespace_isolated_between_calls(self, mock_connection):
+        """Test names defined by one snippet do not leak into the next."""
+        from houdini_mcp.tools import execute_code
+
+        execute_code("leaked = 1", host="localhost", port=18811)
+        result = execute_code("print('leaked' in globals())", host="localhost", port=18811)
+        assert result["stdout"] == "False\n"
+
 
 class TestExecuteCodeWithDiff:
     """Tests for execute_code with capture_diff enabled."""
@@ -410,3 +675,81 @@ print(c.increment())
         result = execute_code(code, host="localhost", port=18811)
         assert result["status"] == "success"
         assert "[0, 1, 4, 9, 16]" in result["stdout"]
+
+
+class TestExecuteCodeBatch:
+    """Tests for execute_code_batch."""
+
+    def test_batch_runs_snippets_in_order(self, mock_connection):
+        """Test each snippet gets its own result and output capture."""
+        from houdini_mcp.tools import execute_code_batch
+
+        result = execute_code_batch(
+            ["print('first')", "print('second')"], host="localhost", port=18811
+        )
+
+        assert result["status"] == "success"
+        assert result["count"] == 2
+        assert [r["index"] for r in result["results"]] == [0, 1]
+        assert result["results"][0]["stdout"] == "first\n"
+        assert result["results"][1]["stdout"] == "second\n"
+
+    def test_batch_of_empty_snippets_does_not_connect(self):
+        """Test a batch with nothing to run never opens a connection."""
+        from houdini_mcp.tools import execute_code_batch
+
+        with patch("houdini_mcp.tools.code.ensure_connected") as mock_connect:
+            result = execute_code_batch(["", "  "], host="localhost", port=18811)
+
+        assert result["status"] == "success"
+        assert [r["index"] for r in result["results"]] == [0, 1]
+        mock_connect.assert_not_called()
+
+    def test_batch_continues_after_error_by_default(self, mock_connection):
+        """Test a failing snippet does not stop later ones unless asked."""
+        from houdini_mcp.tools import execute_code_batch
+
+        result = execute_code_batch(
+            ["raise ValueError('boom')", "print('after')"], host="localhost", port=18811
+        )
+
+        assert result["status"] == "partial"
+        assert result["results"][0]["status"] == "error"
+        assert "boom" in result["results"][0]["message"]
+        assert result["results"][1]["stdout"] == "after\n"
+
+    def test_batch_stop_on_error_skips_rest(self, mock_connection):
+        """Test stop_on_error marks snippets after the failure as skipped."""
+        from houdini_mcp.tools import execute_code_batch
+
+        result = execute_code_batch(
+            ["print('ok')", "1/0", "print('never')"],
+            stop_on_error=True,
+            host="localhost",
+            port=18811,
+        )
+
+        assert result["status"] == "partial"
+        assert [r["status"] for r in result["results"]] == ["success", "error", "skipped"]
+
+    def test_batch_blocks_when_any_snippet_dangerous(self, mock_connection):
+        """Test one dangerous snippet blocks the whole batch before anything runs."""
+        from houdini_mcp.tools import execute_code_batch
+
+        result = execute_code_batch(
+            ["print('safe')", "hou.exit()"], host="localhost", port=18811
+        )
+
+        assert result["status"] == "error"
+        assert result["dangerous_snippets"] == [
+            {"index": 1, "dangerous_patterns": ["hou.exit() - will close Houdini"]}
+        ]
+        assert "results" not in result
+
+    def test_batch_empty(self, mock_connection):
+        """Test an empty batch succeeds without connecting."""
+        from houdini_mcp.tools import execute_code_batch
+
+        result = execute_code_batch([], host="localhost", port=18811)
+
+        assert result == {"status": "success", "results": [], "count": 0}
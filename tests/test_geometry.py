@@ -4,76 +4,232 @@ The get_geo_summary function now executes geometry analysis code on the Houdini
 via execute_code() and parses JSON from stdout. These tests mock execute_code directly.
 """
 
+import functools
+import math
 import pytest
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+from houdini_mcp.tools import get_geo_summary
+from houdini_mcp.tools.cache import geo_summary_cache
+
+from tests.conftest import make_geo_node
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize with orjson when it is installed (much faster on float lists)."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _dumps = json.dumps
+
+
+# What a successful execute_code call returns; copied per test by _set_stdout
+_EXEC_RESULT_TEMPLATE = {"status": "success", "stdout": "", "stderr": ""}
+
+
+def _set_stdout(mock, stdout):
+    """Make the execute_code mock return a successful run printing stdout."""
+    result = _EXEC_RESULT_TEMPLATE.copy()
+    result["stdout"] = stdout
+    mock.return_value = result
+
+
+# Pre-serialized stdout for the error-case tests
+_NO_GEOMETRY_STDOUT = _dumps({"status": "error", "message": "Node /obj/cam1 has no geometry"})
+_NODE_NOT_FOUND_STDOUT = _dumps(
+    {"status": "error", "message": "Node not found: /obj/geo1/nonexistent"}
+)
+_INVALID_JSON_STDOUT = "this is not valid json {"
+
+
+# Default geometry response. List defaults are tuples so the nested values
+# shared between responses cannot be modified in place; json serializes
+# tuples as arrays.
+_GEO_TEMPLATE = {
+    "status": "success",
+    "node_path": "/obj/geo1/sphere1",
+    "cook_state": "cooked",
+    "point_count": 0,
+    "primitive_count": 0,
+    "vertex_count": 0,
+    "bounding_box": {
+        "min": (0.0, 0.0, 0.0),
+        "max": (1.0, 1.0, 1.0),
+        "size": (1.0, 1.0, 1.0),
+        "center": (0.5, 0.5, 0.5),
+    },
+    "attributes": {"point": (), "primitive": (), "vertex": (), "detail": ()},
+    "groups": {"point": (), "primitive": ()},
+}
+
+_BBOX_KWARGS = {"bbox_min": "min", "bbox_max": "max", "bbox_size": "size", "bbox_center": "center"}
+_TOP_LEVEL_KWARGS = (
+    "node_path",
+    "cook_state",
+    "point_count",
+    "primitive_count",
+    "vertex_count",
+    "bounding_box",
+    "attributes",
+    "groups",
+    "sample_points",
+    "warning",
+)
+
+
+def _make_geo_response(**kwargs):
+    """Helper to build a geometry response dict from _GEO_TEMPLATE plus overrides."""
+    response = {**_GEO_TEMPLATE}
+    response.update((key, kwargs[key]) for key in _TOP_LEVEL_KWARGS if key in kwargs)
+
+    if "bounding_box" not in kwargs:
+        if not kwargs.get("include_bbox", True):
+            del response["bounding_box"]
+        elif any(key in kwargs for key in _BBOX_KWARGS):
+            # Only copy the bounding box when a test overrides part of it
+            response["bounding_box"] = {
+                **_GEO_TEMPLATE["bounding_box"],
+                **{field: kwargs[key] for key, field in _BBOX_KWARGS.items() if key in kwargs},
+            }
+
+    if not kwargs.get("include_attributes", True):
+        del response["attributes"]
+    if not kwargs.get("include_groups", True):
+        del response["groups"]
+
+    return response
+
+
+@functools.lru_cache(maxsize=8)
+def _linear_samples_json(n):
+    """JSON array of n sample points laid out along X, written out directly.
+
+    The shape is fixed, so the array is formatted as a string instead of
+    building n dicts and running them through the JSON encoder.
+    """
+    return "[" + ",".join(f'{{"index":{i},"P":[{float(i)},0.0,0.0]}}' for i in range(n)) + "]"
+
+
+def _freeze(value):
+    """Turn nested dicts/lists into hashable tuples for use as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Serialized responses keyed by their frozen kwargs, so a repeated test run
+# (reruns, pytest-repeat) skips building and serializing the payload again
+_geo_json_cache = {}
+
+
+def _geo_response_json(**kwargs):
+    """Build a geometry response with _make_geo_response and return it as JSON.
+
+    Use _make_geo_response directly when a test needs to modify the dict.
+    """
+    key = _freeze(kwargs)
+    cached = _geo_json_cache.get(key)
+    if cached is None:
+        cached = _geo_json_cache[key] = _dumps(_make_geo_response(**kwargs))
+    return cached
+
+
+# Responses that only need their fields passed through by get_geo_summary:
+# (id, node path, _make_geo_response kwargs, expected result fields)
+_FIELD_CASES = [
+    (
+        "empty_geometry",
+        "/obj/geo1/grid1",
+        {
+            "bbox_min": [0.0, 0.0, 0.0],
+            "bbox_max": [0.0, 0.0, 0.0],
+            "bbox_size": [0.0, 0.0, 0.0],
+            "bbox_center": [0.0, 0.0, 0.0],
+        },
+        {
+            "point_count": 0,
+            "primitive_count": 0,
+            "vertex_count": 0,
+            "attributes": {"point": [], "primitive": [], "vertex": [], "detail": []},
+            "groups": {"point": [], "primitive": []},
+        },
+    ),
+    (
+        "uncooked_geometry",  # reported as cooked after get_geo_summary cooks it
+        "/obj/geo1/noise1",
+        {"point_count": 1},
+        {"cook_state": "cooked", "point_count": 1},
+    ),
+    (
+        "no_attributes",
+        "/obj/geo1/box1",
+        {"point_count": 1},
+        {
+            "point_count": 1,
+            "attributes": {"point": [], "primitive": [], "vertex": [], "detail": []},
+        },
+    ),
+    (
+        "multiple_groups",
+        "/obj/geo1/merge1",
+        {
+            "point_count": 2,
+            "primitive_count": 2,
+            "vertex_count": 6,
+            "groups": {
+                "point": ["top", "bottom", "selection"],
+                "primitive": ["front", "back"],
+            },
+        },
+        {
+            "groups": {
+                "point": ["top", "bottom", "selection"],
+                "primitive": ["front", "back"],
+            },
+        },
+    ),
+    (
+        "cook_failed",  # geometry info is still returned despite the cook error
+        "/obj/geo1/bad1",
+        {"cook_state": "error", "point_count": 1},
+        {"cook_state": "error", "point_count": 1},
+    ),
+    (
+        "vertex_count_calculation",
+        "/obj/geo1/poly1",
+        {"point_count": 1, "primitive_count": 4, "vertex_count": 18},  # 3 + 4 + 5 + 6
+        {"primitive_count": 4, "vertex_count": 18},
+    ),
+]
 
 
 class TestGetGeoSummary:
     """Tests for the get_geo_summary function."""
 
+    @pytest.fixture(scope="session")
+    def shared_execute_code_mock(self):
+        """One MagicMock reused by every test; reset between tests."""
+        return MagicMock()
+
     @pytest.fixture
-    def mock_execute_code(self):
+    def mock_execute_code(self, monkeypatch, shared_execute_code_mock, mock_connection):
         """Fixture to mock execute_code for geo_summary tests."""
+        geo_summary_cache.invalidate()
+        mock = shared_execute_code_mock
+        mock.reset_mock(return_value=True, side_effect=True)
         # Patch where execute_code is defined (in code.py)
-        with patch("houdini_mcp.tools.code.execute_code") as mock:
-            yield mock
-
-    def _make_geo_response(self, **kwargs):
-        """Helper to build a geometry response dict."""
-        response = {
-            "status": "success",
-            "node_path": kwargs.get("node_path", "/obj/geo1/sphere1"),
-            "cook_state": kwargs.get("cook_state", "cooked"),
-            "point_count": kwargs.get("point_count", 0),
-            "primitive_count": kwargs.get("primitive_count", 0),
-            "vertex_count": kwargs.get("vertex_count", 0),
-        }
-
-        if "bounding_box" in kwargs:
-            response["bounding_box"] = kwargs["bounding_box"]
-        elif kwargs.get("include_bbox", True):
-            response["bounding_box"] = {
-                "min": kwargs.get("bbox_min", [0.0, 0.0, 0.0]),
-                "max": kwargs.get("bbox_max", [1.0, 1.0, 1.0]),
-                "size": kwargs.get("bbox_size", [1.0, 1.0, 1.0]),
-                "center": kwargs.get("bbox_center", [0.5, 0.5, 0.5]),
-            }
-
-        if kwargs.get("include_attributes", True):
-            response["attributes"] = kwargs.get(
-                "attributes",
-                {
-                    "point": [],
-                    "primitive": [],
-                    "vertex": [],
-                    "detail": [],
-                },
-            )
-
-        if kwargs.get("include_groups", True):
-            response["groups"] = kwargs.get(
-                "groups",
-                {
-                    "point": [],
-                    "primitive": [],
-                },
-            )
-
-        if "sample_points" in kwargs:
-            response["sample_points"] = kwargs["sample_points"]
-
-        if "warning" in kwargs:
-            response["warning"] = kwargs["warning"]
-
-        return response
+        monkeypatch.setattr("houdini_mcp.tools.code.execute_code", mock)
+        return mock
 
     def test_get_geo_summary_basic_sphere(self, mock_execute_code):
         """Test getting geometry summary for a basic sphere."""
-        from houdini_mcp.tools import get_geo_summary
-
         # Mock response with sphere geometry data
-        geo_data = self._make_geo_response(
+        geo_json = _geo_response_json(
             node_path="/obj/geo1/sphere1",
             cook_state="cooked",
             point_count=3,
@@ -103,107 +259,77 @@ class TestGetGeoSummary:
                 {"index": 1, "P": [0.5, 0.866, 0.0], "N": [0.5, 0.866, 0.0]},
             ],
         )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, geo_json)
 
         result = get_geo_summary(
             "/obj/geo1/sphere1", max_sample_points=2, host="localhost", port=18811
         )
 
-        assert result["status"] == "success"
-        assert result["node_path"] == "/obj/geo1/sphere1"
-        assert result["cook_state"] == "cooked"
-        assert result["point_count"] == 3
-        assert result["primitive_count"] == 2
-        assert result["vertex_count"] == 8
-
-        # Check bounding box
-        assert result["bounding_box"] is not None
-        assert result["bounding_box"]["min"] == [-1.0, -1.0, -1.0]
-        assert result["bounding_box"]["max"] == [1.0, 1.0, 1.0]
-        assert result["bounding_box"]["size"] == [2.0, 2.0, 2.0]
-        assert result["bounding_box"]["center"] == [0.0, 0.0, 0.0]
-
-        # Check attributes
-        assert "attributes" in result
-        assert len(result["attributes"]["point"]) == 2
-        assert len(result["attributes"]["primitive"]) == 1
-
-        # Verify attribute metadata
-        p_attrib = next(a for a in result["attributes"]["point"] if a["name"] == "P")
-        assert p_attrib["type"] == "float"
-        assert p_attrib["size"] == 3
-
-        # Check groups
-        assert "groups" in result
-        assert "top" in result["groups"]["point"]
-        assert "front" in result["groups"]["primitive"]
-
-        # Check sample points
-        assert "sample_points" in result
-        assert len(result["sample_points"]) == 2
-        assert result["sample_points"][0]["index"] == 0
-        assert result["sample_points"][0]["P"] == [0.0, 1.0, 0.0]
-
-    def test_get_geo_summary_empty_geometry(self, mock_execute_code):
-        """Test geometry summary for empty geometry."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/grid1",
-            point_count=0,
-            primitive_count=0,
-            vertex_count=0,
-            bbox_min=[0.0, 0.0, 0.0],
-            bbox_max=[0.0, 0.0, 0.0],
-            bbox_size=[0.0, 0.0, 0.0],
-            bbox_center=[0.0, 0.0, 0.0],
-            attributes={"point": [], "primitive": [], "vertex": [], "detail": []},
-            groups={"point": [], "primitive": []},
-        )
-        mock_execute_code.return_value = {
+        expected = {
             "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
+            "node_path": "/obj/geo1/sphere1",
+            "cook_state": "cooked",
+            "point_count": 3,
+            "primitive_count": 2,
+            "vertex_count": 8,
         }
+        assert {key: result[key] for key in expected} == expected
 
-        result = get_geo_summary("/obj/geo1/grid1", host="localhost", port=18811)
+        assert result["bounding_box"] == {
+            "min": [-1.0, -1.0, -1.0],
+            "max": [1.0, 1.0, 1.0],
+            "size": [2.0, 2.0, 2.0],
+            "center": [0.0, 0.0, 0.0],
+        }
+        assert result["attributes"] == {
+            "point": [
+                {"name": "P", "type": "float", "size": 3},
+                {"name": "N", "type": "float", "size": 3},
+            ],
+            "primitive": [{"name": "material", "type": "string", "size": 1}],
+            "vertex": [],
+            "detail": [],
+        }
+        assert result["groups"] == {"point": ["top"], "primitive": ["front"]}
+        assert result["sample_points"] == [
+            {"index": 0, "P": [0.0, 1.0, 0.0], "N": [0.0, 1.0, 0.0]},
+            {"index": 1, "P": [0.5, 0.866, 0.0], "N": [0.5, 0.866, 0.0]},
+        ]
+
+    @pytest.mark.parametrize(
+        "node_path,response_kwargs,expected",
+        [case[1:] for case in _FIELD_CASES],
+        ids=[case[0] for case in _FIELD_CASES],
+    )
+    def test_get_geo_summary_fields(self, mock_execute_code, node_path, response_kwargs, expected):
+        """Test response fields are passed through for a range of geometry states."""
+        _set_stdout(mock_execute_code, _geo_response_json(node_path=node_path, **response_kwargs))
+
+        result = get_geo_summary(node_path, host="localhost", port=18811)
 
         assert result["status"] == "success"
-        assert result["point_count"] == 0
-        assert result["primitive_count"] == 0
-        assert result["vertex_count"] == 0
-        assert len(result["attributes"]["point"]) == 0
-        assert len(result["groups"]["point"]) == 0
+        assert result["node_path"] == node_path
+        for field, value in expected.items():
+            assert result[field] == value, field
 
-    def test_get_geo_summary_massive_geometry(self, mock_execute_code):
+    @pytest.mark.parametrize("sample_count", [100, pytest.param(10000, marks=pytest.mark.slow)])
+    def test_get_geo_summary_massive_geometry(self, mock_execute_code, sample_count):
         """Test geometry summary with massive geometry (>1M points)."""
-        from houdini_mcp.tools import get_geo_summary
-
-        # Generate sample points for first 100
-        sample_points = [{"index": i, "P": [float(i), 0.0, 0.0]} for i in range(100)]
-
-        geo_data = self._make_geo_response(
+        geo_json = _geo_response_json(
             node_path="/obj/geo1/large1",
             point_count=1500000,
             primitive_count=100000,
             vertex_count=300000,
             bbox_min=[-100.0, -100.0, -100.0],
             bbox_max=[100.0, 100.0, 100.0],
-            sample_points=sample_points,
             warning="Geometry has 1500000 points (>1M). Sampling limited.",
         )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        # Splice in sample points up to the default and the maximum max_sample_points
+        geo_json = f'{geo_json[:-1]}, "sample_points": {_linear_samples_json(sample_count)}}}'
+        _set_stdout(mock_execute_code, geo_json)
 
         result = get_geo_summary(
-            "/obj/geo1/large1", max_sample_points=100, host="localhost", port=18811
+            "/obj/geo1/large1", max_sample_points=sample_count, host="localhost", port=18811
         )
 
         assert result["status"] == "success"
@@ -216,42 +342,12 @@ class TestGetGeoSummary:
         assert ">1M" in result["warning"]
 
         # Sample points should be limited
-        assert len(result["sample_points"]) == 100
-
-    def test_get_geo_summary_uncooked_geometry(self, mock_execute_code):
-        """Test geometry summary for uncooked/dirty node."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/noise1",
-            cook_state="cooked",  # After cook
-            point_count=1,
-        )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
-
-        result = get_geo_summary("/obj/geo1/noise1", host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert result["cook_state"] == "cooked"
-        assert result["point_count"] == 1
+        assert len(result["sample_points"]) == sample_count
+        assert result["sample_points"][-1]["P"] == [float(sample_count - 1), 0.0, 0.0]
 
     def test_get_geo_summary_no_geometry(self, mock_execute_code):
         """Test error when node has no geometry."""
-        from houdini_mcp.tools import get_geo_summary
-
-        error_data = {
-            "status": "error",
-            "message": "Node /obj/cam1 has no geometry",
-        }
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(error_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, _NO_GEOMETRY_STDOUT)
 
         result = get_geo_summary("/obj/cam1", host="localhost", port=18811)
 
@@ -260,52 +356,15 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_node_not_found(self, mock_execute_code):
         """Test error when node doesn't exist."""
-        from houdini_mcp.tools import get_geo_summary
-
-        error_data = {
-            "status": "error",
-            "message": "Node not found: /obj/geo1/nonexistent",
-        }
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(error_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, _NODE_NOT_FOUND_STDOUT)
 
         result = get_geo_summary("/obj/geo1/nonexistent", host="localhost", port=18811)
 
         assert result["status"] == "error"
         assert "Node not found" in result["message"]
 
-    def test_get_geo_summary_no_attributes(self, mock_execute_code):
-        """Test geometry summary without attributes."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/box1",
-            point_count=1,
-            attributes={"point": [], "primitive": [], "vertex": [], "detail": []},
-        )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
-
-        result = get_geo_summary(
-            "/obj/geo1/box1", include_attributes=True, host="localhost", port=18811
-        )
-
-        assert result["status"] == "success"
-        assert result["point_count"] == 1
-        assert "attributes" in result
-        assert len(result["attributes"]["point"]) == 0
-        assert len(result["attributes"]["primitive"]) == 0
-
     def test_get_geo_summary_skip_attributes_and_groups(self, mock_execute_code):
         """Test skipping attributes and groups."""
-        from houdini_mcp.tools import get_geo_summary
-
         # When include_attributes=False and include_groups=False,
         # the code in Houdini won't add those fields
         geo_data = {
@@ -323,11 +382,7 @@ class TestGetGeoSummary:
             },
             # No attributes, groups, or sample_points
         }
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, _dumps(geo_data))
 
         result = get_geo_summary(
             "/obj/geo1/sphere1",
@@ -345,9 +400,7 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_various_attribute_types(self, mock_execute_code):
         """Test geometry with various attribute types."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
+        geo_json = _geo_response_json(
             node_path="/obj/geo1/xform1",
             point_count=1,
             attributes={
@@ -369,11 +422,7 @@ class TestGetGeoSummary:
                 ],
             },
         )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, geo_json)
 
         result = get_geo_summary("/obj/geo1/xform1", host="localhost", port=18811)
 
@@ -381,13 +430,11 @@ class TestGetGeoSummary:
 
         # Check point attributes
         assert len(result["attributes"]["point"]) == 5
-        p_attr = next(a for a in result["attributes"]["point"] if a["name"] == "P")
-        assert p_attr["type"] == "float"
-        assert p_attr["size"] == 3
-
-        id_attr = next(a for a in result["attributes"]["point"] if a["name"] == "id")
-        assert id_attr["type"] == "int"
-        assert id_attr["size"] == 1
+        point_attrs = {a["name"]: a for a in result["attributes"]["point"]}
+        assert point_attrs["P"]["type"] == "float"
+        assert point_attrs["P"]["size"] == 3
+        assert point_attrs["id"]["type"] == "int"
+        assert point_attrs["id"]["size"] == 1
 
         # Check other attribute classes
         assert len(result["attributes"]["primitive"]) == 1
@@ -396,9 +443,7 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_sample_points_with_attributes(self, mock_execute_code):
         """Test sample points include attribute values."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
+        geo_json = _geo_response_json(
             node_path="/obj/geo1/mountain1",
             point_count=3,
             primitive_count=1,
@@ -419,11 +464,7 @@ class TestGetGeoSummary:
                 {"index": 2, "P": [0.0, 0.0, 1.0], "N": [0.0, 0.0, 1.0], "Cd": [0.0, 0.0, 1.0]},
             ],
         )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, geo_json)
 
         result = get_geo_summary(
             "/obj/geo1/mountain1", max_sample_points=3, host="localhost", port=18811
@@ -447,8 +488,6 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_max_sample_points_validation(self, mock_execute_code):
         """Test max_sample_points validation (capped at 10000)."""
-        from houdini_mcp.tools import get_geo_summary
-
         # Response when max_sample_points=0 (no sample_points key)
         geo_data = {
             "status": "success",
@@ -468,11 +507,7 @@ class TestGetGeoSummary:
             # Note: no sample_points key when max_sample_points=0
         }
 
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, _dumps(geo_data))
 
         # Test negative value -> 0 (no sample_points in result)
         result = get_geo_summary(
@@ -481,107 +516,24 @@ class TestGetGeoSummary:
         assert result["status"] == "success"
         assert "sample_points" not in result
 
-    def test_get_geo_summary_multiple_groups(self, mock_execute_code):
-        """Test geometry with multiple groups."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/merge1",
-            point_count=2,
-            primitive_count=2,
-            vertex_count=6,
-            groups={
-                "point": ["top", "bottom", "selection"],
-                "primitive": ["front", "back"],
-            },
-        )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
-
-        result = get_geo_summary("/obj/geo1/merge1", host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert len(result["groups"]["point"]) == 3
-        assert "top" in result["groups"]["point"]
-        assert "bottom" in result["groups"]["point"]
-        assert "selection" in result["groups"]["point"]
-        assert len(result["groups"]["primitive"]) == 2
-        assert "front" in result["groups"]["primitive"]
-        assert "back" in result["groups"]["primitive"]
-
     def test_get_geo_summary_no_bounding_box(self, mock_execute_code):
         """Test geometry with no bounding box."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
+        geo_data = _make_geo_response(
             node_path="/obj/geo1/grid1",
             point_count=1,
             include_bbox=False,
         )
         geo_data["bounding_box"] = None
 
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, _dumps(geo_data))
 
         result = get_geo_summary("/obj/geo1/grid1", host="localhost", port=18811)
 
         assert result["status"] == "success"
         assert result["bounding_box"] is None
 
-    def test_get_geo_summary_cook_failed(self, mock_execute_code):
-        """Test geometry summary when cook fails."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/bad1",
-            cook_state="error",
-            point_count=1,
-        )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
-
-        result = get_geo_summary("/obj/geo1/bad1", host="localhost", port=18811)
-
-        # Should still return geometry info despite cook error
-        assert result["status"] == "success"
-        assert result["cook_state"] == "error"
-        assert result["point_count"] == 1
-
-    def test_get_geo_summary_vertex_count_calculation(self, mock_execute_code):
-        """Test vertex count calculation with varying primitive types."""
-        from houdini_mcp.tools import get_geo_summary
-
-        geo_data = self._make_geo_response(
-            node_path="/obj/geo1/poly1",
-            point_count=1,
-            primitive_count=4,
-            vertex_count=18,  # 3 + 4 + 5 + 6
-        )
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": json.dumps(geo_data),
-            "stderr": "",
-        }
-
-        result = get_geo_summary("/obj/geo1/poly1", host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert result["primitive_count"] == 4
-        assert result["vertex_count"] == 18
-
     def test_get_geo_summary_execute_code_error(self, mock_execute_code):
         """Test handling when execute_code returns an error."""
-        from houdini_mcp.tools import get_geo_summary
-
         mock_execute_code.return_value = {
             "status": "error",
             "message": "Houdini connection lost",
@@ -594,13 +546,7 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_empty_stdout(self, mock_execute_code):
         """Test handling when execute_code returns empty stdout."""
-        from houdini_mcp.tools import get_geo_summary
-
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": "",
-            "stderr": "",
-        }
+        _set_stdout(mock_execute_code, "")
 
         result = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
 
@@ -609,15 +555,85 @@ class TestGetGeoSummary:
 
     def test_get_geo_summary_invalid_json(self, mock_execute_code):
         """Test handling when execute_code returns invalid JSON."""
-        from houdini_mcp.tools import get_geo_summary
+        _set_stdout(mock_execute_code, _INVALID_JSON_STDOUT)
 
-        mock_execute_code.return_value = {
-            "status": "success",
-            "stdout": "this is not valid json {",
-            "stderr": "",
-        }
+        result = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+
+        assert result["status"] == "error"
+        assert "Failed to parse" in result["message"]
+
+    def test_get_geo_summary_stdlib_json_fallback(self, mock_execute_code, monkeypatch):
+        """Test parsing and parse errors without orjson installed."""
+        monkeypatch.setattr("houdini_mcp.tools.geometry._json_loads", json.loads)
+        _set_stdout(mock_execute_code, _geo_response_json(point_count=5))
 
         result = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert result["status"] == "success"
+        assert result["point_count"] == 5
 
+        _set_stdout(mock_execute_code, _INVALID_JSON_STDOUT)
+        result = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
         assert result["status"] == "error"
         assert "Failed to parse" in result["message"]
+
+    @pytest.mark.parametrize("stdlib", [False, True], ids=["default", "stdlib"])
+    def test_get_geo_summary_non_finite_floats(self, mock_execute_code, monkeypatch, stdlib):
+        """Test NaN/Infinity written by json.dumps on the Houdini side still parse."""
+        if stdlib:
+            monkeypatch.setattr("houdini_mcp.tools.geometry._json_loads", json.loads)
+        nan = float("nan")
+        inf = float("inf")
+        # Serialized with json.dumps like the Houdini-side script, not _dumps
+        _set_stdout(
+            mock_execute_code,
+            json.dumps(_make_geo_response(bbox_min=[nan, 0.0, -inf], bbox_size=[nan, 1.0, inf])),
+        )
+
+        result = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert result["status"] == "success"
+        bbox_min = result["bounding_box"]["min"]
+        assert math.isnan(bbox_min[0])
+        assert bbox_min[2] == -inf
+        assert result["bounding_box"]["size"][2] == inf
+
+    def test_get_geo_summary_cached_until_recook(self, mock_execute_code, mock_connection):
+        """Test a clean node is analysed once per cook."""
+        sphere, _ = make_geo_node(mock_connection, "/obj/geo1/sphere1", node_type="sphere")
+        _set_stdout(mock_execute_code, _geo_response_json(point_count=5))
+
+        first = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        second = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert first == second
+        assert second["point_count"] == 5
+        assert mock_execute_code.call_count == 1
+
+        # Cached results are copies, callers may mutate them freely
+        second["point_count"] = 0
+        third = get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert third["point_count"] == 5
+
+        # Different options are cached separately
+        get_geo_summary("/obj/geo1/sphere1", max_sample_points=10, host="localhost", port=18811)
+        assert mock_execute_code.call_count == 2
+
+        sphere.cook()
+        get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert mock_execute_code.call_count == 3
+
+    def test_get_geo_summary_dirty_node_not_cached(self, mock_execute_code, mock_connection):
+        """Test nodes that need to cook always run the analysis."""
+        make_geo_node(mock_connection, "/obj/geo1/sphere1", node_type="sphere", cook="Dirty")
+        _set_stdout(mock_execute_code, _geo_response_json(point_count=5))
+
+        get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert mock_execute_code.call_count == 2
+
+    def test_get_geo_summary_errors_not_cached(self, mock_execute_code, mock_connection):
+        """Test error results are not cached."""
+        make_geo_node(mock_connection, "/obj/geo1/sphere1", node_type="sphere")
+        _set_stdout(mock_execute_code, _NO_GEOMETRY_STDOUT)
+
+        get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        get_geo_summary("/obj/geo1/sphere1", host="localhost", port=18811)
+        assert mock_execute_code.call_count == 2
@@ -10,22 +10,79 @@ from tests.conftest import MockHouNode, MockHouModule
 class TestGetNodeInfoWithErrors:
     """Tests for get_node_info with include_errors parameter."""
 
-    def test_get_node_info_with_errors_cooked(self, mock_connection):
-        """Test getting node info with errors for a successfully cooked node."""
+    @pytest.mark.parametrize(
+        "cook_state,errors,warnings,expected",
+        [
+            pytest.param("Cooked", [], [], ("cooked", 0, 0), id="cooked"),
+            pytest.param("Dirty", [], [], ("dirty", 0, 0), id="dirty"),
+            pytest.param("Uncooked", [], [], ("uncooked", 0, 0), id="uncooked"),
+            pytest.param(
+                "CookFailed",
+                ["Critical error"],
+                ["Minor warning"],
+                ("error", 1, 1),
+                id="errors_and_warnings",
+            ),
+            pytest.param(
+                "CookFailed",
+                [
+                    "Error 1: Invalid geometry",
+                    "Error 2: Missing attribute",
+                    "Error 3: Division by zero",
+                    "Error 4: Out of memory",
+                ],
+                [],
+                ("error", 4, 0),
+                id="multiple_errors",
+            ),
+        ],
+    )
+    def test_get_node_info_errors_matrix(
+        self, mock_connection, cook_state, errors, warnings, expected
+    ):
+        """Test cook state and error/warning records across node states."""
         from houdini_mcp.tools import get_node_info
 
-        # Create a test node
         geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
+        geo1._cook_state = cook_state
+        geo1._errors = errors
+        geo1._warnings = warnings
         mock_connection.add_node(geo1)
 
-        # Node is cooked by default with no errors
         result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
 
         assert result["status"] == "success"
-        assert "cook_info" in result
-        assert result["cook_info"]["cook_state"] == "cooked"
-        assert result["cook_info"]["errors"] == []
-        assert result["cook_info"]["warnings"] == []
+        cook_info = result["cook_info"]
+        assert isinstance(cook_info["errors"], list)
+        assert isinstance(cook_info["warnings"], list)
+        assert (
+            cook_info["cook_state"],
+            len(cook_info["errors"]),
+            len(cook_info["warnings"]),
+        ) == expected
+        assert all(e["severity"] == "error" for e in cook_info["errors"])
+        assert all(w["severity"] == "warning" for w in cook_info["warnings"])
+        records = cook_info["errors"] + cook_info["warnings"]
+        assert all(r["node_path"] == "/obj/geo1" for r in records)
+
+    def test_cook_info_fetches_path_once_for_records(self):
+        """Test node.path() is read once however many errors and warnings there are."""
+        from houdini_mcp.tools.nodes import _collect_cook_info
+
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
+        geo1._cook_state = "CookFailed"
+        geo1._errors = [f"Error {i}" for i in range(5)]
+        geo1._warnings = [f"Warning {i}" for i in range(5)]
+
+        with patch.object(geo1, "path", wraps=geo1.path) as mock_path:
+            cook_info = _collect_cook_info(geo1)
+
+        assert mock_path.call_count == 1
+        assert len(cook_info["errors"]) == 5
+        assert len(cook_info["warnings"]) == 5
+        assert {r["node_path"] for r in cook_info["errors"] + cook_info["warnings"]} == {
+            "/obj/geo1"
+        }
 
     def test_get_node_info_with_errors_failed(self, mock_connection):
         """Test getting node info for a node with cook errors."""
@@ -67,55 +124,6 @@ class TestGetNodeInfoWithErrors:
         assert result["cook_info"]["warnings"][0]["message"] == "Deprecated parameter used"
         assert result["cook_info"]["warnings"][1]["message"] == "Performance warning: large dataset"
 
-    def test_get_node_info_with_errors_and_warnings(self, mock_connection):
-        """Test getting node info for a node with both errors and warnings."""
-        from houdini_mcp.tools import get_node_info
-
-        # Create a test node with both errors and warnings
-        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
-        geo1._cook_state = "CookFailed"
-        geo1._errors = ["Critical error"]
-        geo1._warnings = ["Minor warning"]
-        mock_connection.add_node(geo1)
-
-        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert "cook_info" in result
-        assert result["cook_info"]["cook_state"] == "error"
-        assert len(result["cook_info"]["errors"]) == 1
-        assert len(result["cook_info"]["warnings"]) == 1
-
-    def test_get_node_info_dirty_state(self, mock_connection):
-        """Test getting node info for a dirty (needs recook) node."""
-        from houdini_mcp.tools import get_node_info
-
-        # Create a test node in dirty state
-        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
-        geo1._cook_state = "Dirty"
-        mock_connection.add_node(geo1)
-
-        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert "cook_info" in result
-        assert result["cook_info"]["cook_state"] == "dirty"
-
-    def test_get_node_info_uncooked_state(self, mock_connection):
-        """Test getting node info for an uncooked node."""
-        from houdini_mcp.tools import get_node_info
-
-        # Create a test node in uncooked state
-        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
-        geo1._cook_state = "Uncooked"
-        mock_connection.add_node(geo1)
-
-        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert "cook_info" in result
-        assert result["cook_info"]["cook_state"] == "uncooked"
-
     def test_get_node_info_force_cook(self, mock_connection):
         """Test forcing a cook before getting errors."""
         from houdini_mcp.tools import get_node_info
@@ -168,28 +176,6 @@ class TestGetNodeInfoWithErrors:
         assert result["status"] == "error"
         assert "not found" in result["message"].lower()
 
-    def test_get_node_info_multiple_errors(self, mock_connection):
-        """Test node with multiple errors."""
-        from houdini_mcp.tools import get_node_info
-
-        # Create a test node with multiple errors
-        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
-        geo1._cook_state = "CookFailed"
-        geo1._errors = [
-            "Error 1: Invalid geometry",
-            "Error 2: Missing attribute",
-            "Error 3: Division by zero",
-            "Error 4: Out of memory",
-        ]
-        mock_connection.add_node(geo1)
-
-        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
-
-        assert result["status"] == "success"
-        assert len(result["cook_info"]["errors"]) == 4
-        assert all(e["severity"] == "error" for e in result["cook_info"]["errors"])
-        assert all(e["node_path"] == "/obj/geo1" for e in result["cook_info"]["errors"])
-
     def test_get_node_info_combined_with_params(self, mock_connection):
         """Test that include_errors works together with include_params."""
         from houdini_mcp.tools import get_node_info
@@ -211,21 +197,89 @@ class TestGetNodeInfoWithErrors:
         assert "cook_info" in result
         assert len(result["cook_info"]["warnings"]) == 1
 
-    def test_get_node_info_empty_errors_and_warnings(self, mock_connection):
-        """Test node with no errors or warnings returns empty arrays."""
+    def test_get_node_info_with_geo_stats(self, mock_connection):
+        """Test include_geo_stats adds counts and bounding box to cook_info."""
+        from houdini_mcp.tools import get_node_info
+        from tests.conftest import make_geo_node
+
+        make_geo_node(
+            mock_connection,
+            "/obj/geo1/box1",
+            node_type="box",
+            points=[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)],
+            prims=[3],
+            bbox=((0.0, 0.0, 0.0), (1.0, 1.0, 0.0)),
+        )
+
+        result = get_node_info(
+            "/obj/geo1/box1",
+            include_errors=True,
+            force_cook=True,
+            include_geo_stats=True,
+            host="localhost",
+            port=18811,
+        )
+
+        assert result["status"] == "success"
+        assert result["cook_info"]["cook_state"] == "cooked"
+        assert result["cook_info"]["point_count"] == 3
+        assert result["cook_info"]["primitive_count"] == 1
+        assert result["cook_info"]["bounding_box"]["max"] == [1.0, 1.0, 0.0]
+
+    def test_get_node_info_geo_stats_without_geometry(self, mock_connection):
+        """Test geo stats are None for nodes without geometry."""
         from houdini_mcp.tools import get_node_info
 
-        # Create a clean node
         geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
         mock_connection.add_node(geo1)
 
-        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
+        result = get_node_info(
+            "/obj/geo1", include_errors=True, include_geo_stats=True, host="localhost", port=18811
+        )
+
+        assert result["cook_info"]["point_count"] is None
+        assert result["cook_info"]["primitive_count"] is None
+        assert result["cook_info"]["bounding_box"] is None
+
+    def test_get_node_info_geo_stats_intrinsic_failure(self, mock_connection):
+        """Test a failing intrinsic read leaves counts None instead of failing the call."""
+        from houdini_mcp.tools import get_node_info
+        from tests.conftest import MockGeometry, make_geo_node
+
+        make_geo_node(
+            mock_connection,
+            "/obj/geo1/box1",
+            node_type="box",
+            points=[(0.0, 0.0, 0.0), (1.0, 1.0, 0.0)],
+            bbox=((0.0, 0.0, 0.0), (1.0, 1.0, 0.0)),
+        )
+
+        with patch.object(
+            MockGeometry, "intrinsicValue", side_effect=RuntimeError("intrinsic unavailable")
+        ):
+            result = get_node_info(
+                "/obj/geo1/box1",
+                include_errors=True,
+                include_geo_stats=True,
+                host="localhost",
+                port=18811,
+            )
 
         assert result["status"] == "success"
-        assert result["cook_info"]["errors"] == []
-        assert result["cook_info"]["warnings"] == []
-        assert isinstance(result["cook_info"]["errors"], list)
-        assert isinstance(result["cook_info"]["warnings"], list)
+        assert result["cook_info"]["point_count"] is None
+        assert result["cook_info"]["primitive_count"] is None
+        assert result["cook_info"]["bounding_box"]["max"] == [1.0, 1.0, 0.0]
+
+    def test_get_node_info_geo_stats_omitted_by_default(self, mock_connection):
+        """Test cook_info has no geometry stats unless requested."""
+        from houdini_mcp.tools import get_node_info
+
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo")
+        mock_connection.add_node(geo1)
+
+        result = get_node_info("/obj/geo1", include_errors=True, host="localhost", port=18811)
+
+        assert "point_count" not in result["cook_info"]
 
 
 class TestFindErrorNodes:
@@ -380,7 +434,7 @@ class TestFindErrorNodes:
         # Should find the error in sphere1
         assert result["error_count"] >= 0
 
-    def test_find_error_nodes_connection_error(self, reset_connection_state):
+    def test_find_error_nodes_connection_error(self, reset_connection_state, no_retry_delay):
         """Test find_error_nodes handles connection errors."""
         from houdini_mcp.tools import find_error_nodes
 
@@ -1,69 +1,52 @@
 """Tests for the render_viewport function."""
 
+import functools
+
 import pytest
 from unittest.mock import MagicMock, patch, mock_open
 import base64
 import tempfile
 import os
 
+from houdini_mcp.tools import (
+    create_render_node,
+    get_render_settings,
+    list_render_nodes,
+    render_quad_view,
+    render_viewport,
+    set_render_settings,
+)
 from tests.conftest import MockHouNode, MockHouModule, MockGeometry, MockBoundingBox
 
 
-class TestRenderViewportValidation:
-    """Tests for render_viewport input validation."""
-
-    def test_resolution_too_small(self, mock_connection):
-        """Test rejection of resolution smaller than 64x64."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(resolution=[32, 32], host="localhost", port=18811)
-        assert result["status"] == "error"
-        assert "64x64" in result["message"]
-
-    def test_resolution_too_small_width(self, mock_connection):
-        """Test rejection of width smaller than 64."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(resolution=[32, 512], host="localhost", port=18811)
-        assert result["status"] == "error"
-        assert "64x64" in result["message"]
-
-    def test_resolution_too_small_height(self, mock_connection):
-        """Test rejection of height smaller than 64."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(resolution=[512, 32], host="localhost", port=18811)
-        assert result["status"] == "error"
-        assert "64x64" in result["message"]
-
-    def test_resolution_too_large(self, mock_connection):
-        """Test rejection of resolution larger than 4096x4096."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(resolution=[8192, 8192], host="localhost", port=18811)
-        assert result["status"] == "error"
-        assert "4096" in result["message"]
-
-    def test_resolution_too_large_width(self, mock_connection):
-        """Test rejection of width larger than 4096."""
-        from houdini_mcp.tools import render_viewport
+@pytest.fixture
+def render(mock_connection):
+    """render_viewport against the mock connection, without auto-framing."""
+    return functools.partial(render_viewport, host="localhost", port=18811, auto_frame=False)
 
-        result = render_viewport(resolution=[8192, 512], host="localhost", port=18811)
-        assert result["status"] == "error"
-        assert "4096" in result["message"]
 
-    def test_resolution_too_large_height(self, mock_connection):
-        """Test rejection of height larger than 4096."""
-        from houdini_mcp.tools import render_viewport
+class TestRenderViewportValidation:
+    """Tests for render_viewport input validation."""
 
-        result = render_viewport(resolution=[512, 8192], host="localhost", port=18811)
+    @pytest.mark.parametrize(
+        "resolution,expected",
+        [
+            pytest.param([32, 32], "64x64", id="too-small"),
+            pytest.param([32, 512], "64x64", id="too-small-width"),
+            pytest.param([512, 32], "64x64", id="too-small-height"),
+            pytest.param([8192, 8192], "4096", id="too-large"),
+            pytest.param([8192, 512], "4096", id="too-large-width"),
+            pytest.param([512, 8192], "4096", id="too-large-height"),
+        ],
+    )
+    def test_resolution_out_of_range(self, mock_connection, resolution, expected):
+        """Test rejection of resolutions outside 64x64..4096x4096."""
+        result = render_viewport(resolution=resolution, host="localhost", port=18811)
         assert result["status"] == "error"
-        assert "4096" in result["message"]
+        assert expected in result["message"]
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import render_viewport
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = render_viewport(host="localhost", port=18811)
@@ -73,8 +56,6 @@ class TestRenderViewportValidation:
 
     def test_obj_context_not_found(self, mock_connection):
         """Test handling when /obj context is not found."""
-        from houdini_mcp.tools import render_viewport
-
         # Remove /obj from the mock
         mock_connection._nodes.pop("/obj", None)
 
@@ -88,8 +69,6 @@ class TestRenderViewportAutoFrame:
 
     def test_auto_frame_with_empty_scene(self, mock_connection):
         """Test auto_frame with no child nodes uses defaults."""
-        from houdini_mcp.tools import render_viewport
-
         # Empty scene - /obj has no children
         obj_node = mock_connection.node("/obj")
         obj_node._children = []
@@ -101,284 +80,74 @@ class TestRenderViewportAutoFrame:
         # May error at render stage, which is fine for this test
         assert "status" in result
 
-    def test_auto_frame_disabled(self, mock_connection):
-        """Test with auto_frame disabled."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(auto_frame=False, host="localhost", port=18811)
-
-        # Should proceed past auto_frame logic
-        assert "status" in result
-
-
-class TestRenderViewportLookAt:
-    """Tests for render_viewport look_at functionality."""
-
-    def test_look_at_nonexistent_node(self, mock_connection):
-        """Test look_at with a non-existent node path."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            look_at="/obj/nonexistent",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-
-        # Should proceed even if look_at node doesn't exist
-        assert "status" in result
-
-
-class TestRenderViewportCameraSetup:
-    """Tests for render_viewport camera setup."""
-
-    def test_default_camera_rotation(self, mock_connection):
-        """Test default camera rotation is isometric."""
-        from houdini_mcp.tools import render_viewport
-
-        # Just verify it doesn't crash with defaults
-        result = render_viewport(auto_frame=False, host="localhost", port=18811)
-        assert "status" in result
-
-    def test_custom_camera_rotation_front(self, mock_connection):
-        """Test front view camera rotation."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            camera_rotation=[0.0, 0.0, 0.0],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_custom_camera_rotation_top(self, mock_connection):
-        """Test top view camera rotation."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            camera_rotation=[-90.0, 0.0, 0.0],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_orthographic_projection(self, mock_connection):
-        """Test orthographic camera setup."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            orthographic=True,
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_perspective_projection(self, mock_connection):
-        """Test perspective camera setup (default)."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            orthographic=False,
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-
-class TestRenderViewportRenderers:
-    """Tests for different render engines."""
-
-    def test_opengl_renderer_selected(self, mock_connection):
-        """Test OpenGL renderer is accepted."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            renderer="opengl",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        # Should proceed past renderer validation
-        assert "status" in result
-
-    def test_karma_renderer_selected(self, mock_connection):
-        """Test Karma renderer is accepted."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            renderer="karma",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        # Should proceed past renderer validation
-        assert "status" in result
-
-
-class TestRenderViewportOutputFormats:
-    """Tests for different output formats."""
-
-    def test_png_format(self, mock_connection):
-        """Test PNG output format."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            output_format="png",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_jpg_format(self, mock_connection):
-        """Test JPG output format."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            output_format="jpg",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_exr_format(self, mock_connection):
-        """Test EXR output format."""
-        from houdini_mcp.tools import render_viewport
 
-        result = render_viewport(
-            output_format="exr",
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
+class TestRenderViewportArguments:
+    """Tests that valid render_viewport arguments get past validation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({}, id="defaults"),
+            pytest.param({"look_at": "/obj/nonexistent"}, id="look-at-nonexistent"),
+            pytest.param({"camera_rotation": [0.0, 0.0, 0.0]}, id="rotation-front"),
+            pytest.param({"camera_rotation": [-90.0, 0.0, 0.0]}, id="rotation-top"),
+            pytest.param({"orthographic": True}, id="orthographic"),
+            pytest.param({"orthographic": False}, id="perspective"),
+            pytest.param({"renderer": "opengl"}, id="opengl"),
+            pytest.param({"renderer": "karma"}, id="karma"),
+            pytest.param({"output_format": "png"}, id="png"),
+            pytest.param({"output_format": "jpg"}, id="jpg"),
+            pytest.param({"output_format": "exr"}, id="exr"),
+            pytest.param({"resolution": [1920, 1080]}, id="non-square"),
+            pytest.param({"camera_position": [10.0, 5.0, 15.0]}, id="position"),
+            pytest.param({"camera_position": [0.0, 0.0, 0.0]}, id="position-origin"),
+            pytest.param({"camera_position": [-10.0, -5.0, -15.0]}, id="position-negative"),
+        ],
+    )
+    def test_render_viewport_arg_passthrough(self, render, kwargs):
+        """Test each argument is accepted without auto-framing."""
+        assert "status" in render(**kwargs)
 
 
 class TestRenderViewportResolutions:
     """Tests for different resolutions."""
 
-    def test_minimum_valid_resolution(self, mock_connection):
-        """Test minimum valid resolution 64x64."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            resolution=[64, 64],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        # Should pass validation
-        assert result.get("message", "") != "Resolution must be at least 64x64"
-
-    def test_maximum_valid_resolution(self, mock_connection):
-        """Test maximum valid resolution 4096x4096."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            resolution=[4096, 4096],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        # Should pass validation
-        assert "4096" not in result.get("message", "")
-
-    def test_non_square_resolution(self, mock_connection):
-        """Test non-square resolution."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            resolution=[1920, 1080],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_default_resolution_is_512(self, mock_connection):
+    @pytest.mark.parametrize(
+        "resolution",
+        [pytest.param([64, 64], id="minimum"), pytest.param([4096, 4096], id="maximum")],
+    )
+    def test_resolution_bounds_are_valid(self, render, resolution):
+        """Test the minimum and maximum resolutions pass validation."""
+        message = render(resolution=resolution).get("message", "")
+        assert "64x64" not in message
+        assert "4096" not in message
+
+    def test_default_resolution_is_512(self, render):
         """Test default resolution is 512x512."""
-        from houdini_mcp.tools import render_viewport
-
         # With None resolution, should use 512x512
-        result = render_viewport(
-            resolution=None,
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
+        result = render(resolution=None)
         # If successful, resolution should be 512x512
         if result["status"] == "success":
             assert result["resolution"] == [512, 512]
 
 
-class TestRenderViewportCameraPosition:
-    """Tests for custom camera position."""
-
-    def test_custom_camera_position(self, mock_connection):
-        """Test custom camera position."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            camera_position=[10.0, 5.0, 15.0],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_camera_position_origin(self, mock_connection):
-        """Test camera at origin."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            camera_position=[0.0, 0.0, 0.0],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-    def test_negative_camera_position(self, mock_connection):
-        """Test negative camera position."""
-        from houdini_mcp.tools import render_viewport
-
-        result = render_viewport(
-            camera_position=[-10.0, -5.0, -15.0],
-            auto_frame=False,
-            host="localhost",
-            port=18811,
-        )
-        assert "status" in result
-
-
 class TestRenderQuadViewValidation:
     """Tests for render_quad_view input validation."""
 
     def test_resolution_too_small(self, mock_connection):
         """Test rejection of resolution smaller than 64x64."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(resolution=[32, 32], host="localhost", port=18811)
         assert result["status"] == "error"
         assert "64x64" in result["message"]
 
     def test_resolution_too_large(self, mock_connection):
         """Test rejection of resolution larger than 4096x4096."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(resolution=[8192, 8192], host="localhost", port=18811)
         assert result["status"] == "error"
         assert "4096" in result["message"]
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import render_quad_view
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = render_quad_view(host="localhost", port=18811)
@@ -388,8 +157,6 @@ class TestRenderQuadViewValidation:
 
     def test_obj_context_not_found(self, mock_connection):
         """Test handling when /obj context is not found."""
-        from houdini_mcp.tools import render_quad_view
-
         # Remove /obj from the mock
         mock_connection._nodes.pop("/obj", None)
 
@@ -403,8 +170,6 @@ class TestRenderQuadViewConfiguration:
 
     def test_default_renders_4_views(self, mock_connection):
         """Test default configuration returns 4 views."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(host="localhost", port=18811)
         # If it proceeds past validation, check structure
         if result["status"] == "success":
@@ -418,8 +183,6 @@ class TestRenderQuadViewConfiguration:
 
     def test_exclude_perspective_renders_3_views(self, mock_connection):
         """Test include_perspective=False returns only 3 views."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(include_perspective=False, host="localhost", port=18811)
         if result["status"] == "success":
             assert "views" in result
@@ -429,8 +192,6 @@ class TestRenderQuadViewConfiguration:
 
     def test_orthographic_projection(self, mock_connection):
         """Test orthographic projection is applied to ortho views."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(orthographic=True, host="localhost", port=18811)
         if result["status"] == "success":
             for view in result["views"]:
@@ -439,8 +200,6 @@ class TestRenderQuadViewConfiguration:
 
     def test_perspective_view_always_perspective(self, mock_connection):
         """Test perspective view uses perspective projection even with orthographic=True."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(orthographic=True, host="localhost", port=18811)
         if result["status"] == "success":
             for view in result["views"]:
@@ -453,8 +212,6 @@ class TestRenderQuadViewRenderers:
 
     def test_opengl_renderer(self, mock_connection):
         """Test OpenGL renderer is accepted."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(renderer="opengl", host="localhost", port=18811)
         assert "status" in result
         if result["status"] == "success":
@@ -462,8 +219,6 @@ class TestRenderQuadViewRenderers:
 
     def test_karma_renderer(self, mock_connection):
         """Test Karma renderer is accepted."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(renderer="karma", host="localhost", port=18811)
         assert "status" in result
         if result["status"] == "success":
@@ -471,8 +226,6 @@ class TestRenderQuadViewRenderers:
 
     def test_unknown_renderer(self, mock_connection):
         """Test unknown renderer returns error."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(renderer="unknown", host="localhost", port=18811)
         assert result["status"] == "error"
         # The error message might vary depending on where the mock fails,
@@ -485,8 +238,6 @@ class TestRenderQuadViewOutputFormats:
 
     def test_png_format(self, mock_connection):
         """Test PNG output format."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(output_format="png", host="localhost", port=18811)
         assert "status" in result
         if result["status"] == "success":
@@ -496,15 +247,11 @@ class TestRenderQuadViewOutputFormats:
 
     def test_jpg_format(self, mock_connection):
         """Test JPG output format."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(output_format="jpg", host="localhost", port=18811)
         assert "status" in result
 
     def test_exr_format(self, mock_connection):
         """Test EXR output format."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(output_format="exr", host="localhost", port=18811)
         assert "status" in result
 
@@ -514,22 +261,16 @@ class TestRenderQuadViewResolutions:
 
     def test_minimum_valid_resolution(self, mock_connection):
         """Test minimum valid resolution 64x64."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(resolution=[64, 64], host="localhost", port=18811)
         assert result.get("message", "") != "Resolution must be at least 64x64"
 
     def test_maximum_valid_resolution(self, mock_connection):
         """Test maximum valid resolution 4096x4096."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(resolution=[4096, 4096], host="localhost", port=18811)
         assert "4096" not in result.get("message", "")
 
     def test_default_resolution_is_512(self, mock_connection):
         """Test default resolution is 512x512."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(resolution=None, host="localhost", port=18811)
         if result["status"] == "success":
             for view in result["views"]:
@@ -542,8 +283,6 @@ class TestRenderQuadViewTiming:
 
     def test_includes_render_time(self, mock_connection):
         """Test that total_render_time_ms is included in result."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(host="localhost", port=18811)
         if result["status"] == "success":
             assert "total_render_time_ms" in result
@@ -553,10 +292,8 @@ class TestRenderQuadViewTiming:
 class TestListRenderNodes:
     """Tests for list_render_nodes function."""
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import list_render_nodes
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = list_render_nodes(host="localhost", port=18811)
@@ -566,8 +303,6 @@ class TestListRenderNodes:
 
     def test_out_context_not_found(self, mock_connection):
         """Test handling when /out context is not found."""
-        from houdini_mcp.tools import list_render_nodes
-
         # Remove /out from the mock
         mock_connection._nodes.pop("/out", None)
 
@@ -579,10 +314,8 @@ class TestListRenderNodes:
 class TestGetRenderSettings:
     """Tests for get_render_settings function."""
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import get_render_settings
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = get_render_settings("/out/karma1", host="localhost", port=18811)
@@ -592,8 +325,6 @@ class TestGetRenderSettings:
 
     def test_rop_not_found(self, mock_connection):
         """Test handling when ROP is not found."""
-        from houdini_mcp.tools import get_render_settings
-
         result = get_render_settings("/out/nonexistent", host="localhost", port=18811)
         assert result["status"] == "error"
         assert "not found" in result["message"]
@@ -602,10 +333,8 @@ class TestGetRenderSettings:
 class TestSetRenderSettings:
     """Tests for set_render_settings function."""
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import set_render_settings
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = set_render_settings(
@@ -617,8 +346,6 @@ class TestSetRenderSettings:
 
     def test_rop_not_found(self, mock_connection):
         """Test handling when ROP is not found."""
-        from houdini_mcp.tools import set_render_settings
-
         result = set_render_settings(
             "/out/nonexistent", {"samplesperpixel": 64}, host="localhost", port=18811
         )
@@ -629,10 +356,8 @@ class TestSetRenderSettings:
 class TestCreateRenderNode:
     """Tests for create_render_node function."""
 
-    def test_connection_error(self, reset_connection_state):
+    def test_connection_error(self, reset_connection_state, no_retry_delay):
         """Test handling of connection errors."""
-        from houdini_mcp.tools import create_render_node
-
         with patch("houdini_mcp.connection.rpyc") as mock_rpyc:
             mock_rpyc.classic.connect.side_effect = ConnectionError("Connection refused")
             result = create_render_node("karma", host="localhost", port=18811)
@@ -642,8 +367,6 @@ class TestCreateRenderNode:
 
     def test_out_context_not_found(self, mock_connection):
         """Test handling when /out context is not found."""
-        from houdini_mcp.tools import create_render_node
-
         # Remove /out from the mock
         mock_connection._nodes.pop("/out", None)
 
@@ -657,24 +380,18 @@ class TestKarmaEngineParameter:
 
     def test_render_viewport_accepts_karma_engine_cpu(self, mock_connection):
         """Test render_viewport accepts karma_engine='cpu'."""
-        from houdini_mcp.tools import render_viewport
-
         # Should not raise an error
         result = render_viewport(renderer="karma", karma_engine="cpu", host="localhost", port=18811)
         assert "status" in result
 
     def test_render_viewport_accepts_karma_engine_gpu(self, mock_connection):
         """Test render_viewport accepts karma_engine='gpu'."""
-        from houdini_mcp.tools import render_viewport
-
         # Should not raise an error
         result = render_viewport(renderer="karma", karma_engine="gpu", host="localhost", port=18811)
         assert "status" in result
 
     def test_render_quad_view_accepts_karma_engine_cpu(self, mock_connection):
         """Test render_quad_view accepts karma_engine='cpu'."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(
             renderer="karma", karma_engine="cpu", host="localhost", port=18811
         )
@@ -682,8 +399,6 @@ class TestKarmaEngineParameter:
 
     def test_render_quad_view_accepts_karma_engine_gpu(self, mock_connection):
         """Test render_quad_view accepts karma_engine='gpu'."""
-        from houdini_mcp.tools import render_quad_view
-
         result = render_quad_view(
             renderer="karma", karma_engine="gpu", host="localhost", port=18811
         )
@@ -691,8 +406,6 @@ class TestKarmaEngineParameter:
 
     def test_karma_engine_ignored_for_opengl(self, mock_connection):
         """Test karma_engine is ignored when renderer is opengl."""
-        from houdini_mcp.tools import render_viewport
-
         # Should work fine - karma_engine is ignored for opengl
         result = render_viewport(
             renderer="opengl", karma_engine="gpu", host="localhost", port=18811
@@ -701,7 +414,6 @@ class TestKarmaEngineParameter:
 
     def test_karma_engine_default_is_cpu(self, mock_connection):
         """Test karma_engine defaults to 'cpu'."""
-        from houdini_mcp.tools import render_viewport
         import inspect
 
         sig = inspect.signature(render_viewport)
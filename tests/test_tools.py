@@ -48,7 +48,7 @@ class TestGetSceneInfo:
         assert result["node_count"] == 0
         assert result["nodes"] == []
 
-    def test_get_scene_info_connection_error(self, reset_connection_state):
+    def test_get_scene_info_connection_error(self, reset_connection_state, no_retry_delay):
         """Test get_scene_info handles connection errors."""
         from houdini_mcp.tools import get_scene_info
 
@@ -626,12 +626,18 @@ subprocess.call(['cmd'])
         result = _detect_dangerous_code(code)
         assert len(result) >= 2
 
-    def test_pattern_in_comment_still_detected(self):
-        """Test that patterns in comments are still detected (conservative approach)."""
+    def test_pattern_in_comment_not_detected(self):
+        """Test that patterns in comments are ignored (comments never execute)."""
         from houdini_mcp.tools import _detect_dangerous_code
 
-        # We intentionally detect patterns even in comments for safety
         result = _detect_dangerous_code("# hou.exit()")
+        assert result == []
+
+    def test_pattern_in_comment_of_unparsable_code_detected(self):
+        """Test the regex fallback stays conservative when code cannot be parsed."""
+        from houdini_mcp.tools import _detect_dangerous_code
+
+        result = _detect_dangerous_code("# hou.exit()\nif")
         assert len(result) == 1
 
     def test_pattern_in_string_still_detected(self):
@@ -752,6 +758,80 @@ class TestSetParameter:
         assert result["status"] == "success"
 
 
+class TestSetParametersBulk:
+    """Tests for the set_parameters_bulk function."""
+
+    def test_set_parameters_bulk_success(self, mock_connection):
+        """Test setting several parameters in one call."""
+        from houdini_mcp.tools import set_parameters_bulk
+
+        geo1 = MockHouNode(
+            path="/obj/geo1", name="geo1", node_type="geo", params={"tx": 0.0, "ty": 0.0, "tz": 0.0}
+        )
+        mock_connection.add_node(geo1)
+
+        result = set_parameters_bulk("/obj/geo1", {"tx": 1.0, "ty": 2.0})
+
+        assert result["status"] == "success"
+        assert result["node_path"] == "/obj/geo1"
+        assert result["updated"] == [{"name": "tx", "value": 1.0}, {"name": "ty", "value": 2.0}]
+        assert result["failed"] == []
+        assert geo1._params["tx"] == 1.0
+        assert geo1._params["ty"] == 2.0
+
+    def test_set_parameters_bulk_partial(self, mock_connection):
+        """Test that missing parameters are reported without aborting the rest."""
+        from houdini_mcp.tools import set_parameters_bulk
+
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", params={"tx": 0.0})
+        mock_connection.add_node(geo1)
+
+        result = set_parameters_bulk("/obj/geo1", {"nonexistent": 1.0, "tx": 5.0})
+
+        assert result["status"] == "partial"
+        assert result["updated"] == [{"name": "tx", "value": 5.0}]
+        assert result["failed"][0]["name"] == "nonexistent"
+        assert "Parameter not found" in result["failed"][0]["reason"]
+        assert geo1._params["tx"] == 5.0
+
+    def test_set_parameters_bulk_all_failed(self, mock_connection):
+        """Test that status is error when no parameter could be set."""
+        from houdini_mcp.tools import set_parameters_bulk
+
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", params={"tx": 0.0})
+        mock_connection.add_node(geo1)
+
+        result = set_parameters_bulk("/obj/geo1", {"nonexistent": 1.0, "missing": 2.0})
+
+        assert result["status"] == "error"
+        assert result["updated"] == []
+        assert [f["name"] for f in result["failed"]] == ["nonexistent", "missing"]
+        assert geo1._params["tx"] == 0.0
+
+    def test_set_parameters_bulk_uses_undo_disabler(self, mock_connection):
+        """Test that all sets happen inside hou.undos.disabler()."""
+        from houdini_mcp.tools import set_parameters_bulk
+
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", params={"tx": 0.0})
+        mock_connection.add_node(geo1)
+        mock_connection.undos = MagicMock()
+
+        result = set_parameters_bulk("/obj/geo1", {"tx": 3.0})
+
+        assert result["status"] == "success"
+        mock_connection.undos.disabler.assert_called_once()
+        mock_connection.undos.disabler.return_value.__enter__.assert_called_once()
+
+    def test_set_parameters_bulk_node_not_found(self, mock_connection):
+        """Test bulk set on non-existent node."""
+        from houdini_mcp.tools import set_parameters_bulk
+
+        result = set_parameters_bulk("/obj/nonexistent", {"tx": 5.0})
+
+        assert result["status"] == "error"
+        assert "Node not found" in result["message"]
+
+
 class TestGetNodeInfo:
     """Tests for the get_node_info function."""
 
@@ -1470,6 +1550,56 @@ class TestListChildren:
             assert "inputs" not in child
             assert "outputs" not in child
 
+    def test_list_children_by_name_index(self, mock_connection):
+        """Test by_name maps each child name to its position in children."""
+        from houdini_mcp.tools import list_children
+
+        grid = MockHouNode(path="/obj/geo1/grid1", name="grid1", node_type="grid")
+        noise = MockHouNode(path="/obj/geo1/noise1", name="noise1", node_type="noise")
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", children=[grid, noise])
+        mock_connection.add_node(geo1)
+
+        result = list_children("/obj/geo1", host="localhost", port=18811)
+
+        assert result["by_name"] == {"grid1": 0, "noise1": 1}
+        noise_info = result["children"][result["by_name"]["noise1"]]
+        assert noise_info["path"] == "/obj/geo1/noise1"
+
+    def test_list_children_names_filter(self, mock_connection):
+        """Test names filter returns only the requested children."""
+        from houdini_mcp.tools import list_children
+
+        grid = MockHouNode(path="/obj/geo1/grid1", name="grid1", node_type="grid")
+        noise = MockHouNode(path="/obj/geo1/noise1", name="noise1", node_type="noise")
+        noise._inputs = [grid]
+        grid._outputs = [noise]
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", children=[grid, noise])
+        mock_connection.add_node(geo1)
+
+        result = list_children("/obj/geo1", names=["noise1"], host="localhost", port=18811)
+
+        assert result["status"] == "success"
+        assert result["count"] == 1
+        assert result["children"][0]["name"] == "noise1"
+        assert result["children"][0]["inputs"][0]["source_node"] == "/obj/geo1/grid1"
+        assert result["by_name"] == {"noise1": 0}
+
+    def test_list_children_names_filter_recursive(self, mock_connection):
+        """Test names filter still descends into non-matching children."""
+        from houdini_mcp.tools import list_children
+
+        box = MockHouNode(path="/obj/geo1/box1", name="box1", node_type="box")
+        geo1 = MockHouNode(path="/obj/geo1", name="geo1", node_type="geo", children=[box])
+        obj = MockHouNode(path="/obj", name="obj", node_type="obj", children=[geo1])
+        mock_connection.add_node(obj)
+
+        result = list_children(
+            "/obj", recursive=True, names=["box1"], host="localhost", port=18811
+        )
+
+        assert result["count"] == 1
+        assert result["children"][0]["path"] == "/obj/geo1/box1"
+
 
 class TestFindNodes:
     """Tests for find_nodes function (HDMCP-5)."""
@@ -1803,6 +1933,139 @@ class TestGetNodeInfoExtended:
         assert len(result["input_connections"]) == 0
 
 
+class TestGetNodeSnapshot:
+    """Tests for get_node_snapshot (combined info + cook state + geometry)."""
+
+    def _sphere_with_geometry(self, mock_connection):
+        from tests.conftest import make_geo_node
+
+        sphere, _ = make_geo_node(
+            mock_connection,
+            "/obj/geo1/sphere1",
+            node_type="sphere",
+            points=[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)],
+            prims=[4],
+            bbox=((0.0, 0.0, 0.0), (1.0, 1.0, 0.0)),
+        )
+        return sphere
+
+    def test_snapshot_combines_info_cook_and_geometry(self, mock_connection):
+        """Test snapshot returns node info, cook info and geometry stats together."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        self._sphere_with_geometry(mock_connection)
+
+        result = get_node_snapshot("/obj/geo1/sphere1")
+
+        assert result["status"] == "success"
+        assert result["path"] == "/obj/geo1/sphere1"
+        assert result["type"] == "sphere"
+        assert result["cook_info"]["cook_state"] == "cooked"
+        assert result["geometry"]["point_count"] == 4
+        assert result["geometry"]["primitive_count"] == 1
+        assert result["geometry"]["vertex_count"] == 4
+        assert result["geometry"]["bounding_box"]["center"] == [0.5, 0.5, 0.0]
+        assert "parameters" not in result
+        assert "sample_points" not in result["geometry"]
+
+    def test_snapshot_cooks_once(self, mock_connection):
+        """Test the node is cooked exactly once per snapshot."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        sphere = self._sphere_with_geometry(mock_connection)
+        sphere.cook = MagicMock()
+
+        get_node_snapshot("/obj/geo1/sphere1", include_params=True)
+
+        sphere.cook.assert_called_once_with(force=True)
+
+    def test_snapshot_with_params_and_samples(self, mock_connection):
+        """Test optional parameters and sample points."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        self._sphere_with_geometry(mock_connection)
+
+        result = get_node_snapshot("/obj/geo1/sphere1", include_params=True, max_sample_points=2)
+
+        assert result["parameters"] == {"tx": 0.0, "ty": 0.0, "tz": 0.0}
+        assert result["geometry"]["sample_points"] == [
+            {"index": 0, "P": [0.0, 0.0, 0.0]},
+            {"index": 1, "P": [1.0, 0.0, 0.0]},
+        ]
+
+    def test_snapshot_samples_read_in_one_call(self, mock_connection):
+        """Test sample positions come from one bulk read, not one call per point."""
+        from houdini_mcp.tools import get_node_snapshot
+        from tests.conftest import MockGeometry
+
+        self._sphere_with_geometry(mock_connection)
+
+        with patch.object(MockGeometry, "point") as point:
+            result = get_node_snapshot("/obj/geo1/sphere1", max_sample_points=3)
+
+        point.assert_not_called()
+        assert [p["P"] for p in result["geometry"]["sample_points"]] == [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+        ]
+
+    def test_snapshot_sample_points_capped(self, mock_connection):
+        """Test max_sample_points is capped at 10000."""
+        from houdini_mcp.tools import get_node_snapshot
+        from tests.conftest import make_geo_node
+
+        make_geo_node(
+            mock_connection,
+            "/obj/geo1/grid1",
+            node_type="grid",
+            points=[(float(i), 0.0, 0.0) for i in range(10005)],
+        )
+
+        result = get_node_snapshot("/obj/geo1/grid1", max_sample_points=50000)
+
+        samples = result["geometry"]["sample_points"]
+        assert len(samples) == 10000
+        assert samples[-1] == {"index": 9999, "P": [9999.0, 0.0, 0.0]}
+
+    def test_snapshot_input_connections(self, mock_connection):
+        """Test snapshot reports input connections."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        grid = MockHouNode(path="/obj/geo1/grid1", name="grid1", node_type="grid")
+        noise = MockHouNode(path="/obj/geo1/noise1", name="noise1", node_type="noise")
+        noise.setInput(0, grid)
+        mock_connection.add_node(grid)
+        mock_connection.add_node(noise)
+
+        result = get_node_snapshot("/obj/geo1/noise1", include_geo=False)
+
+        assert result["input_connections"] == [
+            {"input_index": 0, "source_node": "/obj/geo1/grid1"}
+        ]
+        assert "geometry" not in result
+
+    def test_snapshot_no_geometry(self, mock_connection):
+        """Test geometry is None for nodes without geometry."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        mock_connection.add_node(MockHouNode(path="/obj/geo1", name="geo1", node_type="geo"))
+
+        result = get_node_snapshot("/obj/geo1")
+
+        assert result["status"] == "success"
+        assert result["geometry"] is None
+
+    def test_snapshot_node_not_found(self, mock_connection):
+        """Test snapshot of a missing node."""
+        from houdini_mcp.tools import get_node_snapshot
+
+        result = get_node_snapshot("/obj/missing")
+
+        assert result["status"] == "error"
+        assert "Node not found" in result["message"]
+
+
 class TestConnectNodes:
     """Tests for connect_nodes function (HDMCP-6)."""
 